@@ -0,0 +1,52 @@
+"""
+애플리케이션 데이터 경로 모듈
+캐시, 설정 등 실행 사이에 유지되는 파일의 저장 위치를 관리합니다.
+"""
+
+import os
+import json
+import tempfile
+
+APP_DIR_NAME = ".smart_learning_helper"
+
+
+def get_app_data_dir():
+    """애플리케이션 데이터 폴더 경로 (SMART_LEARNING_HOME 환경변수로 변경 가능)"""
+    path = os.environ.get("SMART_LEARNING_HOME") or os.path.join(os.path.expanduser("~"), APP_DIR_NAME)
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def get_app_data_path(filename):
+    """애플리케이션 데이터 폴더 안의 파일 경로"""
+    return os.path.join(get_app_data_dir(), filename)
+
+
+def load_json(path, default=None):
+    """JSON 파일 읽기 (없거나 깨져 있으면 default 반환)"""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return default
+
+
+def write_json_atomic(path, data):
+    """
+    JSON 파일을 임시 파일에 쓴 뒤 교체 (중간에 종료되어도 파일이 깨지지 않음)
+    임시 파일은 호출마다 같은 폴더에 새 이름으로 만들어 동시에 저장해도 서로 덮어쓰지 않음
+    """
+    folder = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=folder, prefix=f".{os.path.basename(path)}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
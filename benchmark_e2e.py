@@ -0,0 +1,141 @@
+"""
+로컬 강의 사이트 종단 간(end-to-end) 성능 측정 스크립트
+fixture_site.py의 테스트 사이트를 띄우고 로컬 Chrome으로 KTEduAutoPlayer.play_videos_automatically를
+실행해, 강의마다 실제 재생 시간 외에 엔진이 쓴 시간(플레이어 탐색, 대기, 전환 등)을 보고합니다.
+
+사용법:
+    python benchmark_e2e.py --lectures 5 --duration 3 [--stall 2] [--swap 3] [--missing 4] [--headless]
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import tempfile
+import statistics
+from urllib.parse import urlparse, parse_qs
+from fixture_site import FixtureSite, add_fixture_arguments, config_from_args
+from engine_events import EventChannel, LectureStartedEvent, LectureFinishedEvent
+
+
+def media_seconds(config, lecture):
+    """강의의 실제 재생에 필요한 시간 (멈춤 장애 시간 포함, 플레이어가 없으면 0)"""
+    if lecture in config.missing_lectures:
+        return 0.0
+    seconds = config.duration
+    if lecture in config.stall_lectures:
+        seconds += config.stall_seconds
+    return seconds
+
+
+def fixture_lecture(url):
+    """테스트 사이트 강의 주소의 강의 번호 (lecture=N, 알 수 없으면 None)"""
+    value = parse_qs(urlparse(url or "").query).get("lecture")
+    try:
+        return int(value[0]) if value else None
+    except ValueError:
+        return None
+
+
+def lecture_rows(events, config, finished_at):
+    """
+    강의 시작 이벤트 사이 구간(전환 포함)에서 재생 시간을 뺀 오버헤드 계산
+    (이벤트의 index는 엔진이 학습한 순서이므로, 완료된 강의를 건너뛰어도 맞도록 강의 번호는 주소에서 읽음)
+    """
+    starts = [e for e in events if isinstance(e, LectureStartedEvent)]
+    results = {e.index: e.success for e in events if isinstance(e, LectureFinishedEvent)}
+    rows = []
+    for i, start in enumerate(starts):
+        end = starts[i + 1].at if i + 1 < len(starts) else finished_at
+        span = end - start.at
+        lecture = fixture_lecture(start.url)
+        media = media_seconds(config, lecture) if lecture else 0.0
+        rows.append({
+            "lecture": lecture,
+            "order": start.index,
+            "span": round(span, 3),
+            "media": media,
+            "overhead": round(span - media, 3),
+            "success": results.get(start.index),
+        })
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="로컬 강의 사이트 종단 간 성능 측정")
+    add_fixture_arguments(parser)
+    parser.add_argument("--headless", action="store_true", help="헤드리스 모드로 실행")
+    parser.add_argument("--instrument", action="store_true", help="WebDriver 명령 단계별 계측 보고")
+    parser.add_argument("--no-outline", dest="use_outline", action="store_false",
+                        help="강의 목차 없이 '다음영상' 버튼으로만 이동 (비교용)")
+    parser.add_argument("--trace", default=None, metavar="FILE", help="단계별 시간 기록(Chrome trace-event JSON) 저장 파일")
+    parser.add_argument("--max-overhead", type=float, default=None,
+                        help="강의당 오버헤드 중앙값 기준 (초, 넘으면 종료 코드 1)")
+    parser.add_argument("--output", default=None, help="결과 JSON 저장 파일")
+    args = parser.parse_args()
+
+    # 체크포인트, 강의 목차, 선택자 캐시, Chrome 프로필 등이 실제 사용 데이터와 섞이지 않도록
+    # 실행마다 임시 데이터 폴더를 쓰고 끝나면 삭제
+    with tempfile.TemporaryDirectory(prefix="smart_learning_bench_") as home:
+        os.environ["SMART_LEARNING_HOME"] = home
+        print(f"📁 임시 데이터 폴더: {home}")
+        return run(args)
+
+
+def run(args):
+    """테스트 사이트를 띄워 학습 엔진을 실행하고 강의별 오버헤드 보고 (종료 코드 반환)"""
+    # selenium을 불러오는 엔진 모듈은 데이터 폴더를 정한 뒤에 불러옴
+    from ktedu_auto_player import KTEduAutoPlayer
+
+    config = config_from_args(args)
+    site = FixtureSite(config).start()
+    print(f"🧪 테스트 사이트: {site.url()}")
+
+    channel = EventChannel()
+    player = KTEduAutoPlayer(headless=args.headless, log_queue=channel, instrument=args.instrument or None,
+                             trace_path=args.trace, use_outline=args.use_outline)
+    try:
+        setup_started = time.time()
+        player.setup_driver()
+        player.driver.get(site.url(1))
+        player.video_player.readiness.wait_for_document_ready()
+        setup_time = time.time() - setup_started
+        player.play_videos_automatically(max_videos=config.lectures)
+        finished_at = time.time()
+    finally:
+        player.close()
+        site.stop()
+
+    rows = lecture_rows(channel.drain(), config, finished_at)
+    if not rows:
+        print("❌ 학습한 강의가 없습니다.")
+        return 1
+
+    print("\n📊 강의별 오버헤드 (구간 = 강의 시작 ~ 다음 강의 시작, 전환 포함)")
+    print(f"  {'강의':>4} {'구간':>8} {'재생':>8} {'오버헤드':>8}  결과")
+    for row in rows:
+        result = {True: "완료", False: "중단", None: "-"}[row["success"]]
+        print(f"  {row['lecture'] or '?':>4} {row['span']:>7.2f}s {row['media']:>7.2f}s {row['overhead']:>7.2f}s  {result}")
+
+    overheads = [row["overhead"] for row in rows]
+    median = statistics.median(overheads)
+    print(
+        f"⏱️ 브라우저 준비 {setup_time:.2f}초, 강의당 오버헤드 중앙값 {median:.2f}초 "
+        f"(평균 {statistics.mean(overheads):.2f}초, 최대 {max(overheads):.2f}초), "
+        f"HTTP 요청 {site.requests}회"
+    )
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"setup": round(setup_time, 3), "lectures": rows}, f, ensure_ascii=False, indent=2)
+        print(f"💾 결과 저장: {args.output}")
+
+    if args.max_overhead is not None and median > args.max_overhead:
+        print(f"❌ 오버헤드 중앙값이 기준을 넘었습니다 ({median:.2f}초 > {args.max_overhead:.2f}초)")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,146 @@
+"""
+배포 실행파일 시작 시간 측정 스크립트
+빌드된 실행파일(onefile/onedir)을 직접 실행해 창이 뜰 때까지의 시간을 측정합니다.
+첫 실행(cold)과 이어지는 실행(warm)을 나누어 기록하므로 플랫폼별로 더 빠른 배포 방식을 고를 수 있습니다.
+
+사용법:
+    python build_executable.py --mode onefile
+    python build_executable.py --mode onedir
+    python benchmark_package.py dist/onefile dist/onedir [--runs 5] [--output startup_timings.json]
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+import tempfile
+import subprocess
+import statistics
+from build_executable import APP_NAME
+from ktedu_gui import STARTUP_PROBE_ENV
+
+# 창이 뜨지 않을 때 포기하는 시간 (초)
+LAUNCH_TIMEOUT = 60
+
+
+def find_executable(path):
+    """실행파일 경로 찾기 (dist/<mode> 폴더나 onedir 폴더를 넘겨도 됨)"""
+    if os.path.isfile(path):
+        return path
+    exe_name = f"{APP_NAME}.exe" if os.name == "nt" else APP_NAME
+    candidates = [
+        os.path.join(path, exe_name),
+        os.path.join(path, APP_NAME, exe_name),
+        os.path.join(path, f"{APP_NAME}.app", "Contents", "MacOS", APP_NAME),
+    ]
+    for candidate in candidates:
+        if os.path.isfile(candidate):
+            return candidate
+    raise FileNotFoundError(f"실행파일을 찾을 수 없습니다: {path}")
+
+
+def launch_once(executable):
+    """실행파일을 한 번 실행해 창이 뜰 때까지 걸린 시간(초) 반환"""
+    fd, probe_path = tempfile.mkstemp(prefix="startup_probe_")
+    os.close(fd)
+    os.remove(probe_path)
+    env = dict(os.environ, **{STARTUP_PROBE_ENV: probe_path})
+    started = time.time()
+    process = subprocess.Popen([executable], env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        while not os.path.exists(probe_path):
+            if process.poll() is not None and not os.path.exists(probe_path):
+                raise RuntimeError(f"창이 뜨기 전에 종료되었습니다 (종료 코드 {process.returncode})")
+            if time.time() - started > LAUNCH_TIMEOUT:
+                raise TimeoutError(f"{LAUNCH_TIMEOUT}초 안에 창이 뜨지 않았습니다")
+            time.sleep(0.01)
+        # 기록 중일 수 있으므로 내용이 채워질 때까지 대기
+        while True:
+            with open(probe_path) as f:
+                content = f.read().strip()
+            if content:
+                return float(content) - started
+            time.sleep(0.01)
+    finally:
+        try:
+            process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            process.kill()
+        if os.path.exists(probe_path):
+            os.remove(probe_path)
+
+
+def measure(executable, runs):
+    """첫 실행(cold)과 이후 실행(warm) 시간 측정"""
+    cold = launch_once(executable)
+    warm = [launch_once(executable) for _ in range(max(1, runs))]
+    return {
+        "executable": executable,
+        "size_mb": round(artifact_size(executable) / (1024 * 1024), 1),
+        "cold": round(cold, 3),
+        "warm_median": round(statistics.median(warm), 3),
+        "warm": [round(t, 3) for t in warm],
+    }
+
+
+def artifact_size(executable):
+    """배포 크기 (onedir은 폴더 전체)"""
+    folder = os.path.dirname(executable)
+    if os.path.isdir(os.path.join(folder, "_internal")):
+        return sum(
+            os.path.getsize(os.path.join(root, name))
+            for root, _, files in os.walk(folder) for name in files
+        )
+    return os.path.getsize(executable)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="배포 실행파일 시작 시간 측정")
+    parser.add_argument("artifacts", nargs="*", default=[os.path.join("dist", "onefile"), os.path.join("dist", "onedir")],
+                        help="실행파일 또는 dist/<mode> 폴더")
+    parser.add_argument("--runs", type=int, default=5, help="warm 실행 횟수")
+    parser.add_argument("--output", default="startup_timings.json", help="결과 저장 파일")
+    args = parser.parse_args()
+
+    print("⏱️ 배포 실행파일 시작 시간 측정")
+    print("💡 cold는 이 측정의 첫 실행입니다. 정확한 값을 보려면 재부팅 직후 실행하세요.")
+    results = []
+    for artifact in args.artifacts:
+        try:
+            executable = find_executable(artifact)
+        except FileNotFoundError as e:
+            print(f"⚠️ {e}")
+            continue
+        print(f"▶️ {executable}")
+        try:
+            result = measure(executable, args.runs)
+        except (RuntimeError, TimeoutError) as e:
+            print(f"❌ 측정 실패: {e}")
+            continue
+        result["artifact"] = artifact
+        results.append(result)
+        print(
+            f"  cold {result['cold']:.2f}초, warm 중앙값 {result['warm_median']:.2f}초, "
+            f"크기 {result['size_mb']}MB"
+        )
+
+    if not results:
+        print("❌ 측정할 실행파일이 없습니다. 먼저 build_executable.py로 빌드하세요.")
+        return 1
+
+    fastest = min(results, key=lambda r: r["warm_median"])
+    print(f"🏁 가장 빠른 배포: {fastest['artifact']} (warm {fastest['warm_median']:.2f}초)")
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump({
+            "platform": platform.platform(),
+            "measured_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "results": results,
+        }, f, ensure_ascii=False, indent=2)
+    print(f"💾 결과 저장: {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
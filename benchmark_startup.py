@@ -0,0 +1,111 @@
+"""
+GUI 시작 시간 측정 스크립트
+ktedu_gui를 새 프로세스에서 실행해 모듈별 import 시간(-X importtime)과
+첫 화면 표시까지의 시간을 측정하고, 기준 시간을 넘으면 실패(종료 코드 1)합니다.
+
+사용법:
+    python benchmark_startup.py [--budget 초] [--runs 횟수] [--top 개수]
+"""
+
+import os
+import sys
+import time
+import argparse
+import subprocess
+
+# 첫 화면 표시 기준 시간 (초)
+DEFAULT_BUDGET = 2.0
+
+# 첫 화면 표시 전에 불러오면 안 되는 무거운 모듈
+LAZY_MODULES = ("selenium", "webdriver_manager")
+
+# 자식 프로세스: 창을 만들고 첫 그리기가 끝난 시점을 출력
+FIRST_PAINT_SCRIPT = """
+import sys, time
+import ktedu_gui
+from PyQt5.QtWidgets import QApplication
+app = QApplication(sys.argv)
+window = ktedu_gui.SmartLearningGUI()
+window.show()
+app.processEvents()
+window.repaint()
+print("FIRST_PAINT", time.time())
+print("LOADED", ",".join(m for m in {lazy!r} if m in sys.modules))
+"""
+
+
+def child_env():
+    """화면이 없는 환경(CI 등)에서는 offscreen 플랫폼으로 실행"""
+    env = dict(os.environ)
+    if sys.platform.startswith("linux") and not env.get("DISPLAY") and not env.get("WAYLAND_DISPLAY"):
+        env.setdefault("QT_QPA_PLATFORM", "offscreen")
+    return env
+
+
+def measure_import_times():
+    """python -X importtime 결과를 (모듈, 자체 시간 us, 누적 시간 us) 목록으로 반환"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import ktedu_gui"],
+        capture_output=True, text=True, env=child_env(), cwd=os.path.dirname(os.path.abspath(__file__)),
+    )
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        rows.append((name.strip(), int(self_us), int(cumulative_us)))
+    return rows
+
+
+def measure_first_paint():
+    """프로세스 시작부터 첫 화면 표시까지의 시간(초)과 미리 불러온 무거운 모듈 목록"""
+    started = time.time()
+    result = subprocess.run(
+        [sys.executable, "-c", FIRST_PAINT_SCRIPT.format(lazy=LAZY_MODULES)],
+        capture_output=True, text=True, env=child_env(), cwd=os.path.dirname(os.path.abspath(__file__)),
+    )
+    painted_at, loaded = None, []
+    for line in result.stdout.splitlines():
+        if line.startswith("FIRST_PAINT"):
+            painted_at = float(line.split()[1])
+        elif line.startswith("LOADED"):
+            loaded = [m for m in line[len("LOADED"):].strip().split(",") if m]
+    if painted_at is None:
+        raise RuntimeError(f"GUI 실행 실패:\n{result.stderr}")
+    return painted_at - started, loaded
+
+
+def main():
+    parser = argparse.ArgumentParser(description="GUI 시작 시간 측정")
+    parser.add_argument("--budget", type=float, default=DEFAULT_BUDGET, help="첫 화면 표시 기준 시간 (초)")
+    parser.add_argument("--runs", type=int, default=3, help="첫 화면 표시 측정 횟수 (중앙값 사용)")
+    parser.add_argument("--top", type=int, default=15, help="표시할 import 상위 모듈 수")
+    args = parser.parse_args()
+
+    print("📦 모듈별 import 시간 (누적 기준 상위)")
+    rows = measure_import_times()
+    for name, self_us, cumulative_us in sorted(rows, key=lambda r: r[2], reverse=True)[:args.top]:
+        print(f"  {cumulative_us / 1000:8.1f}ms  (자체 {self_us / 1000:6.1f}ms)  {name}")
+
+    timings = []
+    loaded = []
+    for _ in range(max(1, args.runs)):
+        elapsed, loaded = measure_first_paint()
+        timings.append(elapsed)
+    median = sorted(timings)[len(timings) // 2]
+    print(f"🖥️ 첫 화면 표시: 중앙값 {median:.2f}초 (측정값: {', '.join(f'{t:.2f}' for t in timings)}, 기준 {args.budget:.2f}초)")
+
+    failed = False
+    if loaded:
+        print(f"❌ 첫 화면 표시 전에 불러온 무거운 모듈: {', '.join(loaded)}")
+        failed = True
+    if median > args.budget:
+        print(f"❌ 첫 화면 표시가 기준 시간을 넘었습니다 ({median:.2f}초 > {args.budget:.2f}초)")
+        failed = True
+    if not failed:
+        print("✅ 시작 시간 기준 통과")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,27 +4,37 @@ Chrome 드라이버 설정 및 초기화를 담당합니다.
 """
 
 import os
+import threading
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
-try:
-    from webdriver_manager.chrome import ChromeDriverManager
-    _WDM_AVAILABLE = True
-except ImportError:
-    _WDM_AVAILABLE = False
+from driver_resolver import DriverResolver
+from chrome_profile import (
+    ChromeProfile, profile_dir_from_env, debugger_address_from_env, is_profile_failure,
+)
+
+# 예상하지 못한 알림창 처리 방식 (Chrome 기본값 "dismiss and notify"는 알림창을 취소함)
+UNHANDLED_PROMPT_BEHAVIOR = "accept and notify"
 
 class BrowserManager:
-    def __init__(self, headless=False, log_callback=None):
+    def __init__(self, headless=False, log_callback=None, profile_dir=None, debugger_address=None):
         """
         브라우저 관리자 초기화
         
         Args:
             headless (bool): 브라우저를 숨김 모드로 실행할지 여부
             log_callback (function): 로그 출력 콜백 함수
+            profile_dir (str): 실행 사이에 유지할 Chrome 프로필 폴더 (None이면 SMART_LEARNING_PROFILE 환경변수, 없으면 임시 프로필)
+            debugger_address (str): 실행 중인 Chrome의 디버거 주소 (예: 127.0.0.1:9222, None이면 SMART_LEARNING_DEBUGGER_ADDRESS 환경변수)
         """
         self.driver = None
         self.headless = headless
         self.log_callback = log_callback
+        self.profile_dir = profile_dir or profile_dir_from_env()
+        self.debugger_address = debugger_address or debugger_address_from_env()
+        self.profile = None
+        self.attached = False
+        self._close_lock = threading.Lock()
         
     def log(self, message):
         """로그 출력"""
@@ -37,6 +47,50 @@ class BrowserManager:
         """Chrome 드라이버 설정 및 초기화"""
         self.log("🔧 ChromeDriver 설정 시작...")
         
+        # 실행 중인 Chrome에 연결 (브라우저 실행 생략)
+        if self.debugger_address:
+            driver = self._attach(self.debugger_address)
+            if driver:
+                return driver
+        
+        chrome_options = self._build_options()
+        
+        # 유지되는 프로필 사용 (캐시/로그인 세션 재사용)
+        if self.profile_dir:
+            profile = ChromeProfile(self.profile_dir, log_callback=self.log_callback)
+            if profile.acquire():
+                profile.repair()
+                profile.apply(chrome_options)
+                self.profile = profile
+                self.log(f"🗂️ 저장된 브라우저 프로필 사용: {profile.path}")
+            else:
+                self.log("⚠️ 프로필을 사용할 수 없어 임시 프로필로 실행합니다.")
+        
+        try:
+            return self._launch(chrome_options)
+        except Exception as e:
+            if not self.profile or not is_profile_failure(e):
+                self._release_profile()
+                raise
+            # 프로필 문제로 실행에 실패했을 수 있으므로 새 프로필로 한 번 더 시도
+            self.log("🔁 프로필을 새로 만들어 다시 실행합니다...")
+            self.profile.quarantine()
+            chrome_options = self._build_options()
+            self.profile.apply(chrome_options)
+            try:
+                return self._launch(chrome_options)
+            except Exception:
+                self._release_profile()
+                raise
+    
+    def _release_profile(self):
+        """프로필 잠금 해제"""
+        if self.profile:
+            self.profile.release()
+            self.profile = None
+    
+    def _build_options(self):
+        """Chrome 실행 옵션 구성"""
         chrome_options = Options()
         
         if self.headless:
@@ -49,6 +103,8 @@ class BrowserManager:
         chrome_options.add_argument('--disable-blink-features=AutomationControlled')
         chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
         chrome_options.add_experimental_option('useAutomationExtension', False)
+        # 예상하지 못한 알림창은 닫지(dismiss) 않고 수락 (handle_alerts와 같은 처리, 명령은 오류로 알려줌)
+        chrome_options.set_capability("unhandledPromptBehavior", UNHANDLED_PROMPT_BEHAVIOR)
         
         # User-Agent 설정
         chrome_options.add_argument('--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/140.0.0.0 Safari/537.36')
@@ -58,20 +114,23 @@ class BrowserManager:
             self._setup_chrome_path(chrome_options)
         
         self.log("✅ Chrome 옵션 설정 완료")
-        
-        # 1순위: webdriver-manager로 자동 다운로드/캐시 사용
-        if _WDM_AVAILABLE:
+        return chrome_options
+    
+    def _launch(self, chrome_options):
+        """드라이버로 Chrome 실행 (번들/캐시 드라이버 -> selenium-manager 순)"""
+        # 1순위: 번들/로컬 캐시의 드라이버 (버전이 맞지 않을 때만 webdriver-manager로 다운로드)
+        driver_path = DriverResolver(log_callback=self.log_callback).resolve(
+            chrome_options.binary_location or None
+        )
+        if driver_path:
             try:
-                self.log("🔄 webdriver-manager로 현재 Chrome에 맞는 드라이버 자동 설치 중...")
-                wdm_path = ChromeDriverManager().install()
-                self.log(f"✅ 드라이버 경로: {wdm_path}")
-                service = Service(wdm_path)
+                service = Service(driver_path)
                 self.driver = webdriver.Chrome(service=service, options=chrome_options)
-                self.log("✅ Chrome 브라우저 시작 완료! (webdriver-manager)")
+                self.log("✅ Chrome 브라우저 시작 완료!")
                 self._apply_stealth()
                 return self.driver
-            except Exception as e_wdm:
-                self.log(f"⚠️ webdriver-manager 실패, selenium-manager로 재시도: {str(e_wdm)}")
+            except Exception as e_driver:
+                self.log(f"⚠️ 드라이버 실행 실패, selenium-manager로 재시도: {str(e_driver)}")
 
         # 2순위: Selenium 내장 selenium-manager 폴백
         try:
@@ -84,6 +143,27 @@ class BrowserManager:
             self.log(f"❌ 모든 드라이버 시도 실패: {str(e2)}")
             raise
     
+    def _attach(self, debugger_address):
+        """--remote-debugging-port로 실행 중인 Chrome에 연결 (실패하면 None)"""
+        self.log(f"🔌 실행 중인 Chrome에 연결 중: {debugger_address}")
+        chrome_options = Options()
+        # 이미 실행된 브라우저에는 실행 인자/자동화 옵션을 적용할 수 없으므로 주소만 지정
+        chrome_options.add_experimental_option("debuggerAddress", debugger_address)
+        chrome_options.set_capability("unhandledPromptBehavior", UNHANDLED_PROMPT_BEHAVIOR)
+        driver_path = DriverResolver(log_callback=self.log_callback).resolve()
+        try:
+            if driver_path:
+                self.driver = webdriver.Chrome(service=Service(driver_path), options=chrome_options)
+            else:
+                self.driver = webdriver.Chrome(options=chrome_options)
+        except Exception as e:
+            self.log(f"⚠️ 실행 중인 Chrome에 연결 실패, 새로 실행합니다: {str(e)}")
+            return None
+        self.attached = True
+        self.log("✅ 실행 중인 Chrome에 연결 완료!")
+        self._apply_stealth()
+        return self.driver
+    
     def _setup_chrome_path(self, chrome_options):
         """Wine 환경에서 Chrome 경로 설정"""
         possible_chrome_paths = [
@@ -114,7 +194,21 @@ class BrowserManager:
             pass
 
     def close(self):
-        """드라이버 종료"""
-        if self.driver:
-            self.driver.quit()
-            self.log("✅ 브라우저가 종료되었습니다.")
+        """드라이버 종료 (여러 스레드에서 호출해도 한 번만 종료)"""
+        with self._close_lock:
+            driver, self.driver = self.driver, None
+            profile, self.profile = self.profile, None
+        if driver:
+            try:
+                # quit()은 Chrome과 chromedriver 프로세스를 함께 정리함
+                # (디버거 주소로 연결한 경우 chromedriver만 종료되고 사용자의 Chrome은 유지됨)
+                driver.quit()
+            except Exception as e:
+                self.log(f"⚠️ 브라우저 종료 중 오류: {str(e)}")
+            if self.attached:
+                self.log("✅ Chrome 연결을 해제했습니다.")
+            else:
+                self.log("✅ 브라우저가 종료되었습니다.")
+        if profile:
+            # Chrome이 종료된 뒤 프로필 잠금 해제
+            profile.release()
@@ -0,0 +1,142 @@
+"""
+브라우저 사전 실행 모듈
+GUI 창이 뜨는 동안 백그라운드에서 Chrome을 미리 띄워 두고,
+사용자가 학습을 시작하면 준비된 드라이버를 KTEduAutoPlayer에 넘겨줍니다.
+"""
+
+import os
+import threading
+import time
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+
+# 사전 실행 사용 여부 (환경변수 또는 --prewarm 실행 인자)
+PREWARM_ENV = "SMART_LEARNING_PREWARM"
+PREWARM_FLAG = "--prewarm"
+
+
+def prewarm_requested(argv=None):
+    """사전 실행을 켰는지 확인 (SMART_LEARNING_PREWARM=1 또는 --prewarm)"""
+    if argv and PREWARM_FLAG in argv:
+        return True
+    return os.environ.get(PREWARM_ENV, "").strip().lower() in ("1", "true", "yes", "on")
+
+
+class BrowserPrewarmer:
+    def __init__(self, headless=False, log_callback=None):
+        """
+        브라우저 사전 실행기 초기화
+
+        Args:
+            headless (bool): 브라우저를 숨김 모드로 실행할지 여부
+            log_callback (function): 로그 출력 콜백 함수
+        """
+        self.headless = headless
+        self.log_callback = log_callback
+        self.started_at = None
+        self.ready_at = None
+        self._result = Future()
+        self._lock = threading.Lock()
+        self._claimed = False
+        self._discarded = False
+
+    def log(self, message):
+        """로그 출력"""
+        if self.log_callback:
+            self.log_callback(message)
+        else:
+            print(message)
+
+    @property
+    def launch_time(self):
+        """브라우저 실행에 걸린 시간 (아직 준비 전이면 None)"""
+        if self.ready_at is None:
+            return None
+        return self.ready_at - self.started_at
+
+    def start(self):
+        """백그라운드 스레드에서 브라우저 실행 시작"""
+        self.started_at = time.perf_counter()
+        self.log("🔥 브라우저 사전 실행 시작 (백그라운드)")
+        threading.Thread(target=self._launch, name="browser-prewarm", daemon=True).start()
+        return self
+
+    def _launch(self):
+        """드라이버 전담 스레드를 띄우고 그 스레드에서 브라우저 생성"""
+        try:
+            # selenium은 무거우므로 창이 뜬 뒤 이 스레드에서 불러옴
+            from browser_manager import BrowserManager
+            from driver_actor import DriverActor
+
+            browser_manager = BrowserManager(headless=self.headless, log_callback=self.log_callback)
+            actor = DriverActor(browser_manager.setup_driver, log_callback=self.log_callback)
+            driver = actor.start()
+        except BaseException as e:
+            self.ready_at = time.perf_counter()
+            self.log(f"⚠️ 브라우저 사전 실행 실패 (학습 시작 시 다시 실행합니다): {str(e)}")
+            self._result.set_exception(e)
+            return
+
+        self.ready_at = time.perf_counter()
+        self.log(f"🔥 브라우저 사전 실행 완료 ({self.launch_time:.2f}초)")
+        with self._lock:
+            self._result.set_result((browser_manager, actor, driver))
+            discarded = self._discarded
+        if discarded:
+            # 준비되기 전에 창이 닫힌 경우
+            browser_manager.close()
+
+    def claim(self, cancel_token=None):
+        """
+        준비된 (BrowserManager, DriverActor, driver)를 넘겨받기 (한 번만 가능)
+
+        아직 실행 중이면 끝날 때까지 기다리며, 실패했거나 브라우저가 닫혔으면 None을 반환합니다.
+        """
+        with self._lock:
+            if self._claimed or self._discarded:
+                return None
+            self._claimed = True
+
+        claimed_at = time.perf_counter()
+        while True:
+            if cancel_token and cancel_token.cancelled:
+                # 기다리는 중 중지되면 넘겨받지 않은 브라우저도 정리
+                self._release()
+                cancel_token.raise_if_cancelled()
+            try:
+                browser_manager, actor, driver = self._result.result(timeout=0.1)
+                break
+            except FutureTimeoutError:
+                continue
+            except BaseException:
+                return None
+        waited = time.perf_counter() - claimed_at
+
+        try:
+            # 사용자가 미리 띄운 창을 닫았는지 확인
+            driver.current_url
+        except Exception:
+            self.log("⚠️ 사전 실행한 브라우저가 닫혀 있어 새로 실행합니다.")
+            browser_manager.close()
+            return None
+
+        self.log(
+            f"⏱️ 사전 실행 브라우저 사용: 대기 {waited:.2f}초, "
+            f"절약 {max(0.0, self.launch_time - waited):.2f}초 (실행 {self.launch_time:.2f}초)"
+        )
+        return browser_manager, actor, driver
+
+    def discard(self):
+        """넘겨주지 않은 브라우저 정리 (창을 닫을 때)"""
+        with self._lock:
+            if self._claimed or self._discarded:
+                return
+        self._release()
+
+    def _release(self):
+        """브라우저를 더 이상 넘겨주지 않도록 표시하고, 이미 준비되어 있으면 종료"""
+        with self._lock:
+            self._discarded = True
+            ready = self._result.done() and not self._result.exception()
+        if ready:
+            # 아직 실행 중이면 _launch가 끝난 뒤 직접 정리함
+            self._result.result()[0].close()
@@ -6,9 +6,30 @@ PyInstaller를 사용하여 Python 설치 없이 실행 가능한 파일을 만
 
 import os
 import sys
+import glob
+import argparse
 import subprocess
 import shutil
 
+APP_NAME = "스마트_학습_도우미"
+
+# 빌드 방식
+#   onefile: 단일 실행파일 (실행할 때마다 임시 폴더에 압축을 풀어 시작이 느림)
+#   onedir: 폴더 배포 (압축 해제 없이 바로 시작, 사용하지 않는 모듈 제외)
+BUILD_MODES = ("onefile", "onedir")
+
+# onedir 모드에서 제외하는 모듈 (GUI와 엔진 모듈을 모두 불러온 뒤에도 sys.modules에 없음을 확인한 것만)
+# - 표준 라이브러리: 의존 패키지의 tests 폴더(bs4, certifi, trio)에서만 import 함
+# - IPython: trio가 이미 불러온 경우에만 쓰지만 정적 분석으로는 따라 들어옴
+# - PyQt5: QtCore, QtGui, QtWidgets만 사용
+EXCLUDED_MODULES = [
+    "tkinter", "unittest", "pydoc", "pydoc_data", "lib2to3", "xmlrpc", "test",
+    "IPython",
+    "PyQt5.QtNetwork", "PyQt5.QtQml", "PyQt5.QtQuick", "PyQt5.QtSql", "PyQt5.QtTest",
+    "PyQt5.QtXml", "PyQt5.QtMultimedia", "PyQt5.QtBluetooth", "PyQt5.QtPositioning",
+    "PyQt5.QtSensors", "PyQt5.QtDBus",
+]
+
 def install_pyinstaller():
     """PyInstaller 설치"""
     print("📦 PyInstaller 설치 중...")
@@ -20,18 +41,17 @@ def install_pyinstaller():
         print(f"❌ PyInstaller 설치 실패: {e}")
         return False
 
-def build_executable():
-    """실행파일 빌드"""
-    print("🔨 실행파일 빌드 중...")
-    
-    # PyInstaller 명령어 구성
+def build_command(mode="onefile"):
+    """빌드 방식에 맞는 PyInstaller 명령어 구성"""
     sep = ";" if os.name == "nt" else ":"
     cmd = [
         sys.executable, "-m", "PyInstaller",
-        "--onefile",    # 단일 실행파일로 생성
+        f"--{mode}",    # onefile: 단일 실행파일, onedir: 폴더 배포
         "--windowed",   # 콘솔 창 숨기기 (GUI만 표시)
-        "--name=스마트_학습_도우미",
-        # webdriver-manager 관련 hidden import
+        f"--name={APP_NAME}",
+        f"--distpath={os.path.join('dist', mode)}",
+        f"--workpath={os.path.join('build', mode)}",
+        # webdriver-manager는 드라이버 다운로드가 필요할 때만 불러오므로 명시적으로 포함
         "--hidden-import=webdriver_manager",
         "--hidden-import=webdriver_manager.chrome",
         "--hidden-import=webdriver_manager.core.driver_cache",
@@ -40,28 +60,41 @@ def build_executable():
         "--hidden-import=selenium",
         "--hidden-import=selenium.webdriver.chrome.service",
         "--hidden-import=selenium.webdriver.chrome.options",
-        # 기타
+        # 강의 목차 읽기 (course_index.py)
         "--hidden-import=bs4",
         "--hidden-import=requests",
-        "--collect-all=webdriver_manager",
-        "--noconfirm",
-        "ktedu_gui.py"
     ]
+    if mode == "onedir":
+        # 사용하지 않는 모듈 제외 (webdriver-manager는 순수 Python이라 collect-all 불필요)
+        cmd += [f"--exclude-module={name}" for name in EXCLUDED_MODULES]
+    else:
+        cmd += ["--collect-all=webdriver_manager"]
+    # 번들 드라이버 (chromedriver_<메이저 버전>)가 있으면 함께 포함
+    for driver in glob.glob("chromedriver_*"):
+        if os.path.isfile(driver):
+            cmd.append(f"--add-data={driver}{sep}.")
+    cmd += ["--noconfirm", "ktedu_gui.py"]
+    return cmd
+
+def build_executable(mode="onefile"):
+    """실행파일 빌드"""
+    print(f"🔨 실행파일 빌드 중... ({mode})")
     
     try:
-        subprocess.check_call(cmd)
+        subprocess.check_call(build_command(mode))
         print("✅ 실행파일 빌드 완료!")
         return True
     except subprocess.CalledProcessError as e:
         print(f"❌ 빌드 실패: {e}")
         return False
 
-def create_distribution():
+def create_distribution(mode="onefile"):
     """배포용 폴더 생성"""
     print("📁 배포용 폴더 생성 중...")
     
     # dist 폴더가 있는지 확인
-    if not os.path.exists("dist"):
+    dist_path = os.path.join("dist", mode)
+    if not os.path.exists(dist_path):
         print("❌ dist 폴더를 찾을 수 없습니다. 빌드를 먼저 실행하세요.")
         return False
     
@@ -71,10 +104,13 @@ def create_distribution():
         shutil.rmtree(dist_folder)
     os.makedirs(dist_folder)
     
-    # 실행파일 복사
-    exe_name = "스마트_학습_도우미.exe" if os.name == 'nt' else "스마트_학습_도우미"
-    exe_path = os.path.join("dist", exe_name)
-    if os.path.exists(exe_path):
+    # 실행파일 복사 (onedir은 실행파일과 _internal 폴더를 함께 복사)
+    exe_name = f"{APP_NAME}.exe" if os.name == 'nt' else APP_NAME
+    exe_path = os.path.join(dist_path, exe_name)
+    if mode == "onedir" and os.path.isdir(exe_path):
+        shutil.copytree(exe_path, dist_folder, dirs_exist_ok=True)
+        print(f"✅ 실행 폴더 복사 완료: {exe_name}")
+    elif os.path.isfile(exe_path):
         shutil.copy2(exe_path, dist_folder)
         print(f"✅ 실행파일 복사 완료: {exe_name}")
     else:
@@ -112,6 +148,11 @@ def create_distribution():
 
 def main():
     """메인 함수"""
+    parser = argparse.ArgumentParser(description="스마트 학습 도우미 실행파일 빌더")
+    parser.add_argument("--mode", choices=BUILD_MODES, default="onefile",
+                        help="onefile: 단일 실행파일 (기본), onedir: 빠른 시작용 폴더 배포")
+    args = parser.parse_args()
+    
     print("📚 스마트 학습 도우미 실행파일 빌더")
     print("=" * 50)
     
@@ -120,13 +161,15 @@ def main():
         return False
     
     # 2. 실행파일 빌드
-    if not build_executable():
+    if not build_executable(args.mode):
         return False
     
     # 3. 배포용 폴더 생성
-    if not create_distribution():
+    if not create_distribution(args.mode):
         return False
     
+    print(f"⏱️ 시작 시간 비교: python benchmark_package.py dist/{args.mode}")
+    
     print("\n🎉 빌드 완료!")
     print("📁 '스마트_학습_도우미_v1.0' 폴더를 다른 사람들에게 배포하세요!")
     print("💡 이 폴더 안의 실행파일은 Python 설치 없이도 실행됩니다!")
@@ -0,0 +1,41 @@
+"""
+학습 중지(취소) 모듈
+엔진의 모든 대기를 중지 요청 즉시 깨어나는 대기로 바꾸기 위한 취소 토큰을 제공합니다.
+"""
+
+import threading
+
+
+class LearningCancelled(BaseException):
+    """
+    학습 중지 요청으로 작업을 멈출 때 발생
+
+    KeyboardInterrupt처럼 BaseException을 상속하므로, 엔진 곳곳의
+    `except Exception` 복구 코드에 잡히지 않고 맨 바깥까지 전달됩니다.
+    """
+
+
+class CancellationToken:
+    """여러 스레드에서 공유하는 중지 신호"""
+
+    def __init__(self):
+        self._event = threading.Event()
+
+    @property
+    def cancelled(self):
+        """중지 요청 여부"""
+        return self._event.is_set()
+
+    def cancel(self):
+        """중지 요청 (어느 스레드에서나 호출 가능)"""
+        self._event.set()
+
+    def raise_if_cancelled(self):
+        """중지 요청이 있었으면 LearningCancelled 발생"""
+        if self._event.is_set():
+            raise LearningCancelled()
+
+    def sleep(self, seconds):
+        """중지 요청이 오면 바로 깨어나는 time.sleep (중지 시 LearningCancelled 발생)"""
+        if self._event.wait(max(0.0, seconds)):
+            raise LearningCancelled()
@@ -0,0 +1,201 @@
+"""
+Chrome 프로필 관리 모듈
+실행 사이에 유지되는 Chrome 사용자 데이터 폴더(user-data-dir)를 관리합니다.
+캐시된 정적 파일과 로그인 세션을 다음 실행에서도 사용할 수 있도록 하고,
+동시 사용을 막는 잠금과 비정상 종료/손상된 프로필 복구를 담당합니다.
+"""
+
+import os
+import time
+import shutil
+from app_paths import get_app_data_path, load_json, write_json_atomic
+
+PROFILE_DIR_NAME = "chrome_profile"
+LOCK_FILE_NAME = "smart_learning.lock"
+
+# 환경변수 설정
+#   SMART_LEARNING_PROFILE=1 (기본 폴더 사용) 또는 폴더 경로
+#   SMART_LEARNING_DEBUGGER_ADDRESS=127.0.0.1:9222 (실행 중인 Chrome에 연결)
+PROFILE_ENV = "SMART_LEARNING_PROFILE"
+DEBUGGER_ENV = "SMART_LEARNING_DEBUGGER_ADDRESS"
+
+# 비정상 종료 후 Chrome이 남기는 단일 실행 잠금 파일 (Linux/macOS)
+CHROME_SINGLETON_FILES = ("SingletonLock", "SingletonSocket", "SingletonCookie")
+
+# Chrome 실행 실패 메시지 중 프로필 문제로 보는 문구 (이 경우에만 프로필을 새로 만듦)
+PROFILE_FAILURE_MARKERS = ("user data directory", "devtoolsactiveport", "chrome failed to start", "crashed")
+
+# 손상 여부를 확인하는 JSON 파일 (user-data-dir 기준)
+PROFILE_JSON_FILES = ("Local State", os.path.join("Default", "Preferences"))
+
+
+def default_profile_dir():
+    """기본 프로필 폴더 경로"""
+    return get_app_data_path(PROFILE_DIR_NAME)
+
+
+def profile_dir_from_env():
+    """환경변수로 지정한 프로필 폴더 (지정하지 않았으면 None)"""
+    value = os.environ.get(PROFILE_ENV, "").strip()
+    if not value or value.lower() in ("0", "false", "no", "off"):
+        return None
+    if value.lower() in ("1", "true", "yes", "on"):
+        return default_profile_dir()
+    return os.path.abspath(os.path.expanduser(value))
+
+
+def debugger_address_from_env():
+    """환경변수로 지정한 Chrome 디버거 주소 (지정하지 않았으면 None)"""
+    return os.environ.get(DEBUGGER_ENV, "").strip() or None
+
+
+def is_profile_failure(error):
+    """Chrome 실행 실패가 프로필 문제 때문인지 확인"""
+    message = str(error).lower()
+    return any(marker in message for marker in PROFILE_FAILURE_MARKERS)
+
+
+def _pid_alive(pid):
+    """프로세스가 살아 있는지 확인"""
+    if pid <= 0:
+        return False
+    if os.name == "nt":
+        # Windows에서 os.kill은 프로세스를 종료시키므로 OpenProcess로 확인
+        import ctypes
+        PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+        STILL_ACTIVE = 259
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.OpenProcess(PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
+        if not handle:
+            return False
+        try:
+            code = ctypes.c_ulong()
+            return bool(kernel32.GetExitCodeProcess(handle, ctypes.byref(code))) and code.value == STILL_ACTIVE
+        finally:
+            kernel32.CloseHandle(handle)
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class ChromeProfile:
+    def __init__(self, path=None, log_callback=None):
+        """
+        Chrome 프로필 관리자 초기화
+
+        Args:
+            path (str): user-data-dir 경로 (기본: 애플리케이션 데이터 폴더의 chrome_profile)
+            log_callback (function): 로그 출력 콜백 함수
+        """
+        self.path = path or default_profile_dir()
+        self.log_callback = log_callback
+        self.lock_path = os.path.join(self.path, LOCK_FILE_NAME)
+        self.locked = False
+
+    def log(self, message):
+        """로그 출력"""
+        if self.log_callback:
+            self.log_callback(message)
+        else:
+            print(message)
+
+    def acquire(self):
+        """
+        프로필 잠금 (다른 실행이 사용 중이면 False)
+
+        잠금 파일의 프로세스가 이미 종료되었으면 비정상 종료로 보고 잠금을 가져옵니다.
+        """
+        os.makedirs(self.path, exist_ok=True)
+        for _ in range(2):
+            try:
+                fd = os.open(self.lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            except FileExistsError:
+                owner = self._lock_owner()
+                if owner and _pid_alive(owner):
+                    self.log(f"⚠️ 프로필을 다른 실행(PID {owner})이 사용 중입니다: {self.path}")
+                    return False
+                self.log("🧹 이전 실행이 비정상 종료되어 남은 프로필 잠금을 정리합니다.")
+                self._clear_stale_lock()
+                continue
+            with os.fdopen(fd, "w") as f:
+                f.write(str(os.getpid()))
+            self.locked = True
+            return True
+        return False
+
+    def release(self):
+        """프로필 잠금 해제"""
+        if not self.locked:
+            return
+        self.locked = False
+        try:
+            os.remove(self.lock_path)
+        except OSError:
+            pass
+
+    def _lock_owner(self):
+        try:
+            with open(self.lock_path) as f:
+                return int(f.read().strip() or 0)
+        except (OSError, ValueError):
+            return 0
+
+    def _clear_stale_lock(self):
+        """남은 잠금 파일과 Chrome 단일 실행 잠금 파일 삭제"""
+        for name in (LOCK_FILE_NAME,) + CHROME_SINGLETON_FILES:
+            path = os.path.join(self.path, name)
+            try:
+                if os.path.islink(path) or os.path.isfile(path):
+                    os.remove(path)
+            except OSError:
+                pass
+
+    def repair(self):
+        """
+        프로필 점검 및 복구
+
+        설정 JSON이 깨져 있으면 프로필을 옆으로 옮기고 새로 시작하며,
+        비정상 종료 표시는 정상 종료로 바꿔 "페이지 복원" 안내가 뜨지 않게 합니다.
+        """
+        for name in PROFILE_JSON_FILES:
+            path = os.path.join(self.path, name)
+            if os.path.exists(path) and not isinstance(load_json(path), dict):
+                self.log(f"⚠️ 프로필 파일이 손상되었습니다: {name}")
+                self.quarantine()
+                return
+
+        prefs_path = os.path.join(self.path, "Default", "Preferences")
+        prefs = load_json(prefs_path)
+        if isinstance(prefs, dict):
+            profile = prefs.setdefault("profile", {})
+            if profile.get("exit_type") != "Normal" or profile.get("exited_cleanly") is False:
+                profile["exit_type"] = "Normal"
+                profile["exited_cleanly"] = True
+                try:
+                    write_json_atomic(prefs_path, prefs)
+                except OSError as e:
+                    self.log(f"⚠️ 프로필 종료 상태 복구 실패: {str(e)}")
+
+    def quarantine(self):
+        """손상된 프로필을 <폴더>.corrupt-<시각>으로 옮기고 빈 프로필로 다시 시작"""
+        backup = f"{self.path}.corrupt-{time.strftime('%Y%m%d-%H%M%S')}"
+        try:
+            shutil.move(self.path, backup)
+            self.log(f"🧹 손상된 프로필을 옮겼습니다: {backup}")
+        except OSError as e:
+            self.log(f"⚠️ 프로필 이동 실패, 삭제 후 다시 만듭니다: {str(e)}")
+            shutil.rmtree(self.path, ignore_errors=True)
+        os.makedirs(self.path, exist_ok=True)
+        if self.locked:
+            # 잠금 파일도 함께 옮겨졌으므로 다시 기록
+            with open(self.lock_path, "w") as f:
+                f.write(str(os.getpid()))
+
+    def apply(self, chrome_options):
+        """Chrome 옵션에 프로필 폴더 지정"""
+        chrome_options.add_argument(f"--user-data-dir={self.path}")
+        chrome_options.add_argument("--profile-directory=Default")
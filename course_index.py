@@ -0,0 +1,375 @@
+"""
+강의 목차(코스 인덱스) 모듈
+courseContents 페이지의 강의 목록을 한 번만 읽어(BeautifulSoup) 강의 ID, 제목, 길이, 완료 여부를
+메모리와 디스크에 저장합니다. 엔진은 이 목차로 남은 강의와 예상 소요 시간을 계산하고,
+'다음영상' 버튼을 하나씩 누르는 대신 다음 미완료 강의로 바로 이동할 수 있습니다.
+현재 페이지에 목록이 없으면 브라우저 쿠키를 넣은 requests 세션으로 과정 페이지를 따로 받아 읽습니다.
+"""
+
+import os
+import re
+import time
+from dataclasses import dataclass, field, asdict
+from urllib.parse import urljoin, urlparse, parse_qs
+from bs4 import BeautifulSoup
+from app_paths import get_app_data_path, load_json, write_json_atomic
+from resume_checkpoint import checkpoint_file_name
+
+INDEX_DIR_NAME = "course_index"
+INDEX_VERSION = 1
+
+# 강의 목록 항목 선택자 (우선순위 순, 강의 링크가 있는 항목을 2개 이상 찾은 첫 선택자 사용)
+OUTLINE_ITEM_SELECTORS = [
+    ".lecture-list li",
+    ".curriculum li",
+    ".chapter-list li",
+    ".contents-list li",
+    ".list-contents li",
+    "[class*='lecture'] li",
+    "[class*='curri'] li",
+    "[class*='chapter'] li",
+]
+
+# 항목 안의 제목 선택자 (없으면 링크 또는 항목 전체 텍스트)
+TITLE_SELECTORS = [".title", ".tit", ".subject", ".name", "strong", "a"]
+
+# 강의 ID로 보는 쿼리 파라미터 (classId는 과정 ID이므로 제외)
+LECTURE_ID_PARAMS = ("lecture", "lectureId", "contentsId", "contentId", "itemId", "chapterId", "lessonId", "seq")
+
+# 완료 여부 판단 상태 문구 (항목 안의 텍스트 조각 하나가 공백/괄호를 빼고 정확히 같을 때만 인정,
+# "미완료"처럼 완료 문구를 포함하는 다른 상태와 제목/설명 속 단어는 완료로 보지 않음)
+INCOMPLETE_STATUSES = ("미완료", "미학습", "학습중", "진행중", "미수강")
+COMPLETE_STATUSES = ("학습완료", "수강완료", "완료")
+STATUS_STRIP = re.compile(r"[\s\[\]()<>]")
+COMPLETE_CLASSES = ("complete", "completed", "done", "finish", "finished")
+CURRENT_CLASSES = ("current", "active", "on", "playing")
+
+# 길이 표기 (01:23:45, 12:34, 12분 34초, 12분)
+DURATION_CLOCK = re.compile(r"(?<!\d)(?:(\d{1,2}):)?(\d{1,2}):(\d{2})(?!\d)")
+DURATION_KOREAN = re.compile(r"(\d+)\s*분(?:\s*(\d+)\s*초)?")
+
+# 강의마다 재생 외에 드는 시간 추정값 (초) - 플레이어 준비, 종료 버퍼, 전환
+LECTURE_OVERHEAD_SECONDS = 15.0
+
+# 과정 페이지를 따로 받을 때 최대 대기 시간 (초)
+FETCH_TIMEOUT = 10
+
+
+def parse_duration(text):
+    """텍스트에서 강의 길이(초) 찾기 (없으면 0)"""
+    match = DURATION_CLOCK.search(text or "")
+    if match:
+        hours, minutes, seconds = match.groups()
+        return int(hours or 0) * 3600 + int(minutes) * 60 + int(seconds)
+    match = DURATION_KOREAN.search(text or "")
+    if match:
+        return int(match.group(1)) * 60 + int(match.group(2) or 0)
+    return 0
+
+
+def lecture_id_from_url(url):
+    """강의 주소에서 강의 ID 찾기 (없으면 빈 문자열)"""
+    query = parse_qs(urlparse(url or "").query)
+    for name in LECTURE_ID_PARAMS:
+        if query.get(name):
+            return query[name][0]
+    return ""
+
+
+def format_eta(seconds):
+    """예상 시간 표시 (예: 1시간 23분)"""
+    minutes = int(round(seconds / 60))
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}시간 {minutes}분" if hours else f"{minutes}분"
+
+
+@dataclass
+class Lecture:
+    """목차의 강의 하나"""
+    index: int                      # 목차 순서 (1부터)
+    lecture_id: str = ""            # 주소/onclick에서 찾은 강의 ID
+    title: str = ""
+    url: str = ""                   # 바로 이동할 강의 주소
+    duration: float = 0.0           # 길이 (초, 모르면 0)
+    completed: bool = False
+    current: bool = False           # 목차에 현재 강의로 표시됨
+
+
+@dataclass
+class CourseOutline:
+    """과정의 강의 목차"""
+    course_url: str
+    lectures: list = field(default_factory=list)
+    selector: str = ""
+    built_at: float = 0.0
+    version: int = INDEX_VERSION
+
+    def __len__(self):
+        return len(self.lectures)
+
+    def find(self, url):
+        """주소에 해당하는 강의 (강의 ID가 같거나 주소가 같으면, 없으면 None)"""
+        lecture_id = lecture_id_from_url(url)
+        for lecture in self.lectures:
+            if lecture_id and lecture.lecture_id == lecture_id:
+                return lecture
+            if lecture.url and lecture.url == url:
+                return lecture
+        return None
+
+    def current_lecture(self, url=None):
+        """현재 강의 (주소로 먼저 찾고, 없으면 목차의 현재 표시)"""
+        lecture = self.find(url) if url else None
+        if lecture:
+            return lecture
+        return next((lecture for lecture in self.lectures if lecture.current), None)
+
+    def next_incomplete(self, after=None):
+        """after 다음에 오는 첫 미완료 강의 (after가 None이면 처음부터)"""
+        start = after.index if after else 0
+        return next((lecture for lecture in self.lectures if lecture.index > start and not lecture.completed), None)
+
+    def remaining(self, current=None, limit=None):
+        """current부터(포함) 남은 미완료 강의 목록 (limit개까지)"""
+        start = current.index - 1 if current else 0
+        lectures = [lecture for lecture in self.lectures if lecture.index > start and not lecture.completed]
+        return lectures[:limit] if limit else lectures
+
+    def eta_seconds(self, lectures):
+        """강의 목록의 예상 소요 시간 (길이를 모르는 강의는 아는 강의의 평균 길이로 계산)"""
+        known = [lecture.duration for lecture in self.lectures if lecture.duration]
+        average = sum(known) / len(known) if known else 0.0
+        return sum((lecture.duration or average) + LECTURE_OVERHEAD_SECONDS for lecture in lectures)
+
+
+def parse_outline(html, course_url, page_url=None):
+    """
+    과정 페이지 HTML에서 강의 목차 만들기
+
+    Args:
+        html (str): 페이지 소스
+        course_url (str): 과정 주소 (저장 구분용)
+        page_url (str): HTML을 받은 주소 (상대 링크 해석용, None이면 course_url)
+
+    Returns:
+        CourseOutline: 강의를 2개 이상 찾지 못하면 강의가 빈 목차
+    """
+    soup = BeautifulSoup(html or "", "html.parser")
+    base_url = page_url or course_url
+    outline = CourseOutline(course_url=course_url, built_at=time.time())
+    for selector in OUTLINE_ITEM_SELECTORS:
+        items = []
+        for item in soup.select(selector):
+            link, url = _lecture_link(item, base_url, course_url)
+            if link:
+                items.append((item, link, url))
+        if len(items) < 2:
+            continue
+        outline.selector = selector
+        outline.lectures = [_parse_item(item, link, url, i) for i, (item, link, url) in enumerate(items, 1)]
+        break
+    return outline
+
+
+def is_lecture_url(url, course_url):
+    """과정 콘텐츠(강의) 주소인지 (과정과 같은 사이트에서 과정 페이지와 경로가 같거나 강의 ID가 있는 주소)"""
+    parsed = urlparse(url or "")
+    course = urlparse(course_url or "")
+    if parsed.scheme not in ("http", "https") or parsed.netloc != course.netloc:
+        return False
+    return parsed.path == course.path or bool(lecture_id_from_url(url))
+
+
+def _lecture_link(item, base_url, course_url):
+    """항목 안에서 과정 콘텐츠 주소로 가는 첫 링크와 그 주소 (없으면 None, 빈 문자열)"""
+    for link in item.find_all("a", href=True):
+        href = link["href"].strip()
+        if not href or href.startswith(("javascript:", "#")):
+            continue
+        url = urljoin(base_url, href)
+        if is_lecture_url(url, course_url):
+            return link, url
+    return None, ""
+
+
+def _is_completed(item, link):
+    """항목의 완료 여부 (정확한 상태 문구 또는 완료 클래스, 미완료 상태 문구가 있으면 미완료)"""
+    statuses = {STATUS_STRIP.sub("", text) for text in item.stripped_strings}
+    if statuses & set(INCOMPLETE_STATUSES):
+        return False
+    if statuses & set(COMPLETE_STATUSES):
+        return True
+    class_words = {word.lower() for node in (item, link) for word in node.get("class") or []}
+    return bool(class_words & set(COMPLETE_CLASSES))
+
+
+def _parse_item(item, link, url, index):
+    """목록 항목 하나를 Lecture로 변환"""
+    lecture_id = lecture_id_from_url(url)
+    if not lecture_id:
+        # goLecture('12345') 같은 onclick의 첫 번째 인자
+        onclick = link.get("onclick") or item.get("onclick") or ""
+        match = re.search(r"\(\s*['\"]?([\w-]+)", onclick)
+        lecture_id = match.group(1) if match else ""
+
+    title_node = None
+    for selector in TITLE_SELECTORS:
+        title_node = item.select_one(selector)
+        if title_node and title_node.get_text(strip=True):
+            break
+    title = (title_node or item).get_text(" ", strip=True)
+
+    text = item.get_text(" ", strip=True)
+    class_words = {word.lower() for word in item.get("class") or []}
+    return Lecture(
+        index=index,
+        lecture_id=lecture_id,
+        title=title,
+        url=url,
+        duration=parse_duration(text),
+        completed=_is_completed(item, link),
+        current=any(word in class_words for word in CURRENT_CLASSES),
+    )
+
+
+def session_from_driver(driver):
+    """브라우저 쿠키와 User-Agent를 넣은 requests 세션 (연결 재사용)"""
+    import requests
+
+    session = requests.Session()
+    try:
+        session.headers["User-Agent"] = driver.execute_script("return navigator.userAgent")
+    except Exception:
+        pass
+    for cookie in driver.get_cookies():
+        session.cookies.set(cookie["name"], cookie["value"], domain=cookie.get("domain"), path=cookie.get("path", "/"))
+    return session
+
+
+class CourseIndex:
+    def __init__(self, folder=None, log_callback=None):
+        """
+        강의 목차 관리자 초기화
+
+        Args:
+            folder (str): 목차 저장 폴더 (기본값 사용 시 None)
+            log_callback (function): 로그 출력 콜백 함수
+        """
+        self.folder = folder or get_app_data_path(INDEX_DIR_NAME)
+        self.log_callback = log_callback
+        self.outline = None
+
+    def log(self, message):
+        """로그 출력"""
+        if self.log_callback:
+            self.log_callback(message)
+        else:
+            print(message)
+
+    def path_for(self, course_url):
+        """과정의 목차 파일 경로"""
+        return os.path.join(self.folder, checkpoint_file_name(course_url))
+
+    def build(self, driver, course_url, previous=None):
+        """
+        현재 페이지 소스에서 목차를 만들고, 없으면 과정 페이지를 세션으로 받아서 만듦
+        (둘 다 실패하면 디스크에 저장한 목차 사용)
+
+        Args:
+            driver: Selenium WebDriver 인스턴스
+            course_url (str): 과정 주소
+            previous (CourseOutline): 이전 실행에서 저장한 목차 (이어서 학습할 때, 완료 표시를 이어받음)
+
+        Returns:
+            CourseOutline: 목차를 찾지 못하고 저장한 목차도 없으면 None
+        """
+        started = time.time()
+        page_url = driver.current_url
+        outline = parse_outline(driver.page_source, course_url, page_url)
+        source = "현재 페이지"
+        if not outline.lectures and course_url and course_url != page_url:
+            outline = self._fetch(driver, course_url)
+            source = "과정 페이지"
+        if not outline or not outline.lectures:
+            return self.use_saved(course_url, previous)
+
+        if previous:
+            carried = self._carry_completion(outline, previous)
+            if carried:
+                self.log(f"📚 이전 실행에서 완료한 강의 {carried}개를 목차에 반영했습니다.")
+        self.outline = outline
+        self.save()
+        done = sum(1 for lecture in outline.lectures if lecture.completed)
+        self.log(
+            f"📚 강의 목차 {len(outline)}개 확인 ({source}, {outline.selector}, {time.time() - started:.2f}초): "
+            f"완료 {done}개, 미완료 {len(outline) - done}개"
+        )
+        return outline
+
+    def use_saved(self, course_url, saved=None):
+        """페이지에서 목차를 읽지 못했을 때 디스크에 저장한 목차 사용 (없으면 None)"""
+        saved = saved or self.load(course_url)
+        if not saved or not saved.lectures:
+            self.log("📚 강의 목차를 찾지 못해 '다음영상' 버튼으로 이동합니다.")
+            return None
+        self.outline = saved
+        built = time.strftime("%Y-%m-%d %H:%M", time.localtime(saved.built_at))
+        self.log(f"📚 페이지에서 목차를 읽지 못해 저장된 강의 목차를 사용합니다. ({len(saved)}개, {built} 저장)")
+        return saved
+
+    @staticmethod
+    def _carry_completion(outline, previous):
+        """이전 목차에서 완료한 강의를 새 목차에도 완료로 표시 (표시한 수 반환)"""
+        carried = 0
+        for lecture in previous.lectures:
+            if not lecture.completed:
+                continue
+            match = next(
+                (item for item in outline.lectures
+                 if (lecture.lecture_id and item.lecture_id == lecture.lecture_id)
+                 or (lecture.url and item.url == lecture.url)),
+                None,
+            )
+            if match and not match.completed:
+                match.completed = True
+                carried += 1
+        return carried
+
+    def _fetch(self, driver, course_url):
+        """브라우저 쿠키로 과정 페이지를 따로 받아 목차 만들기 (브라우저 화면은 그대로)"""
+        try:
+            session = session_from_driver(driver)
+            response = session.get(course_url, timeout=FETCH_TIMEOUT)
+            response.raise_for_status()
+        except Exception as e:
+            self.log(f"⚠️ 과정 페이지 받기 실패: {str(e)}")
+            return None
+        return parse_outline(response.text, course_url, response.url)
+
+    def load(self, course_url):
+        """저장된 목차 읽기 (없거나 깨졌으면 None)"""
+        data = load_json(self.path_for(course_url))
+        if not isinstance(data, dict) or data.get("version") != INDEX_VERSION:
+            return None
+        try:
+            lectures = [Lecture(**entry) for entry in data.get("lectures") or []]
+            outline = CourseOutline(**{**data, "lectures": lectures})
+        except TypeError:
+            return None
+        return outline
+
+    def save(self):
+        """목차를 디스크에 저장"""
+        if not self.outline:
+            return
+        try:
+            os.makedirs(self.folder, exist_ok=True)
+            write_json_atomic(self.path_for(self.outline.course_url), asdict(self.outline))
+        except OSError as e:
+            self.log(f"⚠️ 강의 목차 저장 실패: {str(e)}")
+
+    def mark_completed(self, lecture):
+        """강의 학습 완료 기록 (목차 파일도 갱신)"""
+        if lecture and not lecture.completed:
+            lecture.completed = True
+            self.save()
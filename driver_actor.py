@@ -0,0 +1,149 @@
+"""
+드라이버 전담 스레드 모듈
+Selenium WebDriver는 스레드 안전하지 않으므로, 한 스레드만 webdriver.Chrome을 소유하고
+다른 스레드의 명령은 큐로 받아 순서대로 실행한 뒤 Future로 결과를 돌려줍니다.
+"""
+
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from selenium.webdriver.remote.command import Command
+
+# 종료 신호
+_STOP = object()
+
+
+class DriverActor:
+    def __init__(self, factory, log_callback=None, name="driver-actor"):
+        """
+        드라이버 전담 스레드 초기화
+
+        Args:
+            factory (function): 드라이버를 만드는 함수 (전담 스레드에서 호출됨)
+            log_callback (function): 로그 출력 콜백 함수
+            name (str): 스레드 이름
+        """
+        self.factory = factory
+        self.log_callback = log_callback
+        self.name = name
+        self.driver = None
+        self._queue = queue.Queue()
+        self._thread = None
+        self._original_execute = None
+        self._stats_lock = threading.Lock()
+        self._closed = False
+        self.stats = {}  # 명령 이름 -> [횟수, 실행 시간 합계, 큐 대기 시간 합계] (_stats_lock으로 보호)
+
+    def log(self, message):
+        """로그 출력"""
+        if self.log_callback:
+            self.log_callback(message)
+        else:
+            print(message)
+
+    def start(self):
+        """전담 스레드를 띄우고 그 스레드에서 드라이버 생성 (생성된 드라이버 반환)"""
+        ready = Future()
+        self._thread = threading.Thread(target=self._run, args=(ready,), name=self.name, daemon=True)
+        self._thread.start()
+        return ready.result()
+
+    @property
+    def on_owner_thread(self):
+        """현재 스레드가 드라이버 전담 스레드인지"""
+        return threading.current_thread() is self._thread
+
+    def submit(self, fn, *args, label=None, **kwargs):
+        """
+        fn(*args, **kwargs)를 전담 스레드에서 실행하도록 요청하고 Future 반환
+
+        Args:
+            label (str): 통계에 쓸 이름 (기본: 함수 이름)
+        """
+        label = label or getattr(fn, "__name__", "call")
+        future = Future()
+        if self.on_owner_thread or self._closed:
+            # 전담 스레드 안에서의 중첩 호출, 종료 후 호출은 바로 실행
+            self._execute(future, fn, args, kwargs, label, time.perf_counter())
+            return future
+        self._queue.put((future, fn, args, kwargs, label, time.perf_counter()))
+        return future
+
+    def summary(self):
+        """명령 통계 요약 문자열"""
+        with self._stats_lock:
+            entries = [tuple(entry) for entry in self.stats.values()]
+        total = sum(count for count, _, _ in entries)
+        if not total:
+            return "드라이버 명령 없음"
+        exec_time = sum(t for _, t, _ in entries)
+        wait_time = sum(w for _, _, w in entries)
+        return (
+            f"드라이버 명령 {total}회, 평균 실행 {exec_time / total * 1000:.1f}ms, "
+            f"평균 큐 대기 {wait_time / total * 1000:.1f}ms"
+        )
+
+    def _run(self, ready):
+        """전담 스레드 본체: 드라이버 생성 후 큐의 명령을 순서대로 실행"""
+        try:
+            driver = self.factory()
+        except BaseException as e:
+            ready.set_exception(e)
+            return
+        if driver is not None:
+            self.driver = driver
+            self._original_execute = driver.execute
+            # 모든 WebDriver 명령(요소 조작 포함)은 execute를 거치므로 여기서 전담 스레드로 보냄
+            driver.execute = self._routed_execute
+        ready.set_result(driver)
+        if driver is None:
+            return
+
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                break
+            future, fn, args, kwargs, label, enqueued = item
+            self._execute(future, fn, args, kwargs, label, enqueued)
+
+    def _execute(self, future, fn, args, kwargs, label, enqueued):
+        """명령 실행 후 결과/예외를 Future에 기록하고 통계 누적"""
+        if not future.set_running_or_notify_cancel():
+            return
+        started = time.perf_counter()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except BaseException as e:
+            future.set_exception(e)
+        finally:
+            elapsed = time.perf_counter() - started
+            with self._stats_lock:
+                entry = self.stats.setdefault(label, [0, 0.0, 0.0])
+                entry[0] += 1
+                entry[1] += elapsed
+                entry[2] += started - enqueued
+
+    def _routed_execute(self, driver_command, params=None):
+        """driver.execute 대체: 다른 스레드에서 온 명령은 전담 스레드에서 실행"""
+        if driver_command == Command.QUIT:
+            # 종료는 대기 중인 긴 명령(이벤트 대기 등)을 끊어야 하므로 바로 실행
+            return self._shutdown()
+        if self.on_owner_thread or self._closed:
+            return self._original_execute(driver_command, params)
+        return self.submit(self._original_execute, driver_command, params, label=driver_command).result()
+
+    def _shutdown(self):
+        """대기 중인 명령을 취소하고 세션 종료 후 전담 스레드 정지"""
+        self._closed = True
+        try:
+            while True:
+                item = self._queue.get_nowait()
+                if item is not _STOP:
+                    item[0].cancel()
+        except queue.Empty:
+            pass
+        try:
+            return self._original_execute(Command.QUIT, None)
+        finally:
+            self._queue.put(_STOP)
@@ -0,0 +1,143 @@
+"""
+WebDriver 명령 계측 모듈
+모든 WebDriver 명령(execute_script, find_element, is_displayed 등은 모두 driver.execute를 거침)의
+횟수와 소요 시간을 단계(플레이어 탐색, 재생 모니터링, 강의 전환, 알림창 처리 등)별로 모아
+히스토그램으로 보고합니다. 왕복 횟수가 늘어나는 회귀를 숫자로 확인할 수 있습니다.
+"""
+
+import os
+import time
+import threading
+from contextlib import contextmanager
+
+# 단계 이름
+PHASE_SETUP = "setup"
+PHASE_LOGIN = "login"
+PHASE_DISCOVERY = "discovery"
+PHASE_MONITORING = "monitoring"
+PHASE_TRANSITION = "transition"
+PHASE_ALERTS = "alerts"
+PHASE_OTHER = "other"
+
+# 히스토그램 구간 상한 (밀리초, 마지막 구간은 그 이상)
+HISTOGRAM_BOUNDS_MS = (1, 5, 20, 100, 500, 2000)
+
+# 계측 사용 여부 환경변수
+INSTRUMENT_ENV = "SMART_LEARNING_INSTRUMENT"
+
+
+def instrumentation_requested():
+    """환경변수로 계측을 켰는지 확인 (SMART_LEARNING_INSTRUMENT=1)"""
+    return os.environ.get(INSTRUMENT_ENV, "").strip().lower() in ("1", "true", "yes", "on")
+
+
+class CommandStats:
+    """명령 하나의 누적 통계 (구간별 횟수 포함)"""
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.buckets = [0] * (len(HISTOGRAM_BOUNDS_MS) + 1)
+
+    def add(self, seconds):
+        ms = seconds * 1000
+        self.count += 1
+        self.total += ms
+        self.max = max(self.max, ms)
+        for i, bound in enumerate(HISTOGRAM_BOUNDS_MS):
+            if ms <= bound:
+                self.buckets[i] += 1
+                return
+        self.buckets[-1] += 1
+
+
+class DriverInstrumentation:
+    def __init__(self, log_callback=None):
+        """
+        WebDriver 명령 계측기 초기화
+
+        Args:
+            log_callback (function): 로그 출력 콜백 함수
+        """
+        self.log_callback = log_callback
+        self.stats = {}  # (단계, 명령) -> CommandStats
+        self._phase = threading.local()
+        self._lock = threading.Lock()
+
+    def log(self, message):
+        """로그 출력"""
+        if self.log_callback:
+            self.log_callback(message)
+        else:
+            print(message)
+
+    def install(self, driver):
+        """driver.execute를 감싸서 모든 명령을 계측 (드라이버를 다시 만들면 다시 호출)"""
+        original = driver.execute
+
+        def execute(driver_command, params=None):
+            started = time.perf_counter()
+            try:
+                return original(driver_command, params)
+            finally:
+                self.record(self.current_phase, driver_command, time.perf_counter() - started)
+
+        driver.execute = execute
+        return driver
+
+    @property
+    def current_phase(self):
+        """현재 스레드의 단계"""
+        return getattr(self._phase, "name", PHASE_OTHER)
+
+    @contextmanager
+    def phase(self, name):
+        """with 블록 안의 명령을 name 단계로 기록"""
+        previous = self.current_phase
+        self._phase.name = name
+        try:
+            yield
+        finally:
+            self._phase.name = previous
+
+    def record(self, phase, command, seconds):
+        """명령 하나 기록"""
+        with self._lock:
+            stats = self.stats.get((phase, command))
+            if stats is None:
+                stats = self.stats[(phase, command)] = CommandStats()
+            stats.add(seconds)
+
+    def reset(self):
+        """기록 초기화"""
+        with self._lock:
+            self.stats = {}
+
+    def report(self):
+        """단계별/명령별 횟수, 평균/최대 시간, 히스토그램 보고"""
+        with self._lock:
+            items = sorted(self.stats.items())
+        if not items:
+            self.log("📊 WebDriver 명령 기록 없음")
+            return
+
+        labels = [f"≤{b}ms" if b < 1000 else f"≤{b // 1000}s" for b in HISTOGRAM_BOUNDS_MS]
+        labels.append(f">{HISTOGRAM_BOUNDS_MS[-1] // 1000}s")
+        self.log("📊 WebDriver 명령 통계 (단계별)")
+        self.log(f"   히스토그램 구간: {' '.join(labels)}")
+        phases = []
+        for (phase, _), _ in items:
+            if phase not in phases:
+                phases.append(phase)
+        for phase in phases:
+            rows = [(command, stats) for (p, command), stats in items if p == phase]
+            count = sum(stats.count for _, stats in rows)
+            total = sum(stats.total for _, stats in rows)
+            self.log(f"  [{phase}] 명령 {count}회, 합계 {total:.0f}ms")
+            for command, stats in sorted(rows, key=lambda row: row[1].count, reverse=True):
+                histogram = " ".join(str(n) for n in stats.buckets)
+                self.log(
+                    f"    {command:<24} {stats.count:>5}회  평균 {stats.total / stats.count:7.1f}ms  "
+                    f"최대 {stats.max:7.1f}ms  [{histogram}]"
+                )
@@ -0,0 +1,195 @@
+"""
+ChromeDriver 경로 확인 모듈
+설치된 Chrome의 메이저 버전에 맞는 드라이버를 실행파일 번들(sys._MEIPASS)과
+로컬 버전별 캐시에서 먼저 찾고, 맞는 것이 없을 때만 네트워크로 내려받습니다.
+"""
+
+import os
+import re
+import sys
+import glob
+import shutil
+import subprocess
+import time
+import importlib.util
+from app_paths import get_app_data_dir
+
+# webdriver-manager는 네트워크 다운로드가 필요할 때만 불러옴 (시작 시간 단축)
+_WDM_AVAILABLE = importlib.util.find_spec("webdriver_manager") is not None
+
+DRIVER_CACHE_DIR = "drivers"
+DRIVER_FILE_NAME = "chromedriver.exe" if os.name == "nt" else "chromedriver"
+
+# 번들 드라이버 파일 이름 (CI에서 chromedriver_<메이저 버전>으로 추가됨)
+BUNDLED_DRIVER_PATTERN = "chromedriver_*"
+
+# OS별 Chrome 실행파일 기본 위치
+CHROME_BINARIES = {
+    "darwin": [
+        "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
+        os.path.expanduser("~/Applications/Google Chrome.app/Contents/MacOS/Google Chrome"),
+    ],
+    "linux": [
+        "google-chrome", "google-chrome-stable", "chromium", "chromium-browser",
+    ],
+}
+
+_VERSION_RE = re.compile(r"(\d+)\.\d+\.\d+\.\d+")
+
+
+def _major(version):
+    """'140.0.7339.185' -> 140"""
+    match = _VERSION_RE.search(version or "")
+    return int(match.group(1)) if match else None
+
+
+class DriverResolver:
+    def __init__(self, log_callback=None, cache_dir=None):
+        """
+        ChromeDriver 경로 확인기 초기화
+
+        Args:
+            log_callback (function): 로그 출력 콜백 함수
+            cache_dir (str): 버전별 드라이버 캐시 폴더 (기본: 애플리케이션 데이터 폴더)
+        """
+        self.log_callback = log_callback
+        self.cache_dir = cache_dir or os.path.join(get_app_data_dir(), DRIVER_CACHE_DIR)
+
+    def log(self, message):
+        """로그 출력"""
+        if self.log_callback:
+            self.log_callback(message)
+        else:
+            print(message)
+
+    def resolve(self, chrome_binary=None):
+        """
+        드라이버 경로 반환 (번들 -> 로컬 캐시 -> 네트워크 순), 모두 실패하면 None
+
+        Args:
+            chrome_binary (str): Chrome 실행파일 경로 (옵션에 지정된 경우)
+        """
+        started = time.time()
+        major = self.detect_chrome_major(chrome_binary)
+        if major:
+            self.log(f"🔍 설치된 Chrome 메이저 버전: {major}")
+        else:
+            self.log("⚠️ Chrome 버전을 확인하지 못했습니다. 가지고 있는 드라이버를 먼저 사용합니다.")
+
+        for source, finder in (("번들", self._from_bundle), ("로컬 캐시", self._from_cache)):
+            path = finder(major)
+            if path:
+                self.log(f"⏱️ 드라이버 확인 완료 ({source}, {time.time() - started:.2f}초): {path}")
+                return path
+
+        path = self._from_network(major)
+        if path:
+            self.log(f"⏱️ 드라이버 확인 완료 (네트워크, {time.time() - started:.2f}초): {path}")
+        return path
+
+    def detect_chrome_major(self, chrome_binary=None):
+        """설치된 Chrome의 메이저 버전 (확인 불가 시 None)"""
+        if os.name == "nt":
+            return self._detect_windows(chrome_binary)
+        candidates = [chrome_binary] if chrome_binary else []
+        candidates += CHROME_BINARIES.get(sys.platform, CHROME_BINARIES["linux"])
+        for binary in candidates:
+            try:
+                output = subprocess.run(
+                    [binary, "--version"], capture_output=True, text=True, timeout=5
+                ).stdout
+            except (OSError, subprocess.SubprocessError):
+                continue
+            major = _major(output)
+            if major:
+                return major
+        return None
+
+    def _detect_windows(self, chrome_binary=None):
+        """Windows: 레지스트리(BLBeacon) 또는 Chrome 폴더 안의 버전 폴더 이름으로 확인"""
+        try:
+            import winreg
+            for root in (winreg.HKEY_CURRENT_USER, winreg.HKEY_LOCAL_MACHINE):
+                try:
+                    with winreg.OpenKey(root, r"Software\Google\Chrome\BLBeacon") as key:
+                        major = _major(winreg.QueryValueEx(key, "version")[0])
+                        if major:
+                            return major
+                except OSError:
+                    continue
+        except ImportError:
+            pass
+        if chrome_binary:
+            for entry in sorted(os.listdir(os.path.dirname(chrome_binary)), reverse=True):
+                major = _major(entry)
+                if major:
+                    return major
+        return None
+
+    def _bundle_dirs(self):
+        """번들 드라이버를 찾을 폴더 (PyInstaller 압축 해제 폴더, 실행파일/스크립트 폴더)"""
+        dirs = []
+        if getattr(sys, "_MEIPASS", None):
+            dirs.append(sys._MEIPASS)
+        dirs.append(os.path.dirname(os.path.abspath(sys.executable if getattr(sys, "frozen", False) else __file__)))
+        return dirs
+
+    def _from_bundle(self, major):
+        """번들에 포함된 chromedriver_<버전> 중 Chrome과 버전이 맞는 것 (캐시에 복사 후 반환)"""
+        for folder in self._bundle_dirs():
+            for path in glob.glob(os.path.join(folder, BUNDLED_DRIVER_PATTERN)):
+                match = re.search(r"chromedriver_(\d+)", os.path.basename(path))
+                if not match or not os.path.isfile(path):
+                    continue
+                bundled_major = int(match.group(1))
+                if major and bundled_major != major:
+                    self.log(f"⚠️ 번들 드라이버({bundled_major})가 Chrome({major})과 맞지 않습니다.")
+                    continue
+                # Windows는 확장자 없는 파일을 실행할 수 없으므로 캐시에 정식 이름으로 복사해 사용
+                return self._store(path, bundled_major)
+        return None
+
+    def _from_cache(self, major):
+        """로컬 캐시의 버전별 드라이버 (버전을 모르면 가장 높은 버전)"""
+        if major:
+            path = self._cache_path(major)
+            return path if os.path.isfile(path) else None
+        versions = []
+        for folder in glob.glob(os.path.join(self.cache_dir, "*")):
+            name = os.path.basename(folder)
+            if name.isdigit() and os.path.isfile(os.path.join(folder, DRIVER_FILE_NAME)):
+                versions.append(int(name))
+        return self._cache_path(max(versions)) if versions else None
+
+    def _from_network(self, major):
+        """webdriver-manager로 내려받아 캐시에 저장 (캐시에 맞는 버전이 없을 때만)"""
+        if not _WDM_AVAILABLE:
+            return None
+        try:
+            self.log("🔄 맞는 드라이버가 없어 webdriver-manager로 내려받는 중...")
+            from webdriver_manager.chrome import ChromeDriverManager
+            path = ChromeDriverManager().install()
+        except Exception as e:
+            self.log(f"⚠️ webdriver-manager 실패: {str(e)}")
+            return None
+        major = major or _major(path.replace(os.sep, "/"))
+        return self._store(path, major) if major else path
+
+    def _cache_path(self, major):
+        return os.path.join(self.cache_dir, str(major), DRIVER_FILE_NAME)
+
+    def _store(self, source, major):
+        """드라이버를 버전별 캐시에 복사하고 실행 권한 부여 (실패하면 원본 경로 반환)"""
+        target = self._cache_path(major)
+        try:
+            if not os.path.isfile(target) or os.path.getsize(target) != os.path.getsize(source):
+                os.makedirs(os.path.dirname(target), exist_ok=True)
+                tmp_target = f"{target}.tmp"
+                shutil.copy2(source, tmp_target)
+                os.replace(tmp_target, target)
+            if os.name != "nt":
+                os.chmod(target, 0o755)
+            return target
+        except OSError as e:
+            self.log(f"⚠️ 드라이버 캐시 저장 실패: {str(e)}")
+            return source
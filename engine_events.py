@@ -0,0 +1,122 @@
+"""
+엔진-GUI 이벤트 채널 모듈
+학습 엔진(KTEduAutoPlayer/VideoPlayer)이 보내는 로그, 진행률, 강의 시작/완료, 오류를
+문자열 접두어 대신 타입이 있는 이벤트로 GUI에 전달합니다.
+"""
+
+import queue
+import time
+from dataclasses import dataclass, field
+
+
+@dataclass
+class LogEvent:
+    """일반 로그 메시지"""
+    message: str
+    at: float = field(default_factory=time.time)
+
+
+@dataclass
+class ProgressEvent:
+    """현재 강의 재생 진행률"""
+    percent: float
+    current_time: float = 0.0
+    duration: float = 0.0
+    at: float = field(default_factory=time.time)
+
+
+@dataclass
+class StatusEvent:
+    """상태 표시줄 문구"""
+    text: str
+    at: float = field(default_factory=time.time)
+
+
+@dataclass
+class LectureStartedEvent:
+    """강의 학습 시작"""
+    index: int
+    url: str = ""
+    at: float = field(default_factory=time.time)
+
+
+@dataclass
+class LectureFinishedEvent:
+    """강의 학습 종료 (success가 False면 중단됨)"""
+    index: int
+    success: bool
+    elapsed: float = 0.0
+    at: float = field(default_factory=time.time)
+
+
+@dataclass
+class LoginWaitingEvent:
+    """브라우저 준비 완료, 로그인 대기 시작"""
+    url: str = ""
+    at: float = field(default_factory=time.time)
+
+
+@dataclass
+class LoggedInEvent:
+    """로그인 완료 (자동 감지 또는 버튼, 실행마다 한 번)"""
+    url: str = ""
+    method: str = ""
+    waited: float = 0.0
+    at: float = field(default_factory=time.time)
+
+
+@dataclass
+class ErrorEvent:
+    """오류 발생"""
+    message: str
+    detail: str = ""
+    at: float = field(default_factory=time.time)
+
+
+# 한 번에 꺼낼 때 마지막 값만 남기는 이벤트 종류
+COALESCED_EVENTS = (ProgressEvent, StatusEvent)
+
+
+class EventChannel:
+    """스레드 안전한 이벤트 큐 (문자열을 넣으면 LogEvent로 변환)"""
+
+    def __init__(self):
+        self._queue = queue.Queue()
+        self.coalesced = 0
+
+    def put(self, event):
+        """이벤트 추가 (기존 로그 큐처럼 문자열도 허용)"""
+        if isinstance(event, str):
+            event = LogEvent(event)
+        self._queue.put(event)
+
+    def log(self, message):
+        """로그 이벤트 추가"""
+        self.put(LogEvent(message))
+
+    def drain(self):
+        """
+        쌓인 이벤트를 모두 꺼내기
+
+        진행률/상태 이벤트는 종류별로 마지막 것만 남기고, 나머지는 들어온 순서를 유지합니다.
+        """
+        events = []
+        try:
+            while True:
+                events.append(self._queue.get_nowait())
+        except queue.Empty:
+            pass
+
+        latest = {}
+        for i, event in enumerate(events):
+            if isinstance(event, COALESCED_EVENTS):
+                latest[type(event)] = i
+        if not latest:
+            return events
+
+        kept = [
+            event for i, event in enumerate(events)
+            if not isinstance(event, COALESCED_EVENTS) or latest[type(event)] == i
+        ]
+        self.coalesced += len(events) - len(kept)
+        return kept
@@ -0,0 +1,295 @@
+"""
+로컬 테스트용 강의 사이트 모듈
+실제 KT EDU 사이트 없이 학습 엔진을 실행해 볼 수 있도록 courseContents.do 형태의 페이지를
+로컬 HTTP 서버로 제공합니다. Video.js 구조의 #myvideo 플레이어, 짧은 합성 음성 미디어(WAV),
+.btn-next-page 다음 강의 링크, 강의 목차(완료 표시 포함), 알림창과 각종 장애 상황
+(느린 로딩, 재생 멈춤, video 노드 교체, 플레이어 없음)을 설정할 수 있습니다.
+
+사용법:
+    python fixture_site.py --lectures 5 --duration 3 --stall 2 --swap 3 --missing 4
+"""
+
+import io
+import sys
+import json
+import time
+import wave
+import argparse
+import threading
+from dataclasses import dataclass, field, asdict
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs
+
+COURSE_PATH = "/education/courseContents.do"
+MEDIA_PATH = "/media/lecture.wav"
+
+# 합성 미디어 형식 (8kHz 8bit 모노 무음 - 1초에 약 8KB)
+SAMPLE_RATE = 8000
+
+
+@dataclass
+class FixtureConfig:
+    """테스트 사이트 구성 (강의 번호는 1부터)"""
+    lectures: int = 5                   # 강의 수 (마지막 강의에는 다음 버튼 없음)
+    duration: float = 3.0               # 강의 미디어 길이 (초)
+    slow_load: float = 0.0              # 페이지 응답 지연 (초)
+    stall_lectures: list = field(default_factory=list)    # 재생 중간에 멈추는 강의
+    stall_seconds: float = 3.0          # 멈춰 있는 시간 (초)
+    swap_lectures: list = field(default_factory=list)     # 재생 중간에 video 노드를 교체하는 강의
+    missing_lectures: list = field(default_factory=list)  # 플레이어가 없는 강의
+    alert_lectures: list = field(default_factory=list)    # 페이지 로딩 시 알림창을 띄우는 강의
+    completed_lectures: list = field(default_factory=list)  # 목차에 학습완료로 표시할 강의
+
+
+PAGE_TEMPLATE = """<!DOCTYPE html>
+<html lang="ko">
+<head><meta charset="utf-8"><title>테스트 강의 {index}/{total}</title></head>
+<body>
+<h1>테스트 강의 {index}</h1>
+{player}
+{next_button}
+{outline}
+<script>
+var CONFIG = {config};
+{alert}
+// Video.js 최소 대체 구현 (videojs('myvideo').play() 경로용)
+window.videojs = function (id) {{
+    var v = document.querySelector('#' + id + ' video');
+    return v ? {{ play: function () {{ return v.play(); }}, pause: function () {{ v.pause(); }} }} : null;
+}};
+(function () {{
+    var stalled = false, swapped = false;
+    function watch(v) {{
+        v.addEventListener('timeupdate', function () {{
+            var half = v.duration ? v.duration / 2 : 0;
+            if (CONFIG.stall && !stalled && half && v.currentTime >= half) {{
+                // 버퍼링 흉내: 재생 중(paused=false)인데 일정 시간 동안 currentTime이 멈춰 있음
+                stalled = true;
+                var point = v.currentTime, until = Date.now() + CONFIG.stallSeconds * 1000;
+                v.dispatchEvent(new Event('waiting'));
+                var timer = setInterval(function () {{
+                    if (Date.now() >= until) {{ clearInterval(timer); return; }}
+                    if (v.currentTime > point + 0.05) {{ v.currentTime = point; }}
+                }}, 100);
+            }}
+            if (CONFIG.swap && !swapped && half && v.currentTime >= half * 0.5) {{
+                // 플레이어가 video 노드를 새로 만드는 상황 흉내
+                swapped = true;
+                var position = v.currentTime;
+                var clone = v.cloneNode(true);
+                clone.addEventListener('loadedmetadata', function () {{
+                    clone.currentTime = position;
+                    clone.play();
+                }}, {{ once: true }});
+                v.parentNode.replaceChild(clone, v);
+                watch(clone);
+            }}
+        }});
+    }}
+    var v = document.querySelector('#myvideo video');
+    if (v) {{ watch(v); }}
+}})();
+</script>
+</body>
+</html>
+"""
+
+PLAYER_HTML = """<div id="myvideo" class="video-js">
+  <video class="vjs-tech" src="{media}" muted playsinline preload="auto"></video>
+  <button class="vjs-big-play-button" type="button">재생</button>
+</div>"""
+
+NEXT_BUTTON_HTML = '<a class="btn-next-page" href="{href}">다음영상</a>'
+
+OUTLINE_ITEM_HTML = """<li class="{classes}"><a href="{href}"><span class="title">테스트 강의 {index}</span>
+  <span class="time">{duration}</span> <span class="status">{status}</span></a></li>"""
+
+
+def make_silence_wav(seconds):
+    """지정한 길이의 무음 WAV 바이트"""
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(1)
+        wav.setframerate(SAMPLE_RATE)
+        wav.writeframes(b"\x80" * int(SAMPLE_RATE * seconds))
+    return buffer.getvalue()
+
+
+class FixtureSite:
+    def __init__(self, config=None, host="127.0.0.1", port=0):
+        """
+        로컬 테스트 사이트 초기화
+
+        Args:
+            config (FixtureConfig): 사이트 구성 (기본값 사용 시 None)
+            host (str): 바인딩 주소
+            port (int): 포트 (0이면 빈 포트 자동 선택)
+        """
+        self.config = config or FixtureConfig()
+        self.host = host
+        self.port = port
+        self.requests = 0
+        self._server = None
+        self._thread = None
+        self._media = {}
+
+    def start(self):
+        """백그라운드 스레드에서 서버 시작"""
+        site = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                site.requests += 1
+                site.handle(self)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer((self.host, self.port), Handler)
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, name="fixture-site", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """서버 종료"""
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def url(self, lecture=1):
+        """강의 페이지 주소"""
+        return f"http://{self.host}:{self.port}{COURSE_PATH}?classId=fixture&lecture={lecture}"
+
+    def handle(self, request):
+        """요청 처리"""
+        parsed = urlparse(request.path)
+        query = parse_qs(parsed.query)
+        if parsed.path == COURSE_PATH:
+            lecture = int((query.get("lecture") or ["1"])[0])
+            if self.config.slow_load:
+                time.sleep(self.config.slow_load)
+            self._send(request, 200, "text/html; charset=utf-8", self.render(lecture).encode("utf-8"))
+        elif parsed.path == MEDIA_PATH:
+            self._send_media(request, float((query.get("seconds") or [self.config.duration])[0]))
+        else:
+            self._send(request, 404, "text/plain; charset=utf-8", b"not found")
+
+    def render(self, lecture):
+        """강의 페이지 HTML"""
+        config = self.config
+        player = "" if lecture in config.missing_lectures else PLAYER_HTML.format(
+            media=f"{MEDIA_PATH}?seconds={config.duration}"
+        )
+        next_button = NEXT_BUTTON_HTML.format(
+            href=f"{COURSE_PATH}?classId=fixture&lecture={lecture + 1}"
+        ) if lecture < config.lectures else ""
+        page_config = {
+            "stall": lecture in config.stall_lectures,
+            "stallSeconds": config.stall_seconds,
+            "swap": lecture in config.swap_lectures,
+        }
+        alert = f"alert('강의 {lecture} 안내');" if lecture in config.alert_lectures else ""
+        return PAGE_TEMPLATE.format(
+            index=lecture, total=config.lectures, player=player, next_button=next_button,
+            outline=self.render_outline(lecture), config=json.dumps(page_config), alert=alert,
+        )
+
+    def render_outline(self, current):
+        """강의 목차 HTML (현재 강의와 학습완료 표시)"""
+        config = self.config
+        minutes, seconds = divmod(int(config.duration), 60)
+        items = []
+        for lecture in range(1, config.lectures + 1):
+            completed = lecture in config.completed_lectures
+            classes = " ".join(c for c in ("item", "complete" if completed else "", "current" if lecture == current else "") if c)
+            items.append(OUTLINE_ITEM_HTML.format(
+                classes=classes, href=f"{COURSE_PATH}?classId=fixture&lecture={lecture}", index=lecture,
+                duration=f"{minutes:02d}:{seconds:02d}", status="학습완료" if completed else "미완료",
+            ))
+        return '<ul class="lecture-list">\n' + "\n".join(items) + "\n</ul>"
+
+    def _send_media(self, request, seconds):
+        """합성 미디어 전송 (탐색을 위해 Range 요청 지원)"""
+        data = self._media.get(seconds)
+        if data is None:
+            data = self._media[seconds] = make_silence_wav(seconds)
+        range_header = request.headers.get("Range")
+        if range_header and range_header.startswith("bytes="):
+            start_text, _, end_text = range_header[len("bytes="):].partition("-")
+            start = int(start_text or 0)
+            end = int(end_text) if end_text else len(data) - 1
+            chunk = data[start:end + 1]
+            request.send_response(206)
+            request.send_header("Content-Range", f"bytes {start}-{start + len(chunk) - 1}/{len(data)}")
+            self._finish(request, "audio/wav", chunk)
+        else:
+            request.send_response(200)
+            self._finish(request, "audio/wav", data)
+
+    def _send(self, request, status, content_type, body):
+        request.send_response(status)
+        self._finish(request, content_type, body)
+
+    def _finish(self, request, content_type, body):
+        request.send_header("Content-Type", content_type)
+        request.send_header("Content-Length", str(len(body)))
+        request.send_header("Accept-Ranges", "bytes")
+        request.end_headers()
+        request.wfile.write(body)
+
+
+def _lecture_list(text):
+    return [int(n) for n in text.split(",") if n.strip()] if text else []
+
+
+def add_fixture_arguments(parser):
+    """테스트 사이트 구성 인자 추가 (fixture_site.py, benchmark_e2e.py 공용)"""
+    parser.add_argument("--lectures", type=int, default=5, help="강의 수")
+    parser.add_argument("--duration", type=float, default=3.0, help="강의 미디어 길이 (초)")
+    parser.add_argument("--slow-load", type=float, default=0.0, help="페이지 응답 지연 (초)")
+    parser.add_argument("--stall", type=_lecture_list, default=[], help="재생 중 멈추는 강의 번호 (예: 2,4)")
+    parser.add_argument("--stall-seconds", type=float, default=3.0, help="멈춰 있는 시간 (초)")
+    parser.add_argument("--swap", type=_lecture_list, default=[], help="video 노드를 교체하는 강의 번호")
+    parser.add_argument("--missing", type=_lecture_list, default=[], help="플레이어가 없는 강의 번호")
+    parser.add_argument("--alert", type=_lecture_list, default=[], help="알림창을 띄우는 강의 번호")
+    parser.add_argument("--completed", type=_lecture_list, default=[], help="목차에 학습완료로 표시할 강의 번호")
+
+
+def config_from_args(args):
+    """명령행 인자로 FixtureConfig 생성"""
+    return FixtureConfig(
+        lectures=args.lectures,
+        duration=args.duration,
+        slow_load=args.slow_load,
+        stall_lectures=args.stall,
+        stall_seconds=args.stall_seconds,
+        swap_lectures=args.swap,
+        missing_lectures=args.missing,
+        alert_lectures=args.alert,
+        completed_lectures=args.completed,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="로컬 테스트용 강의 사이트")
+    parser.add_argument("--port", type=int, default=8765, help="포트")
+    add_fixture_arguments(parser)
+    args = parser.parse_args()
+
+    site = FixtureSite(config_from_args(args), port=args.port).start()
+    print(f"🧪 테스트 사이트 실행 중: {site.url()}")
+    print(f"⚙️ 구성: {json.dumps(asdict(site.config), ensure_ascii=False)}")
+    print("⏹️ 종료하려면 Ctrl+C")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        site.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,27 +6,74 @@ KT EDU 자동재생 스크립트
 import time
 import sys
 import os
+import traceback
+from contextlib import ExitStack
 from browser_manager import BrowserManager
 from video_player import VideoPlayer
+from engine_events import LectureStartedEvent, LectureFinishedEvent, ErrorEvent, ProgressEvent
+from cancellation import CancellationToken, LearningCancelled
+from driver_actor import DriverActor
+from chrome_profile import default_profile_dir
+from login_detector import LoginDetector
+from resource_governor import ResourceGovernor, GovernorPolicy
+from driver_instrumentation import (
+    DriverInstrumentation, instrumentation_requested,
+    PHASE_LOGIN, PHASE_DISCOVERY, PHASE_MONITORING, PHASE_TRANSITION, PHASE_ALERTS,
+)
+from phase_trace import PhaseTracer, trace_path_from_env, default_trace_path, CAT_SETUP, CAT_NAVIGATION, CAT_LECTURE
+from resume_checkpoint import ResumeCheckpoint
+from course_index import CourseIndex, format_eta
 
 class KTEduAutoPlayer:
-    def __init__(self, headless=False, log_queue=None):
+    def __init__(self, headless=False, log_queue=None, poll_policy=None, cancel_token=None, prewarmer=None,
+                 profile_dir=None, debugger_address=None, governor_policy=None, instrument=None, trace_path=None,
+                 use_outline=True):
         """
         스마트 학습 도우미 초기화
         
         Args:
             headless (bool): 브라우저를 숨김 모드로 실행할지 여부
-            log_queue: GUI로 로그를 전달할 큐
+            log_queue: GUI로 로그/이벤트를 전달할 큐 (EventChannel 권장)
+            poll_policy (PollPolicy): 재생 모니터링 주기 정책 (기본값 사용 시 None)
+            cancel_token (CancellationToken): 중지 신호 (없으면 새로 생성, stop()으로 중지)
+            prewarmer (BrowserPrewarmer): 미리 띄워 둔 브라우저 (있으면 새로 실행하지 않고 넘겨받음)
+            profile_dir (str): 실행 사이에 유지할 Chrome 프로필 폴더 (캐시/로그인 세션 재사용)
+            debugger_address (str): 실행 중인 Chrome의 디버거 주소 (예: 127.0.0.1:9222)
+            governor_policy (GovernorPolicy): 브라우저 재시작 기준 (메모리/CPU, psutil 필요)
+            instrument (bool): WebDriver 명령 계측 여부 (None이면 SMART_LEARNING_INSTRUMENT 환경변수)
+            trace_path (str): 단계별 시간 기록(Chrome trace-event JSON) 저장 파일 (None이면 SMART_LEARNING_TRACE 환경변수)
+            use_outline (bool): 강의 목차를 읽어 예상 시간 표시 및 다음 미완료 강의로 바로 이동
         """
         self.headless = headless
-        self.log_queue = log_queue  # GUI로 로그 전달용 큐
+        self.poll_policy = poll_policy
+        self.cancel_token = cancel_token or CancellationToken()
+        self.prewarmer = prewarmer
+        self.log_queue = log_queue  # GUI로 로그/이벤트 전달용 큐
         self.video_count = 0
         self.max_videos = 100  # 최대 학습할 강의 수 (무한루프 방지)
         
         # 브라우저 관리자 초기화
-        self.browser_manager = BrowserManager(headless=headless, log_callback=self.log_print)
+        self.browser_manager = BrowserManager(
+            headless=headless,
+            log_callback=self.log_print,
+            profile_dir=profile_dir,
+            debugger_address=debugger_address,
+        )
         self.driver = None
+        self.driver_actor = None
         self.video_player = None
+        self.login_detector = None
+        self.resource_governor = ResourceGovernor(governor_policy, log_callback=self.log_print)
+        if instrument is None:
+            instrument = instrumentation_requested()
+        self.instrumentation = DriverInstrumentation(log_callback=self.log_print) if instrument else None
+        self.tracer = PhaseTracer(trace_path or trace_path_from_env(), log_callback=self.log_print)
+        self.checkpoint = ResumeCheckpoint(log_callback=self.log_print)
+        self.course_url = None  # 사용자가 입력한 과정 주소 (체크포인트 구분용)
+        self.resume_point = None  # 이어서 학습할 체크포인트
+        self.course_index = CourseIndex(log_callback=self.log_print) if use_outline else None
+        self.current_lecture = None  # 목차에서 찾은 현재 강의
+        self._advanced_by_click = False  # 마지막 전환을 '다음영상' 버튼으로 했는지
         
     def log_print(self, message):
         """로그 출력 함수 - GUI와 터미널 모두에 출력"""
@@ -61,19 +108,258 @@ class KTEduAutoPlayer:
         except:
             # 모든 출력 실패 시 기본 메시지
             print("로그 메시지 출력됨", flush=True)
+    
+    def emit(self, event):
+        """GUI로 이벤트 전달 (진행률, 강의 시작/완료, 오류 등)"""
+        if isinstance(event, ProgressEvent):
+            # 재생 위치는 일정 간격마다만 파일에 저장됨
+            self.checkpoint.update_position(event.current_time, event.duration)
+        if self.log_queue:
+            try:
+                self.log_queue.put(event)
+            except:
+                pass
         
     def setup_driver(self):
-        """Chrome 드라이버 설정 및 초기화"""
-        self.driver = self.browser_manager.setup_driver()
+        """Chrome 드라이버 설정 및 초기화 (드라이버는 전담 스레드가 소유)"""
+        started = time.perf_counter()
+        with self.tracer.span("드라이버 준비", CAT_SETUP, prewarmed=bool(self.prewarmer)):
+            handoff = self.prewarmer.claim(self.cancel_token) if self.prewarmer else None
+            if handoff:
+                # 사전 실행된 브라우저 사용 (드라이버는 이미 전담 스레드가 소유)
+                self.browser_manager, self.driver_actor, self.driver = handoff
+                self.browser_manager.log_callback = self.log_print
+                self.driver_actor.log_callback = self.log_print
+            else:
+                # 모든 WebDriver 명령은 전담 스레드에서 순서대로 실행됨 (GUI/엔진 스레드 동시 접근 방지)
+                self.driver_actor = DriverActor(self.browser_manager.setup_driver, log_callback=self.log_print)
+                self.driver = self.driver_actor.start()
+        self.log_print(f"⏱️ 브라우저 준비까지 {time.perf_counter() - started:.2f}초")
+        if self.driver and self.instrumentation:
+            # 전담 스레드 대기 시간까지 포함해 엔진이 체감하는 시간을 기록
+            self.instrumentation.install(self.driver)
+        if self.cancel_token.cancelled:
+            # 브라우저를 띄우는 동안 중지 요청이 온 경우 바로 정리
+            self.close()
+            raise LearningCancelled()
         if self.driver:
-            self.video_player = VideoPlayer(self.driver, log_callback=self.log_print)
+            self.video_player = VideoPlayer(
+                self.driver,
+                log_callback=self.log_print,
+                poll_policy=self.poll_policy,
+                event_callback=self.emit,
+                cancel_token=self.cancel_token,
+                tracer=self.tracer,
+            )
+            self.login_detector = LoginDetector(
+                self.driver,
+                log_callback=self.log_print,
+                event_callback=self.emit,
+                cancel_token=self.cancel_token,
+            )
         return self.driver
     
+    def govern_resources(self):
+        """강의 사이에 브라우저 자원 사용량을 확인하고 기준을 넘으면 브라우저 재시작"""
+        governor = self.resource_governor
+        governor.lecture_finished()
+        if self.browser_manager.attached:
+            # 사용자가 띄운 Chrome에 연결한 경우 재시작하지 않음
+            return
+        sample = governor.sample(self.driver)
+        if sample:
+            self.log_print(f"🧠 브라우저 자원: {sample}")
+        reason = governor.recycle_reason(sample)
+        if reason:
+            self.recycle_browser(reason, before=sample)
+    
+    def recycle_browser(self, reason, before=None):
+        """브라우저를 다시 시작하고 쿠키와 현재 강의 URL 복원"""
+        self.log_print(f"♻️ 브라우저 재시작: {reason}")
+        url = self.driver.current_url
+        cookies = self.driver.get_cookies()
+        if self.driver_actor:
+            self.log_print(f"🧵 {self.driver_actor.summary()}")
+        
+        self.browser_manager.close()
+        self.driver = None
+        self.prewarmer = None
+        self.setup_driver()
+        
+        # 쿠키는 해당 도메인 페이지에서만 추가할 수 있으므로 같은 주소로 먼저 이동
+        self.navigate(url)
+        restored = 0
+        for cookie in cookies:
+            cookie = {k: v for k, v in cookie.items() if k in ("name", "value", "path", "domain", "secure", "httpOnly", "expiry", "sameSite")}
+            try:
+                self.driver.add_cookie(cookie)
+                restored += 1
+            except Exception:
+                pass
+        self.navigate(url)
+        self.video_player.readiness.wait_for_document_ready()
+        self.resource_governor.recycled()
+        
+        after = self.resource_governor.sample(self.driver)
+        self.log_print(
+            f"♻️ 브라우저 재시작 완료 (쿠키 {restored}/{len(cookies)}개 복원): "
+            f"{before or '측정 안 됨'} -> {after or '측정 안 됨'}"
+        )
+    
+    def phase(self, name, span=None):
+        """
+        with 블록 안의 WebDriver 명령을 name 단계로 계측하고, span을 주면 시간 기록에도 구간으로 남김
+        (계측/기록을 끄면 아무 일도 하지 않음)
+        """
+        stack = ExitStack()
+        if self.instrumentation:
+            stack.enter_context(self.instrumentation.phase(name))
+        if span:
+            stack.enter_context(self.tracer.span(span, name))
+        return stack
+    
+    def navigate(self, url):
+        """주소로 이동 (이동 시간을 구간으로 기록)"""
+        with self.tracer.span("페이지 이동", CAT_NAVIGATION, url=url):
+            self.driver.get(url)
+    
+    def find_resume_point(self, course_url):
+        """이 과정을 이어서 학습할 수 있는 체크포인트 (없으면 None)"""
+        return self.checkpoint.load(course_url)
+    
+    def resume_from(self, checkpoint):
+        """다음 play_videos_automatically에서 체크포인트의 강의부터 이어서 학습"""
+        self.resume_point = checkpoint
+        self.course_url = checkpoint.course_url
+        self.checkpoint.current = checkpoint  # 처음 시작한 시각 유지
+        self.log_print(f"⏩ 이어서 학습: {checkpoint.describe()}")
+    
+    def resume_lecture(self):
+        """체크포인트의 강의 페이지로 바로 이동하고 강의 번호 복원 (재생 위치는 영상 준비 후 복원)"""
+        point = self.resume_point
+        self.log_print(f"⏩ 강의 #{point.video_count} 페이지로 바로 이동합니다: {point.lecture_url}")
+        self.navigate(point.lecture_url)
+        self.video_player.readiness.wait_for_document_ready()
+        # 루프 시작에서 1 증가하므로 하나 작게 맞춤
+        self.video_count = point.video_count - 1
+    
+    def page_url(self):
+        """현재 페이지 주소 (확인할 수 없으면 None)"""
+        try:
+            return self.driver.current_url
+        except Exception:
+            return None
+    
+    def save_checkpoint(self, video_count):
+        """현재 페이지를 video_count번째 강의로 체크포인트에 저장 (저장한 주소 반환)"""
+        lecture_url = self.page_url()
+        if lecture_url is None:
+            return None
+        self.checkpoint.lecture_started(self.course_url, lecture_url, video_count)
+        return lecture_url
+    
+    @property
+    def outline(self):
+        """현재 과정의 강의 목차 (없으면 None)"""
+        return self.course_index.outline if self.course_index else None
+    
+    def plan_course(self, resuming=False):
+        """
+        강의 목차를 한 번 읽어 남은 강의와 예상 시간을 계산하고, 현재 강의를 이미 완료했거나
+        강의가 아닌 페이지(과정 목차 페이지 등)에서 시작했으면 다음 미완료 강의로 이동
+        (이어서 학습할 때는 저장된 목차의 완료 표시를 이어받고, 저장된 강의에서 그대로 시작)
+        """
+        if not self.course_index:
+            return
+        previous = self.course_index.load(self.course_url) if resuming else None
+        try:
+            with self.tracer.span("강의 목차 읽기", CAT_NAVIGATION):
+                outline = self.course_index.build(self.driver, self.course_url, previous)
+        except Exception as e:
+            self.log_print(f"⚠️ 강의 목차 읽기 실패: {str(e)}")
+            outline = self.course_index.use_saved(self.course_url, previous)
+        if not outline:
+            return
+        
+        self.current_lecture = outline.current_lecture(self.driver.current_url)
+        if not resuming and (self.current_lecture is None or self.current_lecture.completed):
+            target = outline.next_incomplete(self.current_lecture)
+            if target and target.url:
+                if self.current_lecture:
+                    self.log_print(f"⏭️ '{self.current_lecture.title}'은(는) 이미 완료됨. 다음 미완료 강의로 바로 이동: {target.title}")
+                else:
+                    self.log_print(f"⏭️ 현재 페이지는 목차의 강의가 아님. 첫 미완료 강의로 바로 이동: {target.title}")
+                self.navigate(target.url)
+                self.video_player.readiness.wait_for_document_ready()
+                self.current_lecture = target
+        self.log_eta()
+    
+    def log_eta(self):
+        """목차 기준 남은 강의 수와 예상 소요 시간 표시 (최대 학습 강의 수 반영)"""
+        outline = self.outline
+        if not outline:
+            return
+        limit = max(0, self.max_videos - self.video_count)
+        remaining = outline.remaining(self.current_lecture, limit=limit)
+        if not remaining:
+            return
+        self.log_print(f"🗓️ 남은 강의 {len(remaining)}개, 예상 소요 시간 약 {format_eta(outline.eta_seconds(remaining))}")
+    
+    def locate_lecture(self, lecture_url):
+        """현재 주소에 해당하는 목차의 강의 찾기 (주소로 못 찾으면 버튼으로 넘어온 경우 이전 강의의 다음 강의로 추정)"""
+        outline = self.outline
+        clicked, self._advanced_by_click = self._advanced_by_click, False
+        if not outline:
+            return None
+        lecture = outline.find(lecture_url)
+        if lecture is None:
+            lecture = self.current_lecture
+            if clicked and lecture:
+                lecture = outline.lectures[lecture.index] if lecture.index < len(outline) else None
+        return lecture
+    
+    def go_to_next_lecture(self):
+        """목차의 다음 미완료 강의로 바로 이동 (주소를 모르면 '다음영상' 버튼 클릭)"""
+        self._advanced_by_click = False
+        outline = self.outline
+        if outline and self.current_lecture:
+            target = outline.next_incomplete(self.current_lecture)
+            if target is None:
+                self.log_print("🏁 목차 기준으로 이동할 다음 미완료 강의가 없습니다.")
+                return False
+            if target.url:
+                with self.phase(PHASE_TRANSITION, "다음 미완료 강의로 이동"):
+                    self.log_print(f"⏭️ 다음 미완료 강의로 바로 이동: {target.title}")
+                    self.navigate(target.url)
+                self.current_lecture = target
+                return True
+        self._advanced_by_click = True
+        return self.click_next_video()
+    
+    def wait_for_login(self, timeout=None):
+        """로그인될 때까지 대기 (자동 감지 또는 confirm_login 호출)"""
+        if not self.login_detector:
+            return False
+        with self.phase(PHASE_LOGIN, "wait_for_login"):
+            return self.login_detector.wait(timeout)
+    
+    def confirm_login(self):
+        """사용자가 로그인 완료를 직접 알림 (GUI '로그인 완료' 버튼)"""
+        if self.login_detector:
+            self.login_detector.confirm()
+    
     def wait_for_video_ready(self, timeout=60):
         """영상 플레이어를 찾고 재생 준비"""
         if not self.video_player:
             return None, None
-        return self.video_player.wait_for_video_ready(timeout)
+        with self.phase(PHASE_DISCOVERY, "wait_for_video_ready"):
+            return self.video_player.wait_for_video_ready(timeout)
+    
+    def get_media_state(self, video_element):
+        """현재 영상 재생 상태 스냅샷 확인 (한 번의 왕복)"""
+        if not self.video_player:
+            return None
+        return self.video_player.get_media_state(video_element)
     
     def get_video_progress(self, video_element):
         """현재 영상 재생 상태 확인"""
@@ -81,29 +367,32 @@ class KTEduAutoPlayer:
             return None
         return self.video_player.get_video_progress(video_element)
     
-    def start_video_if_paused(self, video_element):
+    def start_video_if_paused(self, video_element, state=None):
         """영상이 멈춰있으면 재생 시작"""
         if not self.video_player:
             return
-        self.video_player.start_video_if_paused(video_element)
+        self.video_player.start_video_if_paused(video_element, state)
     
     def wait_for_video_end(self, video_element):
         """영상이 끝날 때까지 대기 (실시간 길이 체크)"""
         if not self.video_player:
             return False
-        return self.video_player.wait_for_video_end(video_element, self.log_queue)
+        with self.phase(PHASE_MONITORING, "wait_for_video_end"):
+            return self.video_player.wait_for_video_end(video_element)
     
     def click_next_video(self):
         """다음 영상 버튼 클릭"""
         if not self.video_player:
             return False
-        return self.video_player.click_next_video()
+        with self.phase(PHASE_TRANSITION, "click_next_video"):
+            return self.video_player.click_next_video()
     
     def handle_alerts(self):
         """알림창 처리"""
         if not self.video_player:
             return False
-        return self.video_player.handle_alerts()
+        with self.phase(PHASE_ALERTS, "handle_alerts"):
+            return self.video_player.handle_alerts()
     
     def play_videos_automatically(self, start_url=None, max_videos=None):
         """영상 자동재생 시작"""
@@ -113,6 +402,7 @@ class KTEduAutoPlayer:
         self.log_print("🚀 스마트 학습을 시작합니다!")
         self.log_print(f"📊 최대 학습 강의 수: {self.max_videos}개")
         
+        learning = False
         try:
             # 드라이버가 초기화되지 않았다면 초기화
             if not self.driver:
@@ -120,61 +410,160 @@ class KTEduAutoPlayer:
                 self.setup_driver()
             
             if start_url:
+                self.course_url = start_url
                 self.log_print(f"📱 시작 URL로 이동: {start_url}")
-                self.driver.get(start_url)
-                self.log_print("⏳ 페이지 로딩 대기 중... (5초)")
-                time.sleep(5)
+                self.navigate(start_url)
+                self.log_print("⏳ 페이지 로딩 대기 중...")
+                self.video_player.readiness.wait_for_document_ready()
                 self.log_print(f"🔍 페이지 로딩 완료, 현재 URL: {self.driver.current_url}")
                 self.log_print(f"🔍 페이지 제목: {self.driver.title}")
-                self.log_print("🔐 브라우저에서 로그인을 완료한 후 GUI의 '로그인 완료' 버튼을 클릭하세요!")
-                self.log_print("⏳ 로그인 완료 대기 중... (무기한 대기)")
-                return  # 로그인 완료를 기다리기 위해 여기서 대기
+                self.log_print("🔐 브라우저에서 로그인을 완료하면 자동으로 진행됩니다. (GUI의 '로그인 완료' 버튼으로도 진행 가능)")
+                return  # 로그인 대기는 wait_for_login()에서 처리
+            
+            learning = True
+            resume_position = 0.0
+            resuming = self.resume_point is not None
+            if resuming:
+                resume_position = self.resume_point.position
+                self.resume_lecture()
+                self.resume_point = None
+            elif not self.course_url:
+                self.course_url = self.driver.current_url
+            
+            # 강의 목차로 남은 강의/예상 시간 확인 (이어서 학습할 때는 저장된 강의에서 그대로 시작)
+            self.plan_course(resuming=resuming)
             
-            while self.video_count < self.max_videos:
+            course_finished = bool(self.outline) and not self.outline.remaining()
+            if course_finished:
+                self.log_print("🏁 목차의 모든 강의를 이미 완료했습니다.")
+            while not course_finished and self.video_count < self.max_videos:
+                self.cancel_token.raise_if_cancelled()
                 self.video_count += 1
                 self.log_print(f"\n🎬 === 강의 #{self.video_count} 학습 시작 ===")
+                lecture_started = time.time()
+                self.tracer.instant(f"강의 #{self.video_count}", CAT_LECTURE, index=self.video_count)
+                self.emit(LectureStartedEvent(self.video_count, self.page_url() or ""))
+                self.video_player.reset_round_trip_stats()
                 
                 # 알림창 처리
                 self.handle_alerts()
                 
+                # 강의가 바뀔 때마다 체크포인트 저장 (비정상 종료 후 이 강의부터 이어서 학습)
+                lecture_url = self.save_checkpoint(self.video_count)
+                self.current_lecture = self.locate_lecture(lecture_url)
+                if self.current_lecture:
+                    self.log_print(f"📖 목차 {self.current_lecture.index}/{len(self.outline)}: {self.current_lecture.title}")
+                
                 video_element, _ = self.wait_for_video_ready()
                 if not video_element:
                     self.log_print("❌ 강의 플레이어를 찾을 수 없습니다. 다음 강의로 이동...")
-                    if not self.click_next_video():
+                    self.emit(LectureFinishedEvent(self.video_count, False, time.time() - lecture_started))
+                    if not self.go_to_next_lecture():
                         self.log_print("❌ 더 이상 학습할 강의가 없습니다.")
+                        course_finished = self.last_lecture_reached()
                         break
                     continue
+                
+                if resume_position:
+                    # 중단된 재생 위치로 이동 (같은 강의에서 이어서 학습할 때 한 번만)
+                    self.video_player.seek_to(video_element, resume_position)
+                    resume_position = 0.0
 
                 # 영상 재생 완료까지 모니터링
                 if video_element:
                     success = self.wait_for_video_end(video_element)
                     if success:
                         self.log_print(f"✅ 강의 #{self.video_count} 학습 완료!")
+                        if self.course_index:
+                            self.course_index.mark_completed(self.current_lecture)
                     else:
                         self.log_print(f"⚠️ 강의 #{self.video_count} 학습 중단됨")
+                    self.emit(LectureFinishedEvent(self.video_count, success, time.time() - lecture_started))
+                    self.log_print(
+                        f"📉 상태 조회 {self.video_player.snapshot_calls}회 "
+                        f"(이벤트 대기 {self.video_player.event_drains}회, "
+                        f"모니터링 확인 {self.video_player.scheduler.probes}회), "
+                        f"절약한 WebDriver 왕복 {self.video_player.round_trips_saved}회"
+                    )
+                    self.log_print(f"⏱️ 준비 대기 시간 합계: {self.video_player.readiness.total_waited:.1f}초")
                 
-                # 다음 영상으로 이동
-                if not self.click_next_video():
+                self.log_eta()
+                
+                # 다음 영상으로 이동 (목차가 있으면 다음 미완료 강의로 바로 이동)
+                if not self.go_to_next_lecture():
                     self.log_print("❌ 더 이상 학습할 강의가 없습니다.")
+                    course_finished = self.last_lecture_reached()
                     break
                     
-                # 잠시 대기
-                time.sleep(3)
+                # 다음 강의 페이지 로딩 대기 (완료되는 즉시 진행)
+                with self.phase(PHASE_TRANSITION, "다음 강의 로딩"):
+                    self.video_player.readiness.wait_for_document_ready()
+                
+                # 브라우저 메모리가 기준을 넘으면 재시작 후 같은 강의에서 계속
+                self.govern_resources()
+            
+            if course_finished:
+                # 과정을 끝까지 학습함 - 다음 실행은 처음부터
+                self.checkpoint.clear()
+                self.log_print("🏁 마지막 강의까지 학습해 이어서 학습하기 기록을 지웠습니다.")
+            elif self.video_count >= self.max_videos:
+                # 최대 강의 수에 도달 - 다음 실행은 이미 이동해 둔 다음 강의부터
+                self.save_checkpoint(self.video_count + 1)
                 
-        except KeyboardInterrupt:
+        except (KeyboardInterrupt, LearningCancelled):
             self.log_print("\n⏹️ 사용자에 의해 중단되었습니다.")
         except Exception as e:
-            self.log_print(f"❌ 학습 중 오류 발생: {str(e)}")
+            if self.cancel_token.cancelled:
+                # 중지 요청으로 브라우저가 닫히면서 생긴 오류
+                self.log_print("\n⏹️ 사용자에 의해 중단되었습니다.")
+            else:
+                self.log_print(f"❌ 학습 중 오류 발생: {str(e)}")
+                self.emit(ErrorEvent(f"학습 중 오류 발생: {str(e)}", traceback.format_exc()))
         finally:
-            self.log_print(f"📊 총 학습한 강의 수: {self.video_count}개")
+            if learning:
+                # 시작 URL로 이동만 한 호출은 건너뛰고, 학습을 진행한 뒤에만 통계를 보고
+                self.log_print(f"📊 총 학습한 강의 수: {self.video_count}개")
+                if self.driver_actor:
+                    self.log_print(f"🧵 {self.driver_actor.summary()}")
+                if self.instrumentation:
+                    self.instrumentation.report()
+                    self.instrumentation.reset()
+                self.tracer.write()
+    
+    def last_lecture_reached(self):
+        """
+        더 학습할 강의가 없어서 멈췄는지 (일시적인 전환 실패와 구분)
+        목차가 있으면 미완료 강의가 남았는지로만 판단하고, 없으면 '다음영상' 버튼이 없는지로 판단
+        """
+        if self.outline:
+            return not self.outline.remaining()
+        result = self.video_player.transition.last_result if self.video_player else None
+        return result is not None and result.reason == "no-button"
+    
+    def stop(self):
+        """학습 중지 (어느 스레드에서나 호출 가능): 모든 대기를 깨우고 브라우저 종료"""
+        self.cancel_token.cancel()
+        self.close()
     
     def close(self):
         """드라이버 종료"""
         if self.browser_manager:
             self.browser_manager.close()
+        self.tracer.write()
+
+def ask_resume(checkpoint):
+    """터미널에서 이어서 학습할지 물어봄 (입력할 수 없는 환경이면 처음부터)"""
+    if not sys.stdin or not sys.stdin.isatty():
+        return False
+    try:
+        answer = input(f"⏩ 이전에 중단된 학습이 있습니다: {checkpoint.describe()}\n   이어서 학습할까요? [Y/n] ")
+    except EOFError:
+        return False
+    return answer.strip().lower() in ("", "y", "yes", "예")
 
-def main_with_args(url, count, headless=False, log_queue=None):
-    """GUI에서 호출하는 함수"""
+def main_with_args(url, count, headless=False, log_queue=None, profile_dir=None, debugger_address=None,
+                   governor_policy=None, instrument=None, trace_path=None, resume=None, use_outline=True):
+    """GUI에서 호출하는 함수 (resume: True면 이어서 학습, False면 처음부터, None이면 물어봄)"""
     def log_print(message):
         # GUI 큐로 로그 전달
         if log_queue:
@@ -192,7 +581,24 @@ def main_with_args(url, count, headless=False, log_queue=None):
     log_print(f"시작 URL: {url}")
     log_print(f"최대 학습 강의 수: {count}개")
     
-    player = KTEduAutoPlayer(headless=headless, log_queue=log_queue)
+    player = KTEduAutoPlayer(
+        headless=headless,
+        log_queue=log_queue,
+        profile_dir=profile_dir,
+        debugger_address=debugger_address,
+        governor_policy=governor_policy,
+        instrument=instrument,
+        trace_path=trace_path,
+        use_outline=use_outline,
+    )
+    player.course_url = url
+    
+    # 이전에 중단된 학습이 있으면 이어서 학습할지 확인
+    checkpoint = player.find_resume_point(url)
+    if checkpoint and resume is None:
+        resume = ask_resume(checkpoint)
+    if checkpoint and resume:
+        player.resume_from(checkpoint)
     
     try:
         # 드라이버 설정 및 브라우저 열기
@@ -202,9 +608,9 @@ def main_with_args(url, count, headless=False, log_queue=None):
         # 시작 URL로 이동
         log_print(f"📱 사이트 접속 중: {url}")
         try:
-            player.driver.get(url)
+            player.navigate(url)
             log_print("✅ 사이트 접속 완료!")
-            time.sleep(3)
+            player.video_player.readiness.wait_for_document_ready()
             
             # 페이지 로딩 확인
             log_print("🔍 페이지 로딩 상태 확인 중...")
@@ -226,58 +632,19 @@ def main_with_args(url, count, headless=False, log_queue=None):
         log_print("\n" + "="*60)
         log_print("🔐 브라우저 창에서 KT EDU에 로그인해주세요!")
         log_print("📍 로그인 후 원하는 강의 페이지로 이동하세요.")
-        log_print("✅ 준비가 되면 자동으로 감지합니다. (CLI 모드)")
-        if log_queue:
-            log_print("⏳ GUI에서 로그인 완료 신호를 기다리는 중...")
+        log_print("✅ 준비가 되면 자동으로 감지합니다.")
         log_print("="*60)
         
-        # 로그인 완료 대기
-        if log_queue:
-            log_print("🔐 로그인 대기 상태 - GUI에서 '로그인 완료' 버튼을 클릭해주세요!")
-            # GUI 모드에서는 큐를 통해 신호 대기
-            while True:
-                try:
-                    time.sleep(0.1)
-                    # 로그인 완료는 GUI에서 처리됨
-                    # 브라우저가 살아있는지 확인
-                    try:
-                        current_url = player.driver.current_url
-                        # 너무 자주 상태 확인하지 않도록 5초마다만 출력
-                        if not hasattr(player, '_last_status_time') or time.time() - player._last_status_time > 5:
-                            log_print(f"🔍 브라우저 상태 확인: {current_url}")
-                            player._last_status_time = time.time()
-                    except Exception as e:
-                        log_print(f"❌ 브라우저 연결 끊어짐: {str(e)}")
-                        break
-                except Exception as e:
-                    log_print(f"❌ 로그인 대기 중 오류: {str(e)}")
-                    break
-        else:
-            # CLI 모드: 로그인 페이지를 벗어날 때까지 폴링
-            log_print("⏳ 로그인 감지 대기 중... 로그인 완료 후 강의 페이지로 이동해주세요.")
-            last_report = 0
-            while True:
-                try:
-                    current_url = player.driver.current_url
-                    page_title = player.driver.title
-                    now = time.time()
-                    if now - last_report > 5:
-                        log_print(f"🔍 현재 상태: {page_title} | {current_url}")
-                        last_report = now
-                    # 로그인 페이지를 벗어나거나 강의 컨텐츠 URL로 이동하면 진행
-                    if 'login.do' not in current_url and ('courseContents.do' in current_url or 'player' in current_url or 'contents' in current_url):
-                        log_print("✅ 로그인 및 강의 페이지 진입 감지!")
-                        break
-                except Exception as e:
-                    log_print(f"⚠️ 상태 확인 오류: {str(e)}")
-                time.sleep(1.5)
+        # 로그인 완료 대기 (페이지 리스너로 감지, GUI 버튼도 같은 경로 사용)
+        if not player.wait_for_login():
+            return
         
         log_print("\n🎬 자동재생을 시작합니다!")
         
         # 자동재생 시작 (현재 페이지에서)
         player.play_videos_automatically(start_url=None, max_videos=count)
         
-    except KeyboardInterrupt:
+    except (KeyboardInterrupt, LearningCancelled):
         log_print("\n사용자에 의해 중단되었습니다.")
     except Exception as e:
         log_print(f"❌ 오류 발생: {str(e)}")
@@ -296,10 +663,34 @@ def main():
                        help='최대 재생할 영상 수')
     parser.add_argument('--headless', action='store_true', 
                        help='헤드리스 모드로 실행')
+    parser.add_argument('--profile', nargs='?', const=default_profile_dir(), default=None,
+                       help='Chrome 프로필을 저장해 캐시/로그인 세션 재사용 (폴더 생략 시 기본 폴더)')
+    parser.add_argument('--debugger-address', default=None,
+                       help='--remote-debugging-port로 실행 중인 Chrome에 연결 (예: 127.0.0.1:9222)')
+    
+    parser.add_argument('--max-browser-memory', type=float, default=GovernorPolicy.max_rss_mb,
+                       help='브라우저 메모리(MB)가 이 값을 넘으면 강의 사이에 재시작 (psutil 필요)')
+    parser.add_argument('--recycle-every', type=int, default=0,
+                       help='이 강의 수마다 브라우저 재시작 (0이면 사용 안 함)')
+    parser.add_argument('--instrument', action='store_true',
+                       help='WebDriver 명령을 단계별로 계측해 학습 종료 시 히스토그램 출력')
+    parser.add_argument('--resume', dest='resume', action='store_true', default=None,
+                       help='중단된 강의부터 묻지 않고 이어서 학습')
+    parser.add_argument('--no-resume', dest='resume', action='store_false',
+                       help='저장된 기록을 무시하고 처음부터 학습')
+    parser.add_argument('--no-outline', dest='use_outline', action='store_false',
+                       help='강의 목차를 읽지 않고 \'다음영상\' 버튼으로만 이동')
+    parser.add_argument('--trace', nargs='?', const='', default=None, metavar='FILE',
+                       help='단계별 시간을 Chrome trace-event JSON으로 저장 (파일 생략 시 기본 폴더)')
     
     args = parser.parse_args()
     
-    main_with_args(args.url, args.count, args.headless)
+    governor_policy = GovernorPolicy(max_rss_mb=args.max_browser_memory, recycle_every=args.recycle_every)
+    main_with_args(args.url, args.count, args.headless,
+                   profile_dir=args.profile, debugger_address=args.debugger_address,
+                   governor_policy=governor_policy, instrument=args.instrument or None,
+                   trace_path=(args.trace or default_trace_path()) if args.trace is not None else None,
+                   resume=args.resume, use_outline=args.use_outline)
 
 if __name__ == "__main__":
     main()
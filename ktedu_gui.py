@@ -7,14 +7,126 @@ import sys
 import os
 import subprocess
 import time
-import queue
-from PyQt5.QtWidgets import *
-from PyQt5.QtCore import *
-from PyQt5.QtGui import *
+import threading
+import traceback
+from collections import deque
+# 필요한 클래스만 불러옴 (selenium 등 엔진 모듈은 학습 시작 시 불러옴)
+from PyQt5.QtWidgets import (
+    QApplication, QMainWindow, QWidget, QStyle, QVBoxLayout, QHBoxLayout, QGroupBox,
+    QLabel, QLineEdit, QSpinBox, QPushButton, QProgressBar, QListView, QAbstractItemView, QMessageBox,
+)
+from PyQt5.QtCore import (
+    Qt, QObject, QThread, QTimer, QAbstractListModel, QModelIndex, pyqtSignal,
+)
+from engine_events import (
+    EventChannel, LogEvent, ProgressEvent, StatusEvent,
+    LectureStartedEvent, LectureFinishedEvent, ErrorEvent,
+    LoginWaitingEvent, LoggedInEvent,
+)
+from cancellation import CancellationToken, LearningCancelled
+from browser_prewarm import BrowserPrewarmer, prewarm_requested
+from resume_checkpoint import ResumeCheckpoint
+
+# 시작 시간 측정용: 설정되면 첫 화면 표시 시각을 이 파일에 기록하고 바로 종료
+STARTUP_PROBE_ENV = "SMART_LEARNING_STARTUP_PROBE"
+
+# 로그 패널에 보관하는 최대 줄 수 (넘으면 오래된 줄부터 삭제)
+LOG_CAPACITY = 5000
+
+class LogListModel(QAbstractListModel):
+    """최대 줄 수가 정해진 링 버퍼 기반 로그 모델"""
+    
+    def __init__(self, capacity=LOG_CAPACITY, parent=None):
+        super().__init__(parent)
+        self.capacity = capacity
+        self._rows = deque()
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and index.isValid() and index.row() < len(self._rows):
+            return self._rows[index.row()]
+        return None
+    
+    def append_many(self, messages):
+        """여러 줄을 한 번의 beginInsertRows로 추가 (넘치는 줄은 앞에서 삭제)"""
+        messages = list(messages)[-self.capacity:]
+        if not messages:
+            return
+        overflow = len(self._rows) + len(messages) - self.capacity
+        if overflow > 0:
+            self.beginRemoveRows(QModelIndex(), 0, overflow - 1)
+            for _ in range(overflow):
+                self._rows.popleft()
+            self.endRemoveRows()
+        start = len(self._rows)
+        self.beginInsertRows(QModelIndex(), start, start + len(messages) - 1)
+        self._rows.extend(messages)
+        self.endInsertRows()
+    
+    def clear(self):
+        """모든 로그 삭제"""
+        self.beginResetModel()
+        self._rows.clear()
+        self.endResetModel()
+
+# GUI 멈춤 측정용 하트비트 간격 (ms)
+HEARTBEAT_INTERVAL_MS = 50
+
+class EngineWorker(QThread):
+    """브라우저 실행/페이지 이동/학습 같은 오래 걸리는 엔진 작업을 GUI 스레드 밖에서 실행"""
+    
+    step = pyqtSignal(str)            # 진행 단계 문구
+    succeeded = pyqtSignal(object)    # 작업 결과
+    failed = pyqtSignal(str, str)     # 오류 메시지, 상세 오류
+    
+    def __init__(self, task, parent=None):
+        """
+        Args:
+            task (function): report(문구) 콜백을 받아 실행할 작업 함수
+        """
+        super().__init__(parent)
+        self.task = task
+    
+    def run(self):
+        try:
+            result = self.task(self.step.emit)
+            self.succeeded.emit(result)
+        except LearningCancelled:
+            self.step.emit("⏹️ 작업이 중지되었습니다.")
+        except Exception as e:
+            self.failed.emit(str(e), traceback.format_exc())
+
+class GuiStallMonitor(QObject):
+    """짧은 간격 타이머가 늦게 도착한 정도로 GUI 스레드 최대 멈춤 시간 측정"""
+    
+    def __init__(self, interval_ms=HEARTBEAT_INTERVAL_MS, parent=None):
+        super().__init__(parent)
+        self.interval = interval_ms / 1000.0
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self._tick)
+        self.reset()
+        self.timer.start(interval_ms)
+    
+    def reset(self):
+        """측정값 초기화"""
+        self.last_tick = time.perf_counter()
+        self.max_stall = 0.0
+    
+    def _tick(self):
+        now = time.perf_counter()
+        self.max_stall = max(self.max_stall, now - self.last_tick - self.interval)
+        self.last_tick = now
 
 class SmartLearningGUI(QMainWindow):
+    
+    # 작업 스레드에서 만든 플레이어를 GUI 스레드로 넘김 (GUI 상태는 GUI 스레드에서만 변경)
+    player_created = pyqtSignal(object)
+    
     def __init__(self):
         super().__init__()
+        self.player_created.connect(self.register_player, Qt.QueuedConnection)
         self.setWindowTitle("📚 스마트 학습 도우미")
         self.setGeometry(100, 100, 800, 900)
         self.setMinimumSize(750, 800)
@@ -51,7 +163,12 @@ class SmartLearningGUI(QMainWindow):
         self.is_running = False
         self.waiting_for_login = False
         self.player_instance = None  # 자동재생 플레이어 인스턴스
-        self.log_queue = queue.Queue()  # 로그 전달용 큐
+        self.engine_worker = None  # 엔진 작업 스레드
+        self.cancel_token = None  # 현재 실행의 중지 신호
+        self.stop_requested_at = None
+        self.prewarmer = None  # 사전 실행 중인 브라우저 (첫 학습 시작 때 넘겨줌)
+        self.log_queue = EventChannel()  # 엔진 -> GUI 이벤트 채널
+        self.stall_monitor = GuiStallMonitor(parent=self)
         
         # 로그 큐 처리용 타이머
         self.log_timer = QTimer()
@@ -61,23 +178,46 @@ class SmartLearningGUI(QMainWindow):
         # 스타일 적용
         self.apply_styles()
     
+    def start_prewarm(self):
+        """창이 뜬 직후 백그라운드에서 브라우저를 미리 실행 (사전 실행 모드)"""
+        self.prewarmer = BrowserPrewarmer(headless=False, log_callback=self.log_queue.log).start()
+    
+    def append_log(self, message):
+        """로그 메시지 추가 (다음 타이머 주기에 한꺼번에 표시됨)"""
+        self.log_queue.put(message)
+    
     def process_log_queue(self):
-        """로그 큐에서 메시지를 가져와서 GUI에 표시"""
-        try:
-            while True:
-                message = self.log_queue.get_nowait()
-                
-                # 진행률 업데이트 신호 처리
-                if message.startswith("PROGRESS_UPDATE:"):
-                    progress_value = float(message.split(":")[1])
-                    self.progress_bar.setValue(int(progress_value))
-                    self.status_label.setText(f"학습 진행 중... ({progress_value:.1f}%)")
-                else:
-                    # 일반 로그 메시지
-                    self.log_text.addItem(message)
-                    self.log_text.scrollToBottom()
-        except queue.Empty:
-            pass
+        """이벤트 채널에서 이벤트를 모두 꺼내서 한 번에 GUI에 반영"""
+        batch = []
+        for event in self.log_queue.drain():
+            if isinstance(event, LogEvent):
+                batch.append(event.message)
+            elif isinstance(event, ProgressEvent):
+                # 진행률은 채널에서 주기당 마지막 값만 남음
+                self.progress_bar.setValue(int(event.percent))
+                self.status_label.setText(f"학습 진행 중... ({event.percent:.1f}%)")
+                if event.duration:
+                    self.video_info.setText(f"{event.current_time:.0f} / {event.duration:.0f}초")
+            elif isinstance(event, StatusEvent):
+                self.status_label.setText(event.text)
+            elif isinstance(event, LectureStartedEvent):
+                self.progress_bar.setValue(0)
+                self.video_info.setText(f"🎬 강의 #{event.index} 학습 중")
+            elif isinstance(event, LectureFinishedEvent):
+                result = "완료" if event.success else "중단"
+                self.video_info.setText(f"강의 #{event.index} {result} ({event.elapsed:.0f}초)")
+            elif isinstance(event, LoginWaitingEvent):
+                # 브라우저 준비 완료 - 자동 감지 중에도 버튼으로 바로 진행 가능
+                self.login_btn.setEnabled(True)
+            elif isinstance(event, LoggedInEvent):
+                self.on_logged_in(event)
+            elif isinstance(event, ErrorEvent):
+                batch.append(f"❌ {event.message}")
+                self.status_label.setText("오류 발생")
+        
+        if batch:
+            self.log_model.append_many(batch)
+            self.log_text.scrollToBottom()
         
     def create_header(self, layout):
         """헤더 섹션 생성"""
@@ -201,7 +341,6 @@ class SmartLearningGUI(QMainWindow):
                     stop:0 #1565C0, stop:1 #0D47A1);
             }
         """)
-        self.login_btn.clicked.connect(self.confirm_login)
         controls_layout.addWidget(self.login_btn)
         
         # 중지 버튼
@@ -314,11 +453,15 @@ class SmartLearningGUI(QMainWindow):
         """)
         log_layout = QVBoxLayout()
         
-        # 로그 텍스트 - QListWidget 사용 (QTextCursor 오류 방지)
-        self.log_text = QListWidget()
+        # 로그 텍스트 - 줄 수 제한 모델 + QListView (장시간 실행해도 메모리 일정)
+        self.log_model = LogListModel(LOG_CAPACITY, self)
+        self.log_text = QListView()
+        self.log_text.setModel(self.log_model)
+        self.log_text.setUniformItemSizes(True)
+        self.log_text.setEditTriggers(QAbstractItemView.NoEditTriggers)
         self.log_text.setMinimumHeight(400)  # 150 -> 400 (3배 이상)
         self.log_text.setStyleSheet("""
-            QListWidget {
+            QListView {
                 background-color: #F8F8F8;
                 border: 1px solid #E0E0E0;
                 border-radius: 5px;
@@ -326,7 +469,7 @@ class SmartLearningGUI(QMainWindow):
                 font-size: 12px;
                 padding: 10px;
             }
-            QListWidget::item {
+            QListView::item {
                 padding: 2px;
                 border: none;
             }
@@ -336,7 +479,7 @@ class SmartLearningGUI(QMainWindow):
         # 로그 제어 버튼
         log_controls = QHBoxLayout()
         clear_btn = QPushButton("🗑️ 로그 지우기")
-        clear_btn.clicked.connect(self.log_text.clear)
+        clear_btn.clicked.connect(self.log_model.clear)
         clear_btn.setStyleSheet("""
             QPushButton {
                 background-color: #FF9800;
@@ -400,147 +543,231 @@ class SmartLearningGUI(QMainWindow):
         self.progress_bar.setValue(0)
         
         # 로그 초기화
-        self.log_text.clear()
-        self.log_text.addItem("🚀 스마트 학습을 시작합니다!")
-        self.log_text.addItem(f"📊 최대 학습 강의 수: {self.count_spinbox.value()}개")
-        self.log_text.addItem("")
+        self.log_model.clear()
+        self.append_log("🚀 스마트 학습을 시작합니다!")
+        self.append_log(f"📊 최대 학습 강의 수: {self.count_spinbox.value()}개")
+        self.append_log("")
         
         # 즉시 로그인 버튼 표시
         self.waiting_for_login = True
         self.start_btn.setVisible(False)
         self.login_btn.setVisible(True)
-        self.status_label.setText("브라우저에서 로그인을 완료한 후 '로그인 완료' 버튼을 클릭하세요")
-        self.log_text.addItem("🔐 브라우저에서 로그인을 완료한 후 '로그인 완료' 버튼을 클릭하세요!")
+        self.status_label.setText("브라우저에서 로그인하면 자동으로 시작합니다 ('로그인 완료' 버튼으로도 진행 가능)")
+        self.append_log("🔐 브라우저에서 로그인하면 자동으로 감지합니다. ('로그인 완료' 버튼으로도 진행 가능)")
         
         # 학습 실행
         self.run_learning_direct()
         
         
     def confirm_login(self):
-        """로그인 완료 확인"""
-        self.log_text.addItem("🔍 로그인 완료 버튼 클릭됨!")
+        """로그인 완료 버튼 (자동 감지와 같은 경로로 엔진에 알림)"""
+        self.append_log("🔍 로그인 완료 버튼 클릭됨!")
         
-        if self.waiting_for_login:
-            self.log_text.addItem("✅ 로그인 완료 처리 시작...")
-            self.waiting_for_login = False
-            
-            # 버튼 상태 변경
-            self.log_text.addItem(f"📋 로그인 버튼 표시 상태: {self.login_btn.isVisible()}")
-            self.login_btn.setVisible(False)
-            self.log_text.addItem(f"📋 로그인 버튼 표시 상태 (변경 후): {self.login_btn.isVisible()}")
-            
-            self.log_text.addItem(f"📋 시작 버튼 표시 상태: {self.start_btn.isVisible()}")
-            self.start_btn.setVisible(True)
-            self.start_btn.setEnabled(True)
-            self.start_btn.setText("🎬 학습 시작")
-            self.log_text.addItem(f"📋 시작 버튼 표시 상태 (변경 후): {self.start_btn.isVisible()}")
-            
-            self.status_label.setText("학습을 시작합니다...")
-            self.log_text.addItem("✅ 로그인 완료! 학습을 시작합니다...")
-            self.log_text.addItem("")
-            
-            # 학습 시작 (별도 스레드에서 실행하여 GUI 블로킹 방지)
-            self.log_text.addItem("🚀 학습 시작!")
-            import threading
-            learning_thread = threading.Thread(target=self.start_learning)
-            learning_thread.daemon = True
-            learning_thread.start()
+        if self.waiting_for_login and self.player_instance:
+            self.login_btn.setEnabled(False)
+            self.player_instance.confirm_login()
         else:
-            self.log_text.addItem("⚠️ 로그인 대기 상태가 아닙니다.")
+            self.append_log("⚠️ 로그인 대기 상태가 아닙니다.")
+    
+    def on_logged_in(self, event):
+        """로그인 완료 이벤트 (자동 감지/버튼 모두 한 번만 옴) - 화면 전환"""
+        if not self.waiting_for_login:
+            return
+        self.waiting_for_login = False
+        
+        # 버튼 상태 변경
+        self.login_btn.setVisible(False)
+        self.start_btn.setVisible(True)
+        self.start_btn.setEnabled(True)
+        self.start_btn.setText("🎬 학습 시작")
+        
+        self.status_label.setText("학습을 시작합니다...")
+        self.append_log(f"✅ 로그인 완료! ({event.method}) 학습을 시작합니다...")
+        self.append_log("")
     
     def start_learning(self):
-        """로그인 완료 후 학습 시작"""
-        try:
-            if not self.player_instance:
-                self.log_text.addItem("❌ 플레이어 인스턴스가 없습니다. 먼저 '학습 시작' 버튼을 클릭하세요.")
-                return
-            
-            self.log_text.addItem("🎬 학습 시작!")
-            
+        """로그인 완료 후 학습 시작 (작업 스레드)"""
+        if not self.player_instance:
+            self.append_log("❌ 플레이어 인스턴스가 없습니다. 먼저 '학습 시작' 버튼을 클릭하세요.")
+            return
+        
+        player = self.player_instance
+        max_videos = self.count_spinbox.value()
+        
+        def learn(report):
+            report("🎬 학습 시작!")
             # 기존 플레이어 인스턴스로 영상 재생 시작 (URL 이동 없이 바로 시작)
-            self.player_instance.play_videos_automatically(
+            player.play_videos_automatically(
                 start_url=None,  # URL 이동 없이 바로 시작
-                max_videos=self.count_spinbox.value()
+                max_videos=max_videos
             )
-            
-            self.log_text.addItem("✅ 학습 완료!")
-            
-        except Exception as e:
-            self.log_text.addItem(f"❌ 학습 오류: {str(e)}")
-            import traceback
-            self.log_text.addItem(f"📋 상세 오류: {traceback.format_exc()}")
-        finally:
-            self.log_text.scrollToBottom()
+            # 엔진은 중지 요청(LearningCancelled)을 직접 처리하고 정상 반환하므로,
+            # 중지된 경우 '학습 완료' 대신 작업 스레드의 중지 처리로 넘김
+            player.cancel_token.raise_if_cancelled()
+            return player
+        
+        self.run_engine_task(learn, self.on_learning_finished)
+    
+    def on_learning_finished(self, player):
+        """학습 작업 완료"""
+        self.append_log("✅ 학습 완료!")
+    
+    def run_engine_task(self, task, on_success):
+        """엔진 작업을 작업 스레드에서 실행하고 결과를 GUI 스레드에서 받음"""
+        worker = EngineWorker(task, self)
+        worker.step.connect(self.on_engine_step)
+        worker.succeeded.connect(on_success)
+        worker.failed.connect(self.on_engine_failed)
+        worker.finished.connect(self.on_engine_task_done)
+        self.engine_worker = worker
+        self.stall_monitor.reset()
+        worker.start()
+    
+    def on_engine_step(self, message):
+        """작업 스레드의 진행 단계 표시"""
+        self.append_log(message)
+    
+    def on_engine_failed(self, message, detail):
+        """작업 스레드 오류 표시"""
+        self.append_log(f"❌ 학습 오류: {message}")
+        self.append_log(f"📋 상세 오류: {detail}")
+        self.login_btn.setEnabled(True)
+    
+    def on_engine_task_done(self):
+        """작업 스레드 종료 시 GUI 최대 멈춤 시간 (중지 요청이 있었으면 중지 소요 시간) 기록"""
+        self.append_log(f"🖥️ 작업 중 GUI 최대 멈춤: {self.stall_monitor.max_stall * 1000:.0f}ms")
+        if self.stop_requested_at is not None:
+            elapsed = time.perf_counter() - self.stop_requested_at
+            self.append_log(f"⏹️ 중지 요청 후 작업 종료까지: {elapsed * 1000:.0f}ms")
+            self.stop_requested_at = None
         
     def stop_player(self):
-        """학습 중지"""
+        """학습 중지 (모든 엔진 대기를 깨우고 브라우저 종료)"""
         if not self.is_running:
             return
             
         self.is_running = False
+        self.waiting_for_login = False
+        self.stop_requested_at = time.perf_counter()
         
-        if self.player_process:
-            try:
-                self.player_process.terminate()
-                self.player_process = None
-            except:
-                pass
+        if self.cancel_token:
+            self.cancel_token.cancel()
         
-        # 로그 워커는 daemon 스레드이므로 자동 종료됨
+        player, self.player_instance = self.player_instance, None
+        if player:
+            # chromedriver 종료는 시간이 걸릴 수 있으므로 GUI 스레드 밖에서 처리
+            # (daemon이 아니므로 프로그램 종료 전에 브라우저 정리가 끝남)
+            threading.Thread(target=player.stop, name="player-stop").start()
         
+        self.login_btn.setVisible(False)
+        self.start_btn.setVisible(True)
         self.start_btn.setEnabled(True)
         self.start_btn.setText("🚀 학습 시작")
         self.stop_btn.setEnabled(False)
         self.status_label.setText("중지됨")
-        self.log_text.addItem("⏹️ 사용자에 의해 중지되었습니다.")
+        self.append_log("⏹️ 사용자에 의해 중지되었습니다.")
+    
+    def closeEvent(self, event):
+        """창을 닫을 때 실행 중인 브라우저 정리"""
+        if self.cancel_token:
+            self.cancel_token.cancel()
+        if self.prewarmer:
+            self.prewarmer.discard()
+            self.prewarmer = None
+        if self.player_instance:
+            self.player_instance.stop()
+            self.player_instance = None
+        super().closeEvent(event)
     
     def run_learning_direct(self):
         """실행파일에서 직접 실행 - 터미널창 없이 실행"""
         
         # 초기 로그 메시지
-        self.log_text.addItem("🚀 스마트 학습 도우미 시작...")
-        self.log_text.addItem(f"📱 URL: {self.url_input.text()}")
-        self.log_text.addItem(f"📊 강의 수: {self.count_spinbox.value()}개")
-        self.log_text.addItem("🔐 브라우저에서 로그인을 완료한 후 '로그인 완료' 버튼을 클릭하세요!")
-        self.log_text.scrollToBottom()
+        self.append_log("🚀 스마트 학습 도우미 시작...")
+        self.append_log(f"📱 URL: {self.url_input.text()}")
+        self.append_log(f"📊 강의 수: {self.count_spinbox.value()}개")
+        self.append_log("🔐 브라우저에서 로그인하면 자동으로 감지합니다. ('로그인 완료' 버튼으로도 진행 가능)")
         
         # 로그인 대기 상태로 설정
         self.waiting_for_login = True
         self.start_btn.setVisible(False)
         self.login_btn.setVisible(True)
-        self.status_label.setText("브라우저에서 로그인을 완료한 후 '로그인 완료' 버튼을 클릭하세요")
-        
-        # 직접 모듈 import해서 실행 (터미널창 방지)
-        try:
-            self.log_text.addItem("🔄 학습 모듈 로딩 중...")
-            self.log_text.scrollToBottom()
+        self.status_label.setText("브라우저에서 로그인하면 자동으로 시작합니다 ('로그인 완료' 버튼으로도 진행 가능)")
+        
+        # 직접 모듈 import해서 실행 (터미널창 방지), 브라우저 실행은 작업 스레드에서
+        start_url = self.url_input.text()
+        max_videos = self.count_spinbox.value()
+        resume_point = self.ask_resume(start_url)
+        log_queue = self.log_queue
+        self.cancel_token = cancel_token = CancellationToken()
+        # 사전 실행한 브라우저는 첫 실행에서만 사용
+        prewarmer, self.prewarmer = self.prewarmer, None
+        
+        def launch(report):
+            cancel_token.raise_if_cancelled()
+            report("🔄 학습 모듈 로딩 중...")
             
             # auto_player 모듈 직접 import
             import ktedu_auto_player
             
-            # 플레이어 인스턴스 생성 및 저장
-            self.player_instance = ktedu_auto_player.KTEduAutoPlayer(
+            # 플레이어 인스턴스 생성
+            player = ktedu_auto_player.KTEduAutoPlayer(
                 headless=False, 
-                log_queue=self.log_queue,
+                log_queue=log_queue,
+                cancel_token=cancel_token,
+                prewarmer=prewarmer,
             )
+            # 브라우저 실행 중에도 중지 버튼으로 정리할 수 있도록 GUI 스레드에 바로 등록
+            self.player_created.emit(player)
+            if resume_point:
+                # 로그인 후 처음 강의부터 이동하지 않고 중단된 강의로 바로 이동
+                player.resume_from(resume_point)
             
-            self.log_text.addItem("🌐 브라우저 실행 중...")
-            self.log_text.scrollToBottom()
+            report("🌐 브라우저 실행 중...")
             
             # URL로 이동하고 로그인 대기
-            self.player_instance.play_videos_automatically(
-                start_url=self.url_input.text(),
-                max_videos=self.count_spinbox.value()
+            player.play_videos_automatically(
+                start_url=start_url,
+                max_videos=max_videos
             )
             
-            # 여기서는 로그인 대기 상태로 종료됨
-            
-        except Exception as e:
-            self.log_text.addItem(f"❌ 학습 오류: {str(e)}")
-            import traceback
-            self.log_text.addItem(f"📋 상세 오류: {traceback.format_exc()}")
-        finally:
-            self.log_text.scrollToBottom()
+            # 로그인 대기 (페이지 자동 감지 또는 '로그인 완료' 버튼)
+            cancel_token.raise_if_cancelled()
+            player.wait_for_login()
+            cancel_token.raise_if_cancelled()
+            return player
+        
+        # 브라우저가 준비될 때까지(LoginWaitingEvent) 로그인 완료 버튼 비활성화
+        self.login_btn.setEnabled(False)
+        self.run_engine_task(launch, self.on_browser_ready)
+    
+    def ask_resume(self, course_url):
+        """이전에 중단된 학습이 있으면 이어서 학습할지 물어봄 (이어서 하면 체크포인트, 아니면 None)"""
+        checkpoint = ResumeCheckpoint().load(course_url)
+        if not checkpoint:
+            return None
+        answer = QMessageBox.question(
+            self, "이어서 학습하기",
+            f"이전에 중단된 학습이 있습니다.\n{checkpoint.describe()}\n\n이어서 학습할까요?",
+            QMessageBox.Yes | QMessageBox.No, QMessageBox.Yes,
+        )
+        if answer == QMessageBox.Yes:
+            return checkpoint
+        self.append_log("🔄 저장된 기록을 무시하고 처음부터 학습합니다.")
+        return None
+    
+    def register_player(self, player):
+        """작업 스레드에서 만든 플레이어 등록 (등록 전에 중지했으면 바로 정리)"""
+        if player.cancel_token.cancelled:
+            threading.Thread(target=player.stop, name="player-stop").start()
+            return
+        self.player_instance = player
+    
+    def on_browser_ready(self, player):
+        """브라우저 실행 및 로그인 완료 - 학습 시작"""
+        self.player_instance = player
+        self.append_log("🚀 학습 시작!")
+        self.start_learning()
 
 def main():
     """메인 실행 함수"""
@@ -555,6 +782,19 @@ def main():
     window = SmartLearningGUI()
     window.show()
     
+    # 시작 시간 측정 모드 (benchmark_package.py): 첫 이벤트 루프 주기에서 시각 기록 후 종료
+    probe_path = os.environ.get(STARTUP_PROBE_ENV)
+    if probe_path:
+        def record_first_paint():
+            with open(probe_path, "w") as f:
+                f.write(repr(time.time()))
+            app.quit()
+        QTimer.singleShot(0, record_first_paint)
+    
+    # 사전 실행 모드: 사용자가 설정을 확인하는 동안 브라우저를 미리 실행
+    if prewarm_requested(sys.argv):
+        window.start_prewarm()
+    
     # 이벤트 루프 실행
     sys.exit(app.exec_())
 
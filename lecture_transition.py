@@ -0,0 +1,190 @@
+"""
+강의 전환 모듈
+다음 영상 버튼 클릭 후 새 강의가 실제로 로드되었는지 확인하고,
+아무 변화가 없으면 다시 클릭합니다.
+"""
+
+import time
+from dataclasses import dataclass
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import (
+    TimeoutException,
+    JavascriptException,
+    StaleElementReferenceException,
+    UnexpectedAlertPresentException,
+)
+from cancellation import CancellationToken
+
+# 다음 영상 버튼 선택자 (우선순위 순, '//'로 시작하면 XPath)
+NEXT_BUTTON_SELECTORS = [
+    ".btn-next-page",  # 클래스 기반
+    "//a[contains(text(), '다음영상')]",  # 텍스트 기반
+    "//a[contains(@class, 'btn-next-page')]"  # XPath 기반
+]
+
+# 클릭 한 번당 전환을 기다리는 최대 시간 (초)
+TRANSITION_TIMEOUT = 10
+
+# 전환이 없을 때 다시 클릭하는 최대 횟수
+MAX_CLICK_ATTEMPTS = 3
+
+# 현재 강의 식별 정보 (URL, 플레이어 src)
+IDENTITY_SCRIPT = """
+var v = document.querySelector('#myvideo video') || document.querySelector('video');
+return [location.href, v ? (v.currentSrc || v.src || '') : ''];
+"""
+
+# 선택자 목록에서 처음으로 보이는 다음 버튼 찾기 (한 번의 왕복)
+FIND_NEXT_BUTTON_SCRIPT = """
+var selectors = arguments[0];
+for (var i = 0; i < selectors.length; i++) {
+    var nodes = [];
+    try {
+        if (selectors[i].indexOf('//') === 0) {
+            var snap = document.evaluate(selectors[i], document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+            for (var k = 0; k < snap.snapshotLength; k++) { nodes.push(snap.snapshotItem(k)); }
+        } else {
+            nodes = document.querySelectorAll(selectors[i]);
+        }
+    } catch (e) { continue; }
+    for (var j = 0; j < nodes.length; j++) {
+        if (nodes[j].getClientRects().length) {
+            return [nodes[j], selectors[i], (nodes[j].textContent || '').trim(), nodes[j].getAttribute('onclick')];
+        }
+    }
+}
+return null;
+"""
+
+# 버튼이 아직 같은 문서에 있는지와 현재 강의 식별 정보
+PROBE_SCRIPT = """
+var btn = arguments[0];
+var v = document.querySelector('#myvideo video') || document.querySelector('video');
+return [location.href, v ? (v.currentSrc || v.src || '') : '', btn ? btn.isConnected : false];
+"""
+
+
+@dataclass
+class TransitionResult:
+    """강의 전환 결과"""
+    ok: bool
+    attempts: int = 0
+    latency: float = 0.0
+    from_url: str = ""
+    to_url: str = ""
+    reason: str = ""
+
+    def __bool__(self):
+        return self.ok
+
+
+class LectureTransition:
+    def __init__(self, driver, log_callback=None, timeout=TRANSITION_TIMEOUT, max_attempts=MAX_CLICK_ATTEMPTS,
+                 cancel_token=None):
+        """
+        강의 전환기 초기화
+
+        Args:
+            driver: Selenium WebDriver 인스턴스
+            log_callback (function): 로그 출력 콜백 함수
+            timeout (float): 클릭 한 번당 전환 대기 시간 (초)
+            max_attempts (int): 최대 클릭 횟수
+            cancel_token (CancellationToken): 중지 신호
+        """
+        self.driver = driver
+        self.log_callback = log_callback
+        self.cancel_token = cancel_token or CancellationToken()
+        self.timeout = timeout
+        self.max_attempts = max_attempts
+        self.last_result = None
+
+    def log(self, message):
+        """로그 출력"""
+        if self.log_callback:
+            self.log_callback(message)
+        else:
+            print(message)
+
+    def capture_identity(self):
+        """현재 강의 식별 정보 (URL, 플레이어 src)"""
+        url, src = self.driver.execute_script(IDENTITY_SCRIPT)
+        return url, src
+
+    def find_next_button(self):
+        """다음 영상 버튼 찾기 (요소, 선택자, 텍스트, onclick), 없으면 None"""
+        return self.driver.execute_script(FIND_NEXT_BUTTON_SCRIPT, NEXT_BUTTON_SELECTORS)
+
+    def go_next(self):
+        """다음 강의로 전환하고 새 강의가 로드될 때까지 확인"""
+        started = time.time()
+        from_url, from_src = self.capture_identity()
+        result = TransitionResult(ok=False, from_url=from_url)
+
+        for attempt in range(1, self.max_attempts + 1):
+            self.cancel_token.raise_if_cancelled()
+            found = self.find_next_button()
+            if found:
+                button, selector, button_text, onclick = found
+                if attempt == 1:
+                    self.log(f"🎯 다음 버튼 발견: '{button_text}' (onclick: {onclick})")
+                else:
+                    self.log(f"🔁 강의 전환이 감지되지 않아 다시 클릭합니다. ({attempt}/{self.max_attempts})")
+
+                # 스크롤해서 버튼이 보이도록 한 뒤 클릭
+                self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", button)
+                button.click()
+                if attempt == 1:
+                    self.log("✅ 다음 영상 버튼 클릭 성공!")
+            elif attempt == 1:
+                self.log("❌ 다음 영상 버튼을 찾을 수 없습니다.")
+                result.reason = "no-button"
+                break
+            else:
+                # 재시도 중 버튼이 사라졌다면 페이지가 바뀌는 중 -> 변화만 확인
+                button = None
+
+            result.attempts = attempt
+            try:
+                changed = self._wait_for_change(button, from_url, from_src)
+            except UnexpectedAlertPresentException:
+                # 버튼이 알림창을 띄운 경우 (다음 루프의 알림창 처리에서 처리됨)
+                self.log("🚨 전환 중 알림창이 떠서 확인을 중단합니다.")
+                result.ok = True
+                result.reason = "alert"
+                break
+            if changed:
+                result.ok = True
+                result.to_url = changed if isinstance(changed, str) else ""
+                result.reason = "changed"
+                break
+        else:
+            result.reason = "no-change"
+
+        result.latency = time.time() - started
+        if result.ok:
+            self.log(f"⏱️ 강의 전환 완료 ({result.latency:.2f}초, 클릭 {result.attempts}회)")
+        elif result.reason == "no-change":
+            self.log(f"⚠️ {result.attempts}회 클릭했지만 새 강의가 로드되지 않았습니다. ({result.latency:.2f}초)")
+        self.last_result = result
+        return result
+
+    def _wait_for_change(self, button, from_url, from_src):
+        """버튼이 사라지거나(staleness) URL/플레이어 src가 바뀔 때까지 대기, 바뀐 URL 반환"""
+        def changed(driver):
+            self.cancel_token.raise_if_cancelled()
+            try:
+                url, src, connected = driver.execute_script(PROBE_SCRIPT, button)
+            except StaleElementReferenceException:
+                return driver.current_url or True
+            if url != from_url or (from_src and src and src != from_src) or (button is not None and not connected):
+                return url
+            return False
+
+        try:
+            return WebDriverWait(
+                self.driver, self.timeout,
+                poll_frequency=0.1,
+                ignored_exceptions=(JavascriptException,),
+            ).until(changed)
+        except TimeoutException:
+            return False
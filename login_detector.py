@@ -0,0 +1,184 @@
+"""
+로그인 감지 모듈
+로그인 대기 중 current_url을 계속 조회하는 대신, 페이지 안에 설치한 리스너가
+URL/로그인 폼 변화를 기다렸다가 한 번에 알려주도록 하여 WebDriver 왕복을 줄입니다.
+GUI의 '로그인 완료' 버튼과 CLI 자동 감지가 같은 경로(LoginDetector.wait)를 사용합니다.
+"""
+
+import threading
+import time
+from selenium.common.exceptions import WebDriverException
+from cancellation import CancellationToken
+from engine_events import LoginWaitingEvent, LoggedInEvent
+
+# 로그인 페이지로 보는 URL 문구
+LOGIN_URL_MARKERS = ("login.do",)
+
+# 로그인 후 강의 페이지로 보는 URL 문구
+COURSE_URL_MARKERS = ("courseContents.do", "player", "contents")
+
+# 페이지 안에서 한 번에 기다리는 최대 시간 (초) - 버튼 클릭도 이 간격 안에 반영됨
+LISTEN_WINDOW = 2.0
+
+# 페이지 리스너를 쓸 수 없을 때 상태 확인 간격 (지수 백오프)
+BACKOFF_INITIAL = 0.5
+BACKOFF_MAX = 8.0
+
+# 페이지 안에서 URL/로그인 폼 변화를 기다렸다가 현재 상태를 돌려줌
+# (페이지 이동으로 스크립트가 끊기면 WebDriver 오류가 나므로 호출 쪽에서 바로 다시 확인)
+LISTEN_SCRIPT = """
+var loginMarkers = arguments[0], courseMarkers = arguments[1], windowMs = arguments[2];
+var done = arguments[arguments.length - 1];
+function snapshot() {
+    var href = location.href;
+    var pw = document.querySelector('input[type=password]');
+    var hasLoginForm = !!(pw && pw.offsetParent !== null);
+    return {url: href, title: document.title, hasLoginForm: hasLoginForm};
+}
+function loggedIn(s) {
+    var onLogin = loginMarkers.some(function (m) { return s.url.indexOf(m) !== -1; });
+    var onCourse = courseMarkers.some(function (m) { return s.url.indexOf(m) !== -1; });
+    return !onLogin && onCourse && !s.hasLoginForm;
+}
+var first = snapshot();
+if (loggedIn(first)) { done(first); return; }
+var finished = false, timer = null, observer = null;
+function finish() {
+    if (finished) { return; }
+    finished = true;
+    clearInterval(timer);
+    if (observer) { observer.disconnect(); }
+    window.removeEventListener('popstate', check);
+    window.removeEventListener('hashchange', check);
+    done(snapshot());
+}
+function check() { if (loggedIn(snapshot())) { finish(); } }
+window.addEventListener('popstate', check);
+window.addEventListener('hashchange', check);
+if (window.MutationObserver && document.body) {
+    observer = new MutationObserver(check);
+    observer.observe(document.body, {childList: true, subtree: true});
+}
+// SPA 방식 URL 변경(pushState)은 이벤트가 없으므로 페이지 안에서 확인
+timer = setInterval(check, 250);
+setTimeout(finish, windowMs);
+"""
+
+
+def is_logged_in_url(url):
+    """URL만으로 로그인 후 강의 페이지인지 판단"""
+    url = url or ""
+    return (
+        not any(marker in url for marker in LOGIN_URL_MARKERS)
+        and any(marker in url for marker in COURSE_URL_MARKERS)
+    )
+
+
+class LoginDetector:
+    def __init__(self, driver, log_callback=None, event_callback=None, cancel_token=None,
+                 listen_window=LISTEN_WINDOW):
+        """
+        로그인 감지기 초기화
+
+        Args:
+            driver: Selenium WebDriver 인스턴스
+            log_callback (function): 로그 출력 콜백 함수
+            event_callback (function): GUI로 이벤트를 보내는 함수
+            cancel_token (CancellationToken): 중지 신호
+            listen_window (float): 페이지 안에서 한 번에 기다리는 최대 시간 (초)
+        """
+        self.driver = driver
+        self.log_callback = log_callback
+        self.event_callback = event_callback
+        self.cancel_token = cancel_token or CancellationToken()
+        self.listen_window = listen_window
+        self._confirmed = threading.Event()
+        self._script_timeout = None
+        self.logged_in = False
+        self.checks = 0
+
+    def log(self, message):
+        """로그 출력"""
+        if self.log_callback:
+            self.log_callback(message)
+        else:
+            print(message)
+
+    def emit(self, event):
+        """GUI로 이벤트 전달"""
+        if self.event_callback:
+            self.event_callback(event)
+
+    def confirm(self):
+        """사용자가 로그인 완료를 직접 알림 (GUI 버튼, 어느 스레드에서나 호출 가능)"""
+        self._confirmed.set()
+
+    def wait(self, timeout=None):
+        """
+        로그인될 때까지 대기 (페이지 리스너 또는 확인 버튼), 로그인되면 LoggedInEvent를 한 번 보냄
+
+        Args:
+            timeout (float): 최대 대기 시간 (초, None이면 무기한)
+
+        Returns:
+            bool: 로그인 감지 여부 (중지 요청 시 LearningCancelled)
+        """
+        if self.logged_in:
+            return True
+        started = time.time()
+        backoff = BACKOFF_INITIAL
+        last_url = None
+        self._ensure_script_timeout()
+        self.emit(LoginWaitingEvent(self._current_url()))
+        self.log("⏳ 로그인 감지 대기 중... (로그인 후 강의 페이지로 이동하면 자동으로 진행됩니다)")
+
+        while True:
+            self.cancel_token.raise_if_cancelled()
+            if self._confirmed.is_set():
+                return self._finish("버튼", last_url or self._current_url(), started)
+            if timeout is not None and time.time() - started > timeout:
+                self.log("⚠️ 로그인 대기 시간 초과")
+                return False
+
+            self.checks += 1
+            try:
+                state = self.driver.execute_async_script(
+                    LISTEN_SCRIPT, list(LOGIN_URL_MARKERS), list(COURSE_URL_MARKERS),
+                    int(self.listen_window * 1000),
+                )
+                backoff = BACKOFF_INITIAL
+            except WebDriverException:
+                # 페이지 이동 중이면 스크립트가 끊김 - 잠시 후 다시 확인 (계속 실패하면 간격을 늘림)
+                self.cancel_token.sleep(backoff)
+                backoff = min(backoff * 2, BACKOFF_MAX)
+                continue
+
+            if not state:
+                continue
+            url = state.get("url") or ""
+            if url != last_url:
+                self.log(f"🔍 현재 상태: {state.get('title') or ''} | {url}")
+                last_url = url
+            if is_logged_in_url(url) and not state.get("hasLoginForm"):
+                return self._finish("자동 감지", url, started)
+
+    def _finish(self, method, url, started):
+        """로그인 완료 처리 (이벤트는 한 번만 보냄)"""
+        self.logged_in = True
+        waited = time.time() - started
+        self.log(f"✅ 로그인 완료 ({method}, {waited:.1f}초 대기, 상태 확인 {self.checks}회)")
+        self.emit(LoggedInEvent(url or "", method, waited))
+        return True
+
+    def _current_url(self):
+        try:
+            return self.driver.current_url
+        except WebDriverException:
+            return ""
+
+    def _ensure_script_timeout(self):
+        """비동기 스크립트 타임아웃을 대기 시간보다 넉넉하게 설정"""
+        needed = self.listen_window + 5
+        if self._script_timeout is None or self._script_timeout < needed:
+            self.driver.set_script_timeout(needed)
+            self._script_timeout = needed
@@ -0,0 +1,135 @@
+"""
+영상 이벤트 기록 모듈
+video 요소에 이벤트 리스너를 붙여 두고, 중요한 이벤트가 생길 때까지
+한 번의 execute_async_script 호출로 기다립니다.
+"""
+
+# video 요소의 재생 상태를 딕셔너리로 만드는 JS 함수 (스냅샷/이벤트 수집 공용)
+MEDIA_SNAPSHOT_FN = """
+function (v) {
+    if (!v) { return null; }
+    var buffered = [];
+    try {
+        for (var i = 0; i < v.buffered.length; i++) {
+            buffered.push([v.buffered.start(i), v.buffered.end(i)]);
+        }
+    } catch (e) {}
+    return {
+        currentTime: v.currentTime,
+        duration: v.duration,
+        paused: v.paused,
+        ended: v.ended,
+        readyState: v.readyState,
+        networkState: v.networkState,
+        playbackRate: v.playbackRate,
+        buffered: buffered
+    };
+}
+"""
+
+# 기록할 이벤트와 대기를 즉시 깨우는 이벤트
+RECORDED_EVENTS = ('ended', 'pause', 'play', 'waiting', 'stalled', 'timeupdate')
+IMPORTANT_EVENTS = ('ended', 'pause', 'waiting', 'stalled')
+
+# 페이지에 남겨두는 이벤트 최대 개수 (오래 방치되어도 메모리가 늘지 않도록)
+MAX_BUFFERED_EVENTS = 200
+
+INSTALL_SCRIPT = """
+var v = arguments[0], types = arguments[1], important = arguments[2], maxEvents = arguments[3];
+if (!v || v.tagName === undefined || v.tagName.toLowerCase() !== 'video') { return false; }
+if (v.__sldRecorder) { return true; }
+var rec = {events: [], lastTimeupdate: null, waiter: null, important: {}};
+important.forEach(function (t) { rec.important[t] = true; });
+types.forEach(function (type) {
+    v.addEventListener(type, function () {
+        var entry = {type: type, at: Date.now(), currentTime: v.currentTime};
+        if (type === 'timeupdate') {
+            rec.lastTimeupdate = entry;
+        } else {
+            rec.events.push(entry);
+            if (rec.events.length > maxEvents) { rec.events.shift(); }
+        }
+        if (rec.waiter && rec.important[type]) { rec.waiter(); }
+    });
+});
+v.__sldRecorder = rec;
+return true;
+"""
+
+DRAIN_SCRIPT = """
+var v = arguments[0], timeoutMs = arguments[1], done = arguments[arguments.length - 1];
+var snapshot = (""" + MEDIA_SNAPSHOT_FN + """);
+var rec = v && v.__sldRecorder;
+if (!rec) { done(null); return; }
+var timer = null;
+var finish = function () {
+    if (timer) { clearTimeout(timer); }
+    rec.waiter = null;
+    var events = rec.events;
+    var lastTimeupdate = rec.lastTimeupdate;
+    rec.events = [];
+    rec.lastTimeupdate = null;
+    done({events: events, lastTimeupdate: lastTimeupdate, state: snapshot(v)});
+};
+var pending = rec.events.some(function (e) { return rec.important[e.type]; });
+if (pending || v.ended || timeoutMs <= 0) { finish(); return; }
+timer = setTimeout(finish, timeoutMs);
+rec.waiter = finish;
+"""
+
+
+class MediaEventRecorder:
+    def __init__(self, driver, log_callback=None):
+        """
+        영상 이벤트 기록기 초기화
+
+        Args:
+            driver: Selenium WebDriver 인스턴스
+            log_callback (function): 로그 출력 콜백 함수
+        """
+        self.driver = driver
+        self.log_callback = log_callback
+        self._script_timeout = None
+
+    def log(self, message):
+        """로그 출력"""
+        if self.log_callback:
+            self.log_callback(message)
+        else:
+            print(message)
+
+    def install(self, video_element):
+        """video 요소에 이벤트 리스너 설치 (video 태그가 아니면 False)"""
+        try:
+            return bool(self.driver.execute_script(
+                INSTALL_SCRIPT, video_element,
+                list(RECORDED_EVENTS), list(IMPORTANT_EVENTS), MAX_BUFFERED_EVENTS
+            ))
+        except Exception as e:
+            self.log(f"⚠️ 영상 이벤트 기록기 설치 실패: {str(e)}")
+            return False
+
+    def drain(self, video_element, timeout):
+        """
+        중요한 이벤트가 생기거나 timeout(초)이 지날 때까지 대기 후 기록된 이벤트 반환
+
+        Returns:
+            dict: {'events': [...], 'last_timeupdate': {...}, 'state': {...}}
+            None: 기록기가 설치되어 있지 않은 경우 (요소가 교체됨 등)
+        """
+        self._ensure_script_timeout(timeout)
+        result = self.driver.execute_async_script(DRAIN_SCRIPT, video_element, int(timeout * 1000))
+        if result is None:
+            return None
+        return {
+            'events': result.get('events') or [],
+            'last_timeupdate': result.get('lastTimeupdate'),
+            'state': result.get('state'),
+        }
+
+    def _ensure_script_timeout(self, timeout):
+        """비동기 스크립트 타임아웃을 대기 시간보다 넉넉하게 설정"""
+        needed = timeout + 5
+        if self._script_timeout is None or self._script_timeout < needed:
+            self.driver.set_script_timeout(needed)
+            self._script_timeout = needed
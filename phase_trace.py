@@ -0,0 +1,142 @@
+"""
+단계별 시간 기록(트레이스) 모듈
+드라이버 준비, 페이지 이동, 플레이어 탐색, 재생 방법별 시도, 재생 모니터링, 강의 전환,
+준비 대기와 sleep 구간을 Chrome trace-event 형식(JSON)으로 기록합니다.
+저장된 파일을 chrome://tracing 또는 https://ui.perfetto.dev 에서 열면
+강의 사이에 시간이 어디에 쓰였는지 타임라인으로 볼 수 있습니다.
+"""
+
+import os
+import time
+import threading
+from contextlib import contextmanager, nullcontext
+from app_paths import get_app_data_path, write_json_atomic
+
+TRACE_DIR_NAME = "traces"
+
+# 환경변수 설정: SMART_LEARNING_TRACE=1 (기본 폴더에 저장) 또는 파일 경로
+TRACE_ENV = "SMART_LEARNING_TRACE"
+
+# 구간 분류 (트레이스 뷰어의 category)
+CAT_SETUP = "setup"
+CAT_NAVIGATION = "navigation"
+CAT_PLAY = "play"
+CAT_WAIT = "wait"
+CAT_SLEEP = "sleep"
+CAT_LECTURE = "lecture"
+
+
+def default_trace_path():
+    """기본 트레이스 파일 경로 (실행마다 새 파일)"""
+    folder = get_app_data_path(TRACE_DIR_NAME)
+    os.makedirs(folder, exist_ok=True)
+    return os.path.join(folder, time.strftime("trace-%Y%m%d-%H%M%S.json"))
+
+
+def trace_path_from_env():
+    """환경변수로 지정한 트레이스 파일 경로 (지정하지 않았으면 None)"""
+    value = os.environ.get(TRACE_ENV, "").strip()
+    if not value or value.lower() in ("0", "false", "no", "off"):
+        return None
+    if value.lower() in ("1", "true", "yes", "on"):
+        return default_trace_path()
+    return os.path.abspath(os.path.expanduser(value))
+
+
+class PhaseTracer:
+    def __init__(self, path=None, log_callback=None):
+        """
+        단계별 시간 기록기 초기화
+
+        Args:
+            path (str): 트레이스 저장 파일 (None이면 기록하지 않음)
+            log_callback (function): 로그 출력 콜백 함수
+        """
+        self.path = path
+        self.log_callback = log_callback
+        self.enabled = bool(path)
+        self.events = []
+        self._origin = time.perf_counter()
+        self._pid = os.getpid()
+        self._threads = set()
+        self._written = 0
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()  # 저장은 한 번에 하나씩 (늦게 찍은 스냅샷이 먼저 찍은 것에 덮이지 않도록)
+
+    def log(self, message):
+        """로그 출력"""
+        if self.log_callback:
+            self.log_callback(message)
+        else:
+            print(message)
+
+    def _now_us(self):
+        return (time.perf_counter() - self._origin) * 1_000_000
+
+    def _add(self, event):
+        """이벤트 추가 (스레드마다 처음 한 번 스레드 이름도 기록)"""
+        thread = threading.current_thread()
+        tid = thread.ident
+        event["pid"] = self._pid
+        event["tid"] = tid
+        with self._lock:
+            if tid not in self._threads:
+                self._threads.add(tid)
+                self.events.append({
+                    "name": "thread_name", "ph": "M", "pid": self._pid, "tid": tid,
+                    "args": {"name": thread.name},
+                })
+            self.events.append(event)
+
+    def span(self, name, category, **args):
+        """with 블록의 시작~끝을 구간 하나로 기록 (기록하지 않으면 아무 일도 하지 않음)"""
+        if not self.enabled:
+            return nullcontext()
+        return self._span(name, category, args)
+
+    @contextmanager
+    def _span(self, name, category, args):
+        started = self._now_us()
+        try:
+            yield
+        finally:
+            event = {"name": name, "cat": category, "ph": "X", "ts": round(started, 1),
+                     "dur": round(self._now_us() - started, 1)}
+            if args:
+                event["args"] = args
+            self._add(event)
+
+    def instant(self, name, category, **args):
+        """한 시점 표시 (예: 강의 시작)"""
+        if not self.enabled:
+            return
+        event = {"name": name, "cat": category, "ph": "i", "s": "p", "ts": round(self._now_us(), 1)}
+        if args:
+            event["args"] = args
+        self._add(event)
+
+    def sleep(self, cancel_token, seconds, reason):
+        """cancel_token.sleep을 sleep 구간으로 기록하며 실행"""
+        with self.span(reason, CAT_SLEEP, seconds=seconds):
+            cancel_token.sleep(seconds)
+
+    def write(self):
+        """지금까지의 기록을 파일로 저장 (실행 중 여러 번 호출해도 같은 파일을 갱신, 새 기록이 없으면 건너뜀)"""
+        if not self.enabled:
+            return None
+        with self._write_lock:
+            with self._lock:
+                if len(self.events) == self._written:
+                    return self.path
+                events = list(self.events)
+            try:
+                folder = os.path.dirname(self.path)
+                if folder:
+                    os.makedirs(folder, exist_ok=True)
+                write_json_atomic(self.path, {"traceEvents": events, "displayTimeUnit": "ms"})
+            except OSError as e:
+                self.log(f"⚠️ 트레이스 저장 실패: {str(e)}")
+                return None
+            self._written = len(events)
+        self.log(f"💾 단계별 시간 기록 저장: {self.path} (구간 {len(events)}개, chrome://tracing 또는 ui.perfetto.dev에서 열기)")
+        return self.path
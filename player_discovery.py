@@ -0,0 +1,156 @@
+"""
+영상 플레이어 탐색 모듈
+페이지 안에서 한 번의 스크립트로 플레이어 후보를 찾아 순위를 매기고,
+사이트별로 찾은 선택자를 디스크에 기억해 다음 강의에서 바로 사용합니다.
+"""
+
+import time
+from urllib.parse import urlparse
+from app_paths import get_app_data_path, load_json, write_json_atomic
+
+# Video.js에서 실제 video 태그 찾기 (우선순위 순)
+VIDEO_SELECTORS = [
+    "#myvideo video",     # Video.js 컨테이너 내부의 실제 video
+    "#myvideo .vjs-tech", # Video.js 기술 레이어
+    ".vjs-tech",          # Video.js 기술 레이어 (일반)
+    "video",              # HTML5 video 태그 (일반)
+    "#myvideo",           # Video.js 컨테이너 (마지막 시도)
+    "iframe",             # iframe 내부 영상
+    ".video-player",      # 일반적인 비디오 플레이어 클래스
+    "[class*='video']",   # video가 포함된 클래스
+    "[id*='video']",      # video가 포함된 ID
+]
+
+SELECTOR_CACHE_FILE = "player_selectors.json"
+
+# 후보 순위: video 태그 > 선택자 우선순위 > 화면 면적
+DISCOVERY_SCRIPT = """
+var selectors = arguments[0];
+var visible = function (el) {
+    if (!el.getClientRects().length) { return false; }
+    var style = window.getComputedStyle(el);
+    return style.visibility !== 'hidden' && style.display !== 'none';
+};
+var best = null, candidates = 0;
+for (var i = 0; i < selectors.length; i++) {
+    var nodes;
+    try { nodes = document.querySelectorAll(selectors[i]); } catch (e) { continue; }
+    for (var j = 0; j < nodes.length; j++) {
+        var el = nodes[j];
+        if (!visible(el)) { continue; }
+        candidates++;
+        var rect = el.getBoundingClientRect();
+        var tag = el.tagName.toLowerCase();
+        var score = (tag === 'video' ? 1000000 : 0)
+            + (selectors.length - i) * 10000
+            + Math.min(rect.width * rect.height / 100, 9999);
+        if (!best || score > best.score) {
+            best = {element: el, selector: selectors[i], tag: tag, score: score};
+        }
+    }
+}
+if (!best) { return [null, null, null, candidates]; }
+return [best.element, best.selector, best.tag, candidates];
+"""
+
+
+class PlayerSelectorCache:
+    def __init__(self, path=None):
+        """
+        사이트(URL 패턴)별 플레이어 선택자 캐시
+
+        Args:
+            path (str): 캐시 파일 경로 (기본: 애플리케이션 데이터 폴더)
+        """
+        self.path = path or get_app_data_path(SELECTOR_CACHE_FILE)
+        entries = load_json(self.path, default={})
+        self.entries = entries if isinstance(entries, dict) else {}
+
+    @staticmethod
+    def url_pattern(url):
+        """쿼리스트링을 뺀 호스트+경로를 URL 패턴으로 사용"""
+        parsed = urlparse(url or "")
+        return f"{parsed.netloc}{parsed.path}"
+
+    def get(self, url):
+        """URL 패턴에 저장된 선택자 (없으면 None)"""
+        entry = self.entries.get(self.url_pattern(url))
+        return entry.get("selector") if entry else None
+
+    def put(self, url, selector):
+        """URL 패턴에 선택자 저장"""
+        pattern = self.url_pattern(url)
+        entry = self.entries.get(pattern) or {}
+        if entry.get("selector") == selector:
+            return
+        self.entries[pattern] = {"selector": selector, "updated": time.time()}
+        self._save()
+
+    def forget(self, url):
+        """더 이상 맞지 않는 선택자 삭제"""
+        if self.entries.pop(self.url_pattern(url), None) is not None:
+            self._save()
+
+    def _save(self):
+        try:
+            write_json_atomic(self.path, self.entries)
+        except OSError:
+            pass
+
+
+class PlayerDiscovery:
+    def __init__(self, driver, log_callback=None, cache=None):
+        """
+        영상 플레이어 탐색기 초기화
+
+        Args:
+            driver: Selenium WebDriver 인스턴스
+            log_callback (function): 로그 출력 콜백 함수
+            cache (PlayerSelectorCache): 선택자 캐시 (기본: 디스크 캐시)
+        """
+        self.driver = driver
+        self.log_callback = log_callback
+        self.cache = cache or PlayerSelectorCache()
+
+    def log(self, message):
+        """로그 출력"""
+        if self.log_callback:
+            self.log_callback(message)
+        else:
+            print(message)
+
+    def find_player(self, url):
+        """
+        플레이어 요소 탐색 (캐시된 선택자 -> 전체 탐색 순)
+
+        Returns:
+            tuple: (요소, 선택자, 태그 이름), 못 찾으면 (None, None, None)
+        """
+        cached = self.cache.get(url)
+        if cached:
+            element, selector, tag, _ = self._run([cached])
+            if element is not None and tag == "video":
+                self.log(f"⚡ 캐시된 선택자로 플레이어 발견: {selector}")
+                return element, selector, tag
+            self.log(f"🔄 캐시된 선택자({cached})가 맞지 않아 전체 탐색합니다.")
+            self.cache.forget(url)
+
+        element, selector, tag, candidates = self._run(VIDEO_SELECTORS)
+        if element is None:
+            return None, None, None
+
+        if tag == "video":
+            self.log(f"✅ 실제 video 태그 발견: {selector} (후보 {candidates}개)")
+            self.cache.put(url, selector)
+        else:
+            self.log(f"📦 영상 컨테이너 발견: {selector} (태그: {tag}, 후보 {candidates}개)")
+        return element, selector, tag
+
+    def _run(self, selectors):
+        """탐색 스크립트 실행"""
+        try:
+            result = self.driver.execute_script(DISCOVERY_SCRIPT, list(selectors))
+        except Exception as e:
+            self.log(f"⚠️ 플레이어 탐색 스크립트 실패: {str(e)}")
+            return None, None, None, 0
+        return tuple(result) if result else (None, None, None, 0)
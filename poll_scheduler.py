@@ -0,0 +1,73 @@
+"""
+재생 모니터링 주기 조절 모듈
+남은 재생 시간, 최근 버퍼링 기록, 재생 속도를 보고 다음 확인 시점을 정합니다.
+강의 중간에는 드물게, 끝나갈 때나 버퍼링 중에는 촘촘하게 확인합니다.
+"""
+
+import time
+from dataclasses import dataclass
+
+
+@dataclass
+class PollPolicy:
+    """모니터링 주기 정책 (단위: 초)"""
+    min_interval: float = 1.0       # 가장 촘촘한 확인 간격
+    max_interval: float = 30.0      # 강의 중간의 가장 드문 확인 간격
+    unknown_interval: float = 3.0   # 영상 길이를 아직 모를 때
+    stall_interval: float = 2.0     # 버퍼링/일시정지 직후
+    stall_memory: float = 60.0      # 버퍼링 후 촘촘한 확인을 유지하는 시간
+    end_margin: float = 5.0         # 종료 예상 시점 이 시간 전부터는 min_interval
+    remaining_fraction: float = 0.5 # 남은 시간의 이 비율만큼 쉬고 다시 확인
+
+
+class AdaptivePollScheduler:
+    def __init__(self, policy=None):
+        """
+        모니터링 주기 조절기 초기화
+
+        Args:
+            policy (PollPolicy): 주기 정책 (기본값 사용 시 None)
+        """
+        self.policy = policy or PollPolicy()
+        self.reset()
+
+    def reset(self):
+        """강의별 기록 초기화"""
+        self.probes = 0
+        self.last_stall_at = None
+
+    def record_stall(self, now=None):
+        """버퍼링/정지 발생 기록"""
+        self.last_stall_at = now if now is not None else time.time()
+
+    def recently_stalled(self, now=None):
+        """최근 stall_memory 초 안에 버퍼링/정지가 있었는지"""
+        if self.last_stall_at is None:
+            return False
+        now = now if now is not None else time.time()
+        return now - self.last_stall_at < self.policy.stall_memory
+
+    def next_interval(self, state, now=None):
+        """
+        다음 확인까지 기다릴 시간 (초)
+
+        Args:
+            state (MediaState): 마지막으로 확인한 재생 상태 (없으면 None)
+        """
+        policy = self.policy
+        self.probes += 1
+
+        if state is None or not state.duration:
+            return policy.unknown_interval
+        if state.paused or self.recently_stalled(now):
+            return policy.stall_interval
+
+        rate = state.playback_rate if state.playback_rate and state.playback_rate > 0 else 1.0
+        remaining_wall = (state.remaining or 0.0) / rate
+        if remaining_wall <= policy.end_margin:
+            return policy.min_interval
+
+        interval = remaining_wall * policy.remaining_fraction
+        # 종료 예상 시점 직전에 한 번 깨어나도록 맞춤
+        interval = min(interval, remaining_wall - policy.end_margin)
+        return max(policy.min_interval, min(interval, policy.max_interval))
@@ -0,0 +1,146 @@
+"""
+준비 상태 대기 모듈
+고정된 time.sleep 대신 WebDriverWait로 조건이 만족되는 즉시 다음 단계로 넘어갑니다.
+"""
+
+import time
+from dataclasses import dataclass
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import (
+    TimeoutException,
+    JavascriptException,
+    StaleElementReferenceException,
+    UnexpectedAlertPresentException,
+)
+from cancellation import CancellationToken
+from phase_trace import PhaseTracer, CAT_WAIT
+
+# HTMLMediaElement.readyState 값
+HAVE_METADATA = 1
+HAVE_FUTURE_DATA = 3
+
+# 조건 확인 간격 (초) - 중지 요청도 이 간격 안에 반영됨
+POLL_FREQUENCY = 0.1
+
+# 컨테이너가 넘어와도 내부 video 태그의 상태를 읽도록 처리
+MEDIA_PROBE_SCRIPT = """
+var el = arguments[0];
+var v = (el && el.tagName && el.tagName.toLowerCase() === 'video') ? el : (el && el.querySelector ? el.querySelector('video') : null);
+if (!v) { return null; }
+return {readyState: v.readyState, currentTime: v.currentTime, paused: v.paused};
+"""
+
+
+@dataclass
+class ReadinessResult:
+    """대기 결과 (조건 만족 여부와 실제로 기다린 시간)"""
+    ok: bool
+    waited: float
+    label: str = ""
+
+    def __bool__(self):
+        return self.ok
+
+
+class ReadinessWaiter:
+    def __init__(self, driver, log_callback=None, poll_frequency=POLL_FREQUENCY, cancel_token=None, tracer=None,
+                 alert_handler=None):
+        """
+        준비 상태 대기기 초기화
+
+        Args:
+            driver: Selenium WebDriver 인스턴스
+            log_callback (function): 로그 출력 콜백 함수
+            poll_frequency (float): 조건 확인 간격 (초)
+            cancel_token (CancellationToken): 중지 신호 (확인할 때마다 검사)
+            tracer (PhaseTracer): 대기 구간 기록기 (기록하지 않으면 None)
+            alert_handler (function): 대기 중 알림창이 뜨면 호출해 닫는 함수 (예: VideoPlayer.handle_alerts)
+        """
+        self.driver = driver
+        self.log_callback = log_callback
+        self.cancel_token = cancel_token or CancellationToken()
+        self.tracer = tracer or PhaseTracer()
+        self.poll_frequency = poll_frequency
+        self.alert_handler = alert_handler
+        self.total_waited = 0.0
+
+    def log(self, message):
+        """로그 출력"""
+        if self.log_callback:
+            self.log_callback(message)
+        else:
+            print(message)
+
+    def wait_until(self, condition, timeout, label):
+        """
+        condition(driver)이 참이 될 때까지 대기하고 걸린 시간을 기록 (중지 요청 시 LearningCancelled)
+        페이지를 열 때 뜬 알림창 때문에 명령이 실패하면 알림창을 닫고 남은 시간 동안 다시 대기
+        """
+        started = time.time()
+        deadline = started + timeout
+        ok = True
+
+        def guarded(driver):
+            self.cancel_token.raise_if_cancelled()
+            return condition(driver)
+
+        with self.tracer.span(label, CAT_WAIT, timeout=timeout):
+            while True:
+                try:
+                    WebDriverWait(
+                        self.driver, max(0.0, deadline - time.time()),
+                        poll_frequency=self.poll_frequency,
+                        ignored_exceptions=(JavascriptException, StaleElementReferenceException),
+                    ).until(guarded)
+                    break
+                except TimeoutException:
+                    ok = False
+                    break
+                except UnexpectedAlertPresentException as e:
+                    self._handle_alert(e, label)
+                    if time.time() >= deadline:
+                        ok = False
+                        break
+        waited = time.time() - started
+        self.total_waited += waited
+        if ok:
+            self.log(f"⏱️ {label} 완료 ({waited:.2f}초 대기)")
+        else:
+            self.log(f"⚠️ {label} 대기 시간 초과 ({waited:.2f}초)")
+        return ReadinessResult(ok, waited, label)
+
+    def _handle_alert(self, error, label):
+        """대기 중 뜬 알림창 처리 (아직 열려 있으면 alert_handler로 수락)"""
+        handled = self.alert_handler() if self.alert_handler else False
+        if not handled:
+            # 브라우저가 이미 알림창을 닫은 경우 (unhandledPromptBehavior) 내용만 기록
+            self.log(f"🚨 {label} 중 알림창 감지: '{error.alert_text or ''}'")
+
+    def wait_for_document_ready(self, timeout=30):
+        """document.readyState가 complete가 될 때까지 대기"""
+        return self.wait_until(
+            lambda d: d.execute_script("return document.readyState") == "complete",
+            timeout, "페이지 로딩",
+        )
+
+    def wait_for_media_metadata(self, video_element, timeout=15):
+        """video의 readyState가 HAVE_METADATA 이상이 될 때까지 대기"""
+        def metadata_loaded(driver):
+            probe = driver.execute_script(MEDIA_PROBE_SCRIPT, video_element)
+            return bool(probe) and (probe.get("readyState") or 0) >= HAVE_METADATA
+        return self.wait_until(metadata_loaded, timeout, "영상 메타데이터 로딩")
+
+    def wait_for_playback_advancing(self, video_element, timeout=5, min_advance=0.2):
+        """currentTime이 실제로 증가하는지(재생 중인지) 확인될 때까지 대기"""
+        baseline = {}
+
+        def advancing(driver):
+            probe = driver.execute_script(MEDIA_PROBE_SCRIPT, video_element)
+            if not probe:
+                return False
+            current = probe.get("currentTime") or 0.0
+            if "time" not in baseline:
+                baseline["time"] = current
+                return False
+            return not probe.get("paused") and current - baseline["time"] >= min_advance
+        return self.wait_until(advancing, timeout, "재생 시작 확인")
@@ -0,0 +1,115 @@
+"""
+브라우저 자원 감시 모듈
+강의 사이마다 chromedriver/Chrome 프로세스 트리의 메모리(RSS)와 CPU 사용량을 확인하고,
+설정한 기준을 넘으면 브라우저를 다시 시작하도록 알려줍니다.
+psutil이 없으면 감시 없이 동작합니다.
+"""
+
+import time
+from dataclasses import dataclass, field
+
+try:
+    import psutil
+    _PSUTIL_AVAILABLE = True
+except ImportError:
+    _PSUTIL_AVAILABLE = False
+
+
+@dataclass
+class GovernorPolicy:
+    """브라우저 재시작 기준"""
+    max_rss_mb: float = 2048.0          # 프로세스 트리 메모리 합계가 넘으면 재시작
+    max_cpu_percent: float = None       # 프로세스 트리 CPU 사용률이 넘으면 재시작 (None이면 사용 안 함)
+    recycle_every: int = 0              # 이 강의 수마다 무조건 재시작 (0이면 사용 안 함)
+    min_lectures_between: int = 3       # 재시작 후 최소 이 강의 수만큼은 다시 재시작하지 않음
+
+
+@dataclass
+class ResourceSample:
+    """프로세스 트리 자원 사용량"""
+    rss_mb: float
+    cpu_percent: float
+    processes: int
+    taken_at: float = field(default_factory=time.time)
+
+    def __str__(self):
+        return f"메모리 {self.rss_mb:.0f}MB, CPU {self.cpu_percent:.0f}%, 프로세스 {self.processes}개"
+
+
+class ResourceGovernor:
+    def __init__(self, policy=None, log_callback=None):
+        """
+        브라우저 자원 감시기 초기화
+
+        Args:
+            policy (GovernorPolicy): 재시작 기준 (기본값 사용 시 None)
+            log_callback (function): 로그 출력 콜백 함수
+        """
+        self.policy = policy or GovernorPolicy()
+        self.log_callback = log_callback
+        self.enabled = _PSUTIL_AVAILABLE
+        self.lectures_since_recycle = 0
+        self.recycles = 0
+        self._processes = {}  # pid -> psutil.Process (CPU 사용률은 이전 측정과 비교해 계산됨)
+        if not self.enabled:
+            self.log("💡 psutil이 설치되어 있지 않아 브라우저 메모리/CPU 감시를 사용하지 않습니다. (pip install psutil)")
+
+    def log(self, message):
+        """로그 출력"""
+        if self.log_callback:
+            self.log_callback(message)
+        else:
+            print(message)
+
+    def sample(self, driver):
+        """드라이버의 chromedriver 프로세스와 하위 프로세스(Chrome, 렌더러 등) 사용량 (측정 불가 시 None)"""
+        if not self.enabled:
+            return None
+        process = getattr(getattr(driver, "service", None), "process", None)
+        if process is None or process.poll() is not None:
+            # 실행 중인 Chrome에 연결한 경우 등 chromedriver 프로세스가 없음
+            return None
+        try:
+            root = psutil.Process(process.pid)
+            tree = [root] + root.children(recursive=True)
+        except psutil.Error:
+            return None
+
+        rss = 0
+        cpu = 0.0
+        alive = {}
+        for proc in tree:
+            # 같은 pid는 이전 Process 객체를 재사용해야 CPU 사용률이 계산됨
+            proc = self._processes.get(proc.pid, proc)
+            try:
+                rss += proc.memory_info().rss
+                cpu += proc.cpu_percent(interval=None)
+            except psutil.Error:
+                continue
+            alive[proc.pid] = proc
+        self._processes = alive
+        return ResourceSample(rss / (1024 * 1024), cpu, len(alive))
+
+    def lecture_finished(self):
+        """강의 하나가 끝났음을 기록"""
+        self.lectures_since_recycle += 1
+
+    def recycle_reason(self, sample):
+        """재시작이 필요하면 이유 문자열, 아니면 None"""
+        policy = self.policy
+        if policy.recycle_every and self.lectures_since_recycle >= policy.recycle_every:
+            return f"강의 {self.lectures_since_recycle}개마다 재시작"
+        if sample is None or self.lectures_since_recycle < max(1, policy.min_lectures_between):
+            # 재시작 직후에는 메모리가 다시 차오르는 중이므로 기준 확인을 잠시 미룸
+            return None
+        if policy.max_rss_mb and sample.rss_mb > policy.max_rss_mb:
+            return f"메모리 {sample.rss_mb:.0f}MB > 기준 {policy.max_rss_mb:.0f}MB"
+        if policy.max_cpu_percent and sample.cpu_percent > policy.max_cpu_percent:
+            return f"CPU {sample.cpu_percent:.0f}% > 기준 {policy.max_cpu_percent:.0f}%"
+        return None
+
+    def recycled(self):
+        """재시작 완료 기록"""
+        self.recycles += 1
+        self.lectures_since_recycle = 0
+        self._processes = {}
@@ -0,0 +1,144 @@
+"""
+이어서 학습하기(체크포인트) 모듈
+강의가 바뀔 때마다 현재 강의 URL, 강의 번호, 재생 위치, 시각을 파일에 원자적으로 저장합니다.
+Chrome이나 프로그램이 중간에 종료되어도 다음 실행에서 처음 강의부터 다시 이동하지 않고
+마지막 강의로 바로 이동해 이어서 학습할 수 있습니다.
+"""
+
+import os
+import re
+import time
+from dataclasses import dataclass, asdict
+from urllib.parse import urlparse, parse_qs
+from app_paths import get_app_data_path, load_json, write_json_atomic
+
+CHECKPOINT_DIR_NAME = "resume"
+CHECKPOINT_VERSION = 1
+
+# 재생 위치는 이 간격(초)마다만 저장 (강의 전환 시에는 항상 저장)
+POSITION_SAVE_INTERVAL = 15.0
+
+
+def course_key(url):
+    """과정 식별값 (classId가 있으면 classId, 없으면 쿼리를 뺀 주소)"""
+    parsed = urlparse(url or "")
+    class_id = parse_qs(parsed.query).get("classId")
+    if class_id:
+        return class_id[0]
+    return f"{parsed.netloc}{parsed.path}"
+
+
+def checkpoint_file_name(url):
+    """과정별 체크포인트 파일 이름 (과정마다 따로 저장해 서로 덮어쓰지 않음)"""
+    return re.sub(r"[^A-Za-z0-9_.-]", "_", course_key(url))[:100] + ".json"
+
+
+@dataclass
+class Checkpoint:
+    """마지막으로 학습 중이던 강의"""
+    course_url: str                 # 사용자가 입력한 과정 주소
+    lecture_url: str                # 학습 중이던 강의 페이지 주소
+    video_count: int                # 학습 중이던 강의 번호 (1부터)
+    position: float = 0.0           # 재생 위치 (초)
+    duration: float = 0.0           # 영상 길이 (초, 모르면 0)
+    started_at: float = 0.0         # 이번 학습을 시작한 시각
+    updated_at: float = 0.0         # 마지막으로 저장한 시각
+    version: int = CHECKPOINT_VERSION
+
+    def describe(self):
+        """사용자에게 보여줄 요약"""
+        saved = time.strftime("%Y-%m-%d %H:%M", time.localtime(self.updated_at))
+        minutes, seconds = divmod(int(self.position), 60)
+        return f"강의 #{self.video_count} ({minutes}분 {seconds:02d}초 지점, {saved} 저장)"
+
+
+class ResumeCheckpoint:
+    def __init__(self, folder=None, log_callback=None):
+        """
+        체크포인트 저장소 초기화
+
+        Args:
+            folder (str): 체크포인트 폴더 (기본값 사용 시 None)
+            log_callback (function): 로그 출력 콜백 함수
+        """
+        self.folder = folder or get_app_data_path(CHECKPOINT_DIR_NAME)
+        self.log_callback = log_callback
+        self.current = None
+        self._position_saved_at = 0.0
+
+    def log(self, message):
+        """로그 출력"""
+        if self.log_callback:
+            self.log_callback(message)
+        else:
+            print(message)
+
+    def path_for(self, course_url):
+        """과정의 체크포인트 파일 경로"""
+        return os.path.join(self.folder, checkpoint_file_name(course_url))
+
+    def load(self, course_url):
+        """
+        과정의 체크포인트 읽기
+
+        Args:
+            course_url (str): 과정 주소
+
+        Returns:
+            Checkpoint: 없거나, 깨졌거나, 다른 과정이면 None
+        """
+        data = load_json(self.path_for(course_url))
+        if not isinstance(data, dict) or data.get("version") != CHECKPOINT_VERSION:
+            return None
+        try:
+            checkpoint = Checkpoint(**data)
+        except TypeError:
+            return None
+        if not checkpoint.lecture_url or checkpoint.video_count < 1:
+            return None
+        if course_key(course_url) != course_key(checkpoint.course_url):
+            return None
+        return checkpoint
+
+    def lecture_started(self, course_url, lecture_url, video_count, started_at=None):
+        """새 강의로 넘어갈 때 저장 (재생 위치는 0부터)"""
+        previous = self.current
+        self.current = Checkpoint(
+            course_url=course_url or lecture_url,
+            lecture_url=lecture_url,
+            video_count=video_count,
+            started_at=started_at or (previous.started_at if previous else time.time()),
+        )
+        self._save()
+
+    def update_position(self, position, duration=0.0, force=False):
+        """재생 위치 갱신 (POSITION_SAVE_INTERVAL마다만 파일에 저장)"""
+        if not self.current:
+            return
+        self.current.position = position or 0.0
+        self.current.duration = duration or 0.0
+        if force or time.time() - self._position_saved_at >= POSITION_SAVE_INTERVAL:
+            self._save()
+
+    def clear(self):
+        """과정을 끝까지 학습했으면 체크포인트 삭제"""
+        if not self.current:
+            return
+        path = self.path_for(self.current.course_url)
+        self.current = None
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            self.log(f"⚠️ 체크포인트 삭제 실패: {str(e)}")
+
+    def _save(self):
+        self.current.updated_at = time.time()
+        self._position_saved_at = self.current.updated_at
+        try:
+            os.makedirs(self.folder, exist_ok=True)
+            write_json_atomic(self.path_for(self.current.course_url), asdict(self.current))
+        except OSError as e:
+            # 저장 실패는 학습을 멈출 이유가 아님
+            self.log(f"⚠️ 체크포인트 저장 실패: {str(e)}")
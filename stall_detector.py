@@ -0,0 +1,136 @@
+"""
+재생 정지 감지 모듈
+진행률(%) 대신 벽시계 1초당 currentTime 증가량, 앞쪽 버퍼 길이, networkState로
+버퍼링/일시정지/디코더 멈춤/정상 재생(긴 강의 포함)을 구분하고 복구 방법을 정합니다.
+"""
+
+import time
+from dataclasses import dataclass
+
+# 재생 상태 구분
+HEALTHY = "healthy"       # 정상 재생 (긴 강의라 진행률이 천천히 올라도 정상)
+STARTING = "starting"     # 첫 확인이라 아직 판단 불가
+BUFFERING = "buffering"   # 데이터를 기다리는 중
+PAUSED = "paused"         # 일시정지됨
+FROZEN = "frozen"         # 데이터는 있는데 currentTime이 멈춤 (디코더 멈춤)
+ENDED = "ended"           # 재생 완료
+
+# 복구 방법
+ACTION_NONE = "none"      # 할 일 없음
+ACTION_WAIT = "wait"      # 조금 더 기다림
+ACTION_RESUME = "resume"  # play() 재호출
+ACTION_NUDGE = "nudge"    # 현재 위치로 다시 탐색(seek)해서 디코더/네트워크를 깨움
+ACTION_SKIP = "skip"      # 포기하고 다음 강의로
+
+# HTMLMediaElement 상수
+HAVE_FUTURE_DATA = 3
+NETWORK_LOADING = 2
+NETWORK_NO_SOURCE = 3
+
+
+@dataclass
+class StallVerdict:
+    """재생 상태 판정 결과"""
+    condition: str
+    action: str
+    rate: float = 0.0          # 벽시계 1초당 currentTime 증가량
+    stalled_for: float = 0.0   # 진행이 멈춘 지 지난 시간 (초)
+
+    @property
+    def healthy(self):
+        return self.condition in (HEALTHY, STARTING, ENDED)
+
+
+class StallDetector:
+    def __init__(self, min_rate=0.05, low_buffer=1.0,
+                 paused_give_up=60, buffering_nudge_after=30, buffering_give_up=180,
+                 frozen_nudge_after=10, frozen_give_up=60):
+        """
+        재생 정지 감지기 초기화
+
+        Args:
+            min_rate (float): 이 값 이상으로 currentTime이 늘어나야 재생 중으로 판단 (초/초)
+            low_buffer (float): 앞쪽 버퍼가 이보다 짧으면 버퍼링으로 판단 (초)
+            paused_give_up (float): 일시정지가 이만큼 계속되면 포기 (초)
+            buffering_nudge_after (float): 버퍼링이 이만큼 계속되면 다시 탐색 (초)
+            buffering_give_up (float): 버퍼링이 이만큼 계속되면 포기 (초)
+            frozen_nudge_after (float): 디코더 멈춤이 이만큼 계속되면 다시 탐색 (초)
+            frozen_give_up (float): 디코더 멈춤이 이만큼 계속되면 포기 (초)
+        """
+        self.min_rate = min_rate
+        self.low_buffer = low_buffer
+        self.paused_give_up = paused_give_up
+        self.buffering_nudge_after = buffering_nudge_after
+        self.buffering_give_up = buffering_give_up
+        self.frozen_nudge_after = frozen_nudge_after
+        self.frozen_give_up = frozen_give_up
+        self.reset()
+
+    def reset(self):
+        """강의별 기록 초기화"""
+        self.last_time = None
+        self.last_sample_at = None
+        self.stalled_since = None
+        self.last_verdict = None
+
+    def update(self, state, now=None):
+        """
+        새 재생 상태를 반영하고 판정 결과 반환
+
+        Args:
+            state (MediaState): 현재 재생 상태
+            now (float): 상태를 확인한 시각 (기본: 현재 시각)
+        """
+        now = now if now is not None else time.time()
+        previous_time, previous_at = self.last_time, self.last_sample_at
+        self.last_time, self.last_sample_at = state.current_time, now
+
+        if state.ended:
+            self.stalled_since = None
+            return self._verdict(ENDED, ACTION_NONE)
+
+        if previous_at is None or now <= previous_at:
+            return self._verdict(STARTING, ACTION_NONE)
+
+        rate = (state.current_time - previous_time) / (now - previous_at)
+        if rate >= self.min_rate and not state.paused:
+            self.stalled_since = None
+            return self._verdict(HEALTHY, ACTION_NONE, rate)
+
+        if self.stalled_since is None:
+            self.stalled_since = previous_at
+        stalled_for = now - self.stalled_since
+
+        if state.paused:
+            action = ACTION_SKIP if stalled_for >= self.paused_give_up else ACTION_RESUME
+            return self._verdict(PAUSED, action, rate, stalled_for)
+
+        if self._is_buffering(state):
+            if stalled_for >= self.buffering_give_up:
+                action = ACTION_SKIP
+            elif stalled_for >= self.buffering_nudge_after:
+                action = ACTION_NUDGE
+            else:
+                action = ACTION_WAIT
+            return self._verdict(BUFFERING, action, rate, stalled_for)
+
+        if stalled_for >= self.frozen_give_up:
+            action = ACTION_SKIP
+        elif stalled_for >= self.frozen_nudge_after:
+            action = ACTION_NUDGE
+        else:
+            action = ACTION_WAIT
+        return self._verdict(FROZEN, action, rate, stalled_for)
+
+    def _is_buffering(self, state):
+        """앞쪽 버퍼가 부족하거나 네트워크가 데이터를 받는 중인지"""
+        if state.network_state == NETWORK_NO_SOURCE:
+            return True
+        if state.ready_state < HAVE_FUTURE_DATA:
+            return True
+        return state.buffered_ahead < self.low_buffer and state.network_state == NETWORK_LOADING
+
+    def _verdict(self, condition, action, rate=0.0, stalled_for=0.0):
+        verdict = StallVerdict(condition, action, rate, stalled_for)
+        self.last_verdict = verdict
+        return verdict
@@ -0,0 +1,92 @@
+"""
+ReadinessWaiter 알림창 처리 테스트
+페이지를 열 때 알림창(alert)이 뜨는 상황을 가짜 드라이버로 재현해, 페이지 로딩 대기가
+학습을 끝내지 않고 알림창을 수락한 뒤 다시 대기하는지 확인합니다.
+"""
+
+from selenium.common.exceptions import NoAlertPresentException, UnexpectedAlertPresentException
+
+from readiness import ReadinessWaiter
+from video_player import VideoPlayer
+
+
+class FakeAlert:
+    def __init__(self, page):
+        self.page = page
+        self.text = page.alert_text
+
+    def accept(self):
+        self.page.alert_text = None
+        self.page.accepted.append(self.text)
+
+
+class FakeSwitchTo:
+    def __init__(self, page):
+        self.page = page
+
+    @property
+    def alert(self):
+        if self.page.alert_text is None:
+            raise NoAlertPresentException()
+        return FakeAlert(self.page)
+
+
+class AlertOnLoadDriver:
+    """로딩 직후 알림창을 띄우는 페이지 (알림창이 열려 있으면 스크립트 실행이 실패)"""
+
+    def __init__(self, alert_text, browser_accepts=False, keep_alerting=False):
+        self.alert_text = alert_text
+        self.browser_accepts = browser_accepts  # unhandledPromptBehavior "accept and notify"
+        self.keep_alerting = keep_alerting
+        self.accepted = []
+        self.switch_to = FakeSwitchTo(self)
+
+    def execute_script(self, script, *args):
+        if self.alert_text is not None:
+            text = self.alert_text
+            if self.browser_accepts:
+                self.alert_text = None
+                self.accepted.append(text)
+            raise UnexpectedAlertPresentException(alert_text=text)
+        if self.keep_alerting:
+            self.alert_text = "다시 뜬 알림"
+            raise UnexpectedAlertPresentException(alert_text=self.alert_text)
+        return "complete"
+
+
+def test_on_load_alert_is_accepted_through_handle_alerts_and_wait_retries():
+    """브라우저가 알림창을 열어 둔 경우 VideoPlayer.handle_alerts로 수락하고 로딩 대기를 마저 함"""
+    logs = []
+    driver = AlertOnLoadDriver("강의 1 안내")
+    player = VideoPlayer(driver, log_callback=logs.append)
+    player.cancel_token.sleep = lambda seconds: None
+
+    result = player.readiness.wait_for_document_ready(timeout=5)
+
+    assert result.ok
+    assert driver.accepted == ["강의 1 안내"]
+    assert any("알림창 감지: '강의 1 안내'" in line for line in logs)
+
+
+def test_alert_already_accepted_by_browser_is_logged_and_wait_retries():
+    """브라우저가 알림창을 이미 수락했으면 내용만 기록하고 로딩 대기를 마저 함"""
+    logs = []
+    driver = AlertOnLoadDriver("강의 2 안내", browser_accepts=True)
+    waiter = ReadinessWaiter(driver, log_callback=logs.append, alert_handler=lambda: False)
+
+    result = waiter.wait_for_document_ready(timeout=5)
+
+    assert result.ok
+    assert driver.accepted == ["강의 2 안내"]
+    assert any("페이지 로딩 중 알림창 감지: '강의 2 안내'" in line for line in logs)
+
+
+def test_repeated_alerts_end_in_timeout_instead_of_looping_forever():
+    """알림창이 계속 뜨면 기준 시간 안에 대기 실패로 끝남"""
+    driver = AlertOnLoadDriver("안내", browser_accepts=True, keep_alerting=True)
+    waiter = ReadinessWaiter(driver, log_callback=lambda message: None, alert_handler=lambda: False)
+
+    result = waiter.wait_for_document_ready(timeout=0.3)
+
+    assert not result.ok
+    assert result.waited < 2
@@ -0,0 +1,123 @@
+"""
+StallDetector 판정 테스트
+합성 MediaState 기록(벽시계 시각, currentTime, 버퍼, readyState/networkState)을 차례로 넣어
+정상 재생/일시정지/버퍼링/디코더 멈춤을 구분하고 정해진 시간에 복구 방법이 바뀌는지 확인합니다.
+"""
+
+from stall_detector import (
+    StallDetector,
+    HEALTHY, STARTING, PAUSED, BUFFERING, FROZEN,
+    ACTION_NONE, ACTION_RESUME, ACTION_WAIT, ACTION_NUDGE, ACTION_SKIP,
+)
+from video_player import MediaState
+
+HAVE_CURRENT_DATA = 2
+HAVE_ENOUGH_DATA = 4
+NETWORK_IDLE = 1
+NETWORK_LOADING = 2
+
+LONG_LECTURE = 90 * 60.0
+
+
+def playing(current_time, duration=LONG_LECTURE, ahead=30.0):
+    """정상 재생 중인 상태 (앞쪽 버퍼 충분)"""
+    return MediaState(
+        current_time=current_time, duration=duration, paused=False,
+        ready_state=HAVE_ENOUGH_DATA, network_state=NETWORK_IDLE,
+        buffered=[(0.0, min(current_time + ahead, duration))],
+    )
+
+
+def paused(current_time):
+    """일시정지된 상태"""
+    state = playing(current_time)
+    state.paused = True
+    return state
+
+
+def buffering(current_time):
+    """데이터를 기다리는 상태 (앞쪽 버퍼 없음, 네트워크 받는 중)"""
+    return MediaState(
+        current_time=current_time, duration=LONG_LECTURE, paused=False,
+        ready_state=HAVE_CURRENT_DATA, network_state=NETWORK_LOADING,
+        buffered=[(0.0, current_time)],
+    )
+
+
+def frozen(current_time):
+    """데이터는 충분한데 currentTime이 멈춘 상태 (디코더 멈춤)"""
+    return playing(current_time, ahead=20.0)
+
+
+def run(trace):
+    """(벽시계 시각, MediaState) 기록을 차례로 넣고 시각별 판정 반환"""
+    detector = StallDetector()
+    return {now: detector.update(state, now) for now, state in trace}
+
+
+def stalled_trace(make_state, until, step=5.0, position=600.0):
+    """position에서 한 번 재생한 뒤 until초까지 같은 위치에 멈춘 기록"""
+    trace = [(0.0, playing(position))]
+    now = step
+    while now <= until:
+        trace.append((now, make_state(position)))
+        now += step
+    return trace
+
+
+def test_long_healthy_lecture_never_triggers_recovery():
+    """75분이 넘는 강의를 정상 재생하면 진행률이 천천히 올라도 끝까지 할 일 없음"""
+    trace = [(float(now), playing(float(now))) for now in range(0, 80 * 60 + 1, 5)]
+    verdicts = run(trace)
+
+    assert verdicts[0.0].condition == STARTING
+    later = [verdict for now, verdict in verdicts.items() if now > 0]
+    assert all(verdict.condition == HEALTHY for verdict in later)
+    assert all(verdict.action == ACTION_NONE for verdict in verdicts.values())
+    assert verdicts[80 * 60.0].rate == 1.0
+
+
+def test_paused_resumes_then_gives_up_after_60_seconds():
+    """일시정지는 play() 재시도, 60초가 지나도 계속되면 포기"""
+    verdicts = run(stalled_trace(paused, until=65))
+
+    assert verdicts[5.0].condition == PAUSED
+    assert verdicts[5.0].action == ACTION_RESUME
+    assert verdicts[55.0].action == ACTION_RESUME
+    assert verdicts[60.0].action == ACTION_SKIP
+    assert verdicts[60.0].stalled_for == 60.0
+
+
+def test_buffering_waits_then_nudges_then_gives_up():
+    """버퍼링은 기다리다가 30초에 다시 탐색, 180초에 포기"""
+    verdicts = run(stalled_trace(buffering, until=185))
+
+    assert all(verdict.condition == BUFFERING for now, verdict in verdicts.items() if now > 0)
+    assert verdicts[5.0].action == ACTION_WAIT
+    assert verdicts[25.0].action == ACTION_WAIT
+    assert verdicts[30.0].action == ACTION_NUDGE
+    assert verdicts[175.0].action == ACTION_NUDGE
+    assert verdicts[180.0].action == ACTION_SKIP
+
+
+def test_frozen_decoder_with_buffered_data_nudges_then_gives_up():
+    """데이터가 있는데 멈추면 디코더 멈춤: 10초에 다시 탐색, 60초에 포기"""
+    verdicts = run(stalled_trace(frozen, until=65, step=1.0))
+
+    assert all(verdict.condition == FROZEN for now, verdict in verdicts.items() if now > 0)
+    assert verdicts[5.0].action == ACTION_WAIT
+    assert verdicts[9.0].action == ACTION_WAIT
+    assert verdicts[10.0].action == ACTION_NUDGE
+    assert verdicts[59.0].action == ACTION_NUDGE
+    assert verdicts[60.0].action == ACTION_SKIP
+
+
+def test_recovery_clears_stall_timer():
+    """멈췄다가 다시 재생되면 멈춘 시간이 초기화되어 다음 멈춤은 처음부터 계산"""
+    detector = StallDetector()
+    detector.update(playing(100.0), 0.0)
+    assert detector.update(frozen(100.0), 50.0).action == ACTION_NUDGE
+    assert detector.update(playing(105.0), 55.0).condition == HEALTHY
+    verdict = detector.update(frozen(105.0), 60.0)
+    assert verdict.action == ACTION_WAIT
+    assert verdict.stalled_for == 5.0
@@ -0,0 +1,68 @@
+"""
+영상 요소 핸들 모듈
+페이지가 video 노드를 교체해도(Video.js 재초기화, 소스 변경, 부분 새로고침)
+요소를 다시 찾아 이어서 사용하고, 연속 실패가 한도를 넘으면 포기합니다.
+"""
+
+# 연속 실패 허용 횟수 (넘으면 이 강의는 포기)
+MAX_CONSECUTIVE_FAILURES = 5
+
+
+class VideoHandle:
+    def __init__(self, element, resolver, log_callback=None, max_failures=MAX_CONSECUTIVE_FAILURES):
+        """
+        영상 요소 핸들 초기화
+
+        Args:
+            element: 현재 video WebElement
+            resolver (function): 요소를 다시 찾는 함수 (못 찾으면 None 반환)
+            log_callback (function): 로그 출력 콜백 함수
+            max_failures (int): 연속 실패 허용 횟수
+        """
+        self.element = element
+        self.resolver = resolver
+        self.log_callback = log_callback
+        self.max_failures = max_failures
+        self.failures = 0
+        self.swaps = 0
+        self.last_state = None
+
+    def log(self, message):
+        """로그 출력"""
+        if self.log_callback:
+            self.log_callback(message)
+        else:
+            print(message)
+
+    @property
+    def exhausted(self):
+        """연속 실패가 한도를 넘었는지"""
+        return self.failures >= self.max_failures
+
+    def record_success(self, state):
+        """상태 확인 성공 (연속 실패 초기화, 마지막 재생 상태 보관)"""
+        self.failures = 0
+        if state is not None:
+            self.last_state = state
+
+    def record_failure(self, reason):
+        """실패 기록 후 아직 한도 안인지 반환"""
+        self.failures += 1
+        self.log(f"⚠️ 영상 요소 오류 ({self.failures}/{self.max_failures}): {reason}")
+        return not self.exhausted
+
+    def refresh(self):
+        """요소가 교체된 경우 다시 찾기 (성공하면 True)"""
+        if not self.record_failure("요소가 교체됨(stale)"):
+            return False
+        try:
+            element = self.resolver()
+        except Exception as e:
+            self.log(f"⚠️ 영상 요소 재탐색 실패: {str(e)}")
+            element = None
+        if element is None:
+            return False
+        self.element = element
+        self.swaps += 1
+        self.log(f"🔄 교체된 영상 요소를 다시 찾았습니다. (교체 {self.swaps}회)")
+        return True
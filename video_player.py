@@ -4,23 +4,148 @@
 """
 
 import time
+from dataclasses import dataclass, field
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, StaleElementReferenceException
+from media_events import MediaEventRecorder, MEDIA_SNAPSHOT_FN
+from player_discovery import PlayerDiscovery
+from readiness import ReadinessWaiter
+from lecture_transition import LectureTransition
+from poll_scheduler import AdaptivePollScheduler
+from video_handle import VideoHandle
+from engine_events import ProgressEvent, StatusEvent
+from cancellation import CancellationToken
+from phase_trace import PhaseTracer, CAT_PLAY, CAT_WAIT
+from stall_detector import (
+    StallDetector, PAUSED, BUFFERING, FROZEN,
+    ACTION_RESUME, ACTION_NUDGE, ACTION_SKIP,
+)
+
+# 예전 get_video_progress가 한 번 확인할 때 보내던 execute_script 횟수
+# (currentTime, duration, paused, ended)
+LEGACY_PROGRESS_CALLS = 4
+
+# video 요소의 재생 상태를 한 번의 왕복으로 읽어오는 스크립트
+MEDIA_STATE_SCRIPT = "return (" + MEDIA_SNAPSHOT_FN + ")(arguments[0]);"
+
+# 페이지 로딩 후 플레이어가 나타나기를 기다리는 최대 시간 (초)
+PLAYER_APPEAR_TIMEOUT = 15
+
+# 상태 확인 실패 후 다시 시도하기 전 대기 시간 (초)
+FAILURE_RETRY_DELAY = 2
+
+# 요소가 교체되었을 때 새 video 요소를 기다리는 최대 시간 (초)
+VIDEO_RESOLVE_TIMEOUT = 5
+
+# 다시 탐색(seek)해서 디코더/네트워크를 깨우는 스크립트
+NUDGE_SCRIPT = """
+var v = arguments[0];
+v.currentTime = v.currentTime + 0.1;
+var p = v.play();
+if (p && p.catch) { p.catch(function () {}); }
+"""
+
+
+@dataclass
+class MediaState:
+    """video 요소의 재생 상태 스냅샷 (한 번의 execute_script 결과)"""
+    current_time: float = 0.0
+    duration: float = 0.0
+    paused: bool = True
+    ended: bool = False
+    ready_state: int = 0
+    network_state: int = 0
+    playback_rate: float = 1.0
+    buffered: list = field(default_factory=list)
+    taken_at: float = field(default_factory=time.time)
+
+    @classmethod
+    def from_script_result(cls, raw):
+        """MEDIA_STATE_SCRIPT 반환값으로 스냅샷 생성 (NaN/Infinity는 null로 넘어옴)"""
+        raw = raw or {}
+        return cls(
+            current_time=raw.get('currentTime') or 0.0,
+            duration=raw.get('duration') or 0.0,
+            paused=bool(raw.get('paused', True)),
+            ended=bool(raw.get('ended', False)),
+            ready_state=raw.get('readyState') or 0,
+            network_state=raw.get('networkState') or 0,
+            playback_rate=raw.get('playbackRate') or 1.0,
+            buffered=[tuple(r) for r in (raw.get('buffered') or []) if r and len(r) == 2],
+        )
+
+    @property
+    def progress(self):
+        """재생 진행률 (%)"""
+        return (self.current_time / self.duration * 100) if self.duration else 0
+
+    @property
+    def remaining(self):
+        """남은 재생 시간 (초), 길이를 모르면 None"""
+        if not self.duration:
+            return None
+        return max(self.duration - self.current_time, 0.0)
+
+    @property
+    def buffered_ahead(self):
+        """현재 위치 이후로 버퍼링된 시간 (초)"""
+        for start, end in self.buffered:
+            if start <= self.current_time <= end:
+                return end - self.current_time
+        return 0.0
+
+    def to_dict(self):
+        """기존 get_video_progress 형식의 딕셔너리로 변환"""
+        return {
+            'current_time': self.current_time,
+            'duration': self.duration,
+            'paused': self.paused,
+            'ended': self.ended,
+            'progress': self.progress,
+        }
+
 
 class VideoPlayer:
-    def __init__(self, driver, log_callback=None):
+    def __init__(self, driver, log_callback=None, poll_policy=None, event_callback=None, cancel_token=None,
+                 tracer=None):
         """
         동영상 플레이어 초기화
         
         Args:
             driver: Selenium WebDriver 인스턴스
             log_callback (function): 로그 출력 콜백 함수
+            poll_policy (PollPolicy): 재생 모니터링 주기 정책 (기본값 사용 시 None)
+            event_callback (function): 진행률/상태 이벤트 전달 콜백 함수
+            cancel_token (CancellationToken): 중지 신호 (모든 대기에서 검사)
+            tracer (PhaseTracer): 재생 방법/대기/sleep 구간 기록기 (기록하지 않으면 None)
         """
         self.driver = driver
         self.log_callback = log_callback
+        self.event_callback = event_callback
+        self.cancel_token = cancel_token or CancellationToken()
+        self.tracer = tracer or PhaseTracer()
+        self.event_recorder = MediaEventRecorder(driver, log_callback=log_callback)
+        self.discovery = PlayerDiscovery(driver, log_callback=log_callback)
+        self.readiness = ReadinessWaiter(
+            driver, log_callback=log_callback, cancel_token=self.cancel_token, tracer=self.tracer,
+            alert_handler=self.handle_alerts,
+        )
+        self.transition = LectureTransition(driver, log_callback=log_callback, cancel_token=self.cancel_token)
+        self.scheduler = AdaptivePollScheduler(poll_policy)
+        self.stall_detector = StallDetector()
+        self.reset_round_trip_stats()
         
+    def reset_round_trip_stats(self):
+        """강의별 상태 조회/대기 통계 초기화"""
+        self.snapshot_calls = 0
+        self.round_trips_saved = 0
+        self.event_drains = 0
+        self.readiness.total_waited = 0.0
+        self.scheduler.reset()
+        self.stall_detector.reset()
+    
     def log(self, message):
         """로그 출력"""
         if self.log_callback:
@@ -28,52 +153,31 @@ class VideoPlayer:
         else:
             print(message)
     
+    def emit(self, event):
+        """GUI 등으로 이벤트 전달 (콜백이 없으면 무시)"""
+        if self.event_callback:
+            try:
+                self.event_callback(event)
+            except Exception:
+                pass
+    
     def wait_for_video_ready(self, timeout=60):
         """영상 플레이어를 찾고 재생 준비"""
         self.log("🎬 영상 플레이어 찾는 중...")
         try:
-            # 페이지 로딩 대기
-            self.log("⏳ 페이지 완전 로딩 대기 중... (5초)")
-            time.sleep(5)
+            # 페이지 로딩 대기 (완료되는 즉시 진행)
+            self.log("⏳ 페이지 완전 로딩 대기 중...")
+            self.readiness.wait_for_document_ready(timeout)
             
             # 현재 페이지 정보 출력
-            self.log(f"🔍 현재 URL: {self.driver.current_url}")
+            current_url = self.driver.current_url
+            self.log(f"🔍 현재 URL: {current_url}")
             self.log(f"🔍 페이지 제목: {self.driver.title}")
             
-            # Video.js에서 실제 video 태그 찾기 (우선순위 순)
-            video_selectors = [
-                "#myvideo video",     # Video.js 컨테이너 내부의 실제 video
-                "#myvideo .vjs-tech", # Video.js 기술 레이어
-                ".vjs-tech",          # Video.js 기술 레이어 (일반)
-                "video",              # HTML5 video 태그 (일반)
-                "#myvideo",           # Video.js 컨테이너 (마지막 시도)
-                "iframe",             # iframe 내부 영상
-                ".video-player",      # 일반적인 비디오 플레이어 클래스
-                "[class*='video']",   # video가 포함된 클래스
-                "[id*='video']",      # video가 포함된 ID
-            ]
-            
-            actual_video = None
-            container = None
-            
-            for selector in video_selectors:
-                try:
-                    elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    for elem in elements:
-                        if elem.is_displayed():
-                            # video 태그인지 확인
-                            tag_name = elem.tag_name.lower()
-                            if tag_name == "video":
-                                actual_video = elem
-                                self.log(f"✅ 실제 video 태그 발견: {selector}")
-                                break
-                            else:
-                                container = elem
-                                self.log(f"📦 영상 컨테이너 발견: {selector} (태그: {tag_name})")
-                    if actual_video:
-                        break
-                except:
-                    continue
+            # 페이지 안에서 한 번에 후보를 찾아 순위 매기기 (사이트별 캐시 우선)
+            element, selector, tag_name = self._discover_player(current_url)
+            actual_video = element if tag_name == "video" else None
+            container = element if tag_name != "video" else None
             
             # 실제 video 태그를 우선 사용, 없으면 컨테이너 사용
             video_element = actual_video or container
@@ -88,27 +192,30 @@ class VideoPlayer:
             # 방법 1: 실제 video 태그에 play() 호출
             if actual_video:
                 try:
-                    self.driver.execute_script("arguments[0].play()", actual_video)
-                    self.log("✅ video.play() 성공!")
-                    time.sleep(2)
+                    with self.tracer.span("video.play()", CAT_PLAY):
+                        self.readiness.wait_for_media_metadata(actual_video)
+                        self.driver.execute_script("arguments[0].play()", actual_video)
+                        self.log("✅ video.play() 성공!")
+                        self.readiness.wait_for_playback_advancing(actual_video)
                     return actual_video, None
                 except Exception as e:
                     self.log(f"⚠️ video.play() 실패: {str(e)}")
             
             # 방법 2: Video.js API 사용
             try:
-                result = self.driver.execute_script("""
-                    var player = videojs('myvideo');
-                    if (player && typeof player.play === 'function') {
-                        player.play();
-                        return 'videojs.play() 성공';
-                    }
-                    return 'Video.js 플레이어를 찾을 수 없음';
-                """)
-                self.log(f"🎮 Video.js API 시도: {result}")
-                if "성공" in result:
-                    time.sleep(2)
-                    return video_element, None
+                with self.tracer.span("videojs.play()", CAT_PLAY):
+                    result = self.driver.execute_script("""
+                        var player = videojs('myvideo');
+                        if (player && typeof player.play === 'function') {
+                            player.play();
+                            return 'videojs.play() 성공';
+                        }
+                        return 'Video.js 플레이어를 찾을 수 없음';
+                    """)
+                    self.log(f"🎮 Video.js API 시도: {result}")
+                    if "성공" in result:
+                        self.readiness.wait_for_playback_advancing(video_element)
+                        return video_element, None
             except Exception as e:
                 self.log(f"⚠️ Video.js API 실패: {str(e)}")
             
@@ -121,24 +228,26 @@ class VideoPlayer:
                     "#myvideo .vjs-big-play-button"  # myvideo 내부 재생 버튼
                 ]
                 
-                for btn_selector in play_buttons:
-                    try:
-                        play_btn = self.driver.find_element(By.CSS_SELECTOR, btn_selector)
-                        if play_btn.is_displayed():
-                            play_btn.click()
-                            self.log(f"✅ 재생 버튼 클릭 성공: {btn_selector}")
-                            time.sleep(2)
-                            return video_element, None
-                    except:
-                        continue
+                with self.tracer.span("재생 버튼 클릭", CAT_PLAY):
+                    for btn_selector in play_buttons:
+                        try:
+                            play_btn = self.driver.find_element(By.CSS_SELECTOR, btn_selector)
+                            if play_btn.is_displayed():
+                                play_btn.click()
+                                self.log(f"✅ 재생 버튼 클릭 성공: {btn_selector}")
+                                self.readiness.wait_for_playback_advancing(video_element)
+                                return video_element, None
+                        except Exception:
+                            continue
             except Exception as e:
                 self.log(f"⚠️ 재생 버튼 클릭 실패: {str(e)}")
             
             # 방법 4: 영상 영역 직접 클릭
             try:
-                video_element.click()
-                self.log("✅ 영상 영역 클릭으로 재생 시도")
-                time.sleep(2)
+                with self.tracer.span("영상 영역 클릭", CAT_PLAY):
+                    video_element.click()
+                    self.log("✅ 영상 영역 클릭으로 재생 시도")
+                    self.readiness.wait_for_playback_advancing(video_element)
                 return video_element, None
             except Exception as e:
                 self.log(f"⚠️ 영상 영역 클릭 실패: {str(e)}")
@@ -150,57 +259,157 @@ class VideoPlayer:
             self.log(f"❌ 영상 준비 실패: {str(e)}")
             return None, None
     
-    def get_video_progress(self, video_element):
-        """현재 영상 재생 상태 확인"""
+    def _discover_player(self, current_url, timeout=PLAYER_APPEAR_TIMEOUT):
+        """플레이어가 스크립트로 늦게 생성되는 경우를 위해 나타날 때까지 탐색 재시도"""
+        found = {}
+        def player_found(driver):
+            found['result'] = self.discovery.find_player(current_url)
+            return found['result'][0] is not None
+        self.readiness.wait_until(player_found, timeout, "플레이어 탐색")
+        return found.get('result', (None, None, None))
+    
+    def _resolve_video_element(self):
+        """교체된 video 요소 다시 찾기 (video 태그가 아니면 None)"""
+        element, _, tag_name = self._discover_player(self.driver.current_url, timeout=VIDEO_RESOLVE_TIMEOUT)
+        return element if tag_name == "video" else None
+    
+    def _restore_position(self, handle):
+        """교체 전 재생 위치로 복원 (같은 영상이 처음부터 다시 시작된 경우)"""
+        previous = handle.last_state
+        if not previous or not previous.current_time:
+            return
         try:
-            current_time = self.driver.execute_script("return arguments[0].currentTime", video_element)
-            duration = self.driver.execute_script("return arguments[0].duration", video_element)
-            paused = self.driver.execute_script("return arguments[0].paused", video_element)
-            ended = self.driver.execute_script("return arguments[0].ended", video_element)
-            
-            return {
-                'current_time': current_time,
-                'duration': duration,
-                'paused': paused,
-                'ended': ended,
-                'progress': (current_time / duration * 100) if duration else 0
-            }
+            state = self.get_media_state(handle.element)
+            if not state or not state.duration or abs(state.duration - previous.duration) > 1:
+                return
+            if state.current_time < previous.current_time - 2:
+                self.driver.execute_script("arguments[0].currentTime = arguments[1];", handle.element, previous.current_time)
+                self.log(f"⏩ 교체 전 재생 위치로 복원: {previous.current_time:.1f}초")
+        except Exception as e:
+            self.log(f"⚠️ 재생 위치 복원 실패: {str(e)}")
+    
+    def seek_to(self, video_element, position):
+        """저장된 재생 위치로 이동 (영상 길이를 넘거나 거의 끝이면 처음부터 그대로 재생)"""
+        try:
+            state = self.get_media_state(video_element)
+            if not state or not state.duration or position >= state.duration - 5:
+                return False
+            if state.current_time >= position - 2:
+                return False
+            self.driver.execute_script("arguments[0].currentTime = arguments[1];", video_element, position)
+            self.log(f"⏩ 중단된 재생 위치로 이동: {position:.1f}초")
+            return True
+        except Exception as e:
+            self.log(f"⚠️ 재생 위치 이동 실패: {str(e)}")
+            return False
+    
+    def get_media_state(self, video_element):
+        """현재 영상 재생 상태를 한 번의 왕복으로 확인 (MediaState 반환)"""
+        try:
+            raw = self.driver.execute_script(MEDIA_STATE_SCRIPT, video_element)
+            self._count_snapshot()
+            return MediaState.from_script_result(raw)
+        except StaleElementReferenceException:
+            # 요소 교체는 호출한 쪽(VideoHandle)에서 처리
+            raise
         except Exception as e:
             self.log(f"⚠️ 영상 상태 확인 실패: {str(e)}")
             return None
     
-    def start_video_if_paused(self, video_element):
-        """영상이 멈춰있으면 재생 시작"""
+    def _count_snapshot(self):
+        """상태 조회 한 번당 절약한 왕복 수 기록"""
+        self.snapshot_calls += 1
+        self.round_trips_saved += LEGACY_PROGRESS_CALLS - 1
+    
+    def wait_for_media_event(self, video_element, timeout):
+        """
+        중요한 이벤트(ended/pause/waiting/stalled)가 생기거나 timeout이 지날 때까지 대기
+        
+        Returns:
+            tuple: (MediaState, 이벤트 목록), 기록기가 없으면 (None, None)
+        """
+        with self.tracer.span("영상 이벤트 대기", CAT_WAIT, timeout=round(timeout, 2)):
+            result = self.event_recorder.drain(video_element, timeout)
+        if result is None:
+            return None, None
+        self.event_drains += 1
+        self._count_snapshot()
+        return MediaState.from_script_result(result['state']), result['events']
+    
+    def get_video_progress(self, video_element):
+        """현재 영상 재생 상태 확인 (기존 딕셔너리 형식)"""
+        state = self.get_media_state(video_element)
+        return state.to_dict() if state else None
+    
+    def start_video_if_paused(self, video_element, state=None):
+        """영상이 멈춰있으면 재생 시작 (state를 넘기면 상태를 다시 조회하지 않음)"""
         try:
-            status = self.get_video_progress(video_element)
-            if status and status['paused'] and not status['ended']:
+            if state is None:
+                state = self.get_media_state(video_element)
+            else:
+                self.round_trips_saved += LEGACY_PROGRESS_CALLS
+            if state and state.paused and not state.ended:
                 self.log("▶️ 영상 재생 시작...")
                 self.driver.execute_script("arguments[0].play()", video_element)
-                time.sleep(2)
+                self.readiness.wait_for_playback_advancing(video_element, timeout=2)
         except Exception as e:
             self.log(f"⚠️ 영상 재생 시작 실패: {str(e)}")
     
-    def wait_for_video_end(self, video_element, log_queue=None):
-        """영상이 끝날 때까지 대기 (실시간 길이 체크)"""
+    def wait_for_video_end(self, video_element):
+        """영상이 끝날 때까지 대기 (페이지 이벤트 기반, 확인 주기는 남은 시간에 따라 조절)"""
         self.log("⏰ 영상 재생 모니터링 시작... (길이는 실시간으로 확인)")
         
+        # video 노드가 교체되어도 다시 찾아 이어서 모니터링
+        handle = video_element if isinstance(video_element, VideoHandle) else VideoHandle(
+            video_element, self._resolve_video_element, log_callback=self.log_callback
+        )
+        
         start_time = time.time()
         last_progress = 0
-        stuck_count = 0
         duration = None
+        buffer_start_time = None
+        self.stall_detector.reset()
+        next_wait = self.scheduler.policy.unknown_interval
+        
+        event_driven = self.event_recorder.install(handle.element)
+        if event_driven:
+            self.log("📡 영상 이벤트 기록기 설치 완료 (ended/pause/waiting/stalled 즉시 감지)")
+        else:
+            self.log("⚠️ 이벤트 기록기를 쓸 수 없어 주기적 폴링으로 확인합니다.")
         
         while True:
+            self.cancel_token.raise_if_cancelled()
             try:
-                status = self.get_video_progress(video_element)
+                events = []
+                wait = next_wait
+                if buffer_start_time:
+                    wait = max(0.0, min(wait, 10 - (time.time() - buffer_start_time)))
+                if event_driven:
+                    state, events = self.wait_for_media_event(handle.element, wait)
+                    if state is None:
+                        # 페이지가 기록기를 지움 -> 다시 설치
+                        self.log("⚠️ 이벤트 기록기가 사라짐. 다시 설치합니다...")
+                        event_driven = self.event_recorder.install(handle.element)
+                        state = self.get_media_state(handle.element)
+                else:
+                    state = self.get_media_state(handle.element)
                 
-                if not status:
-                    self.log("⚠️ 영상 상태 확인 불가")
-                    time.sleep(5)
+                if not state:
+                    if not handle.record_failure("영상 상태 확인 불가"):
+                        self.log("❌ 영상 상태를 계속 확인할 수 없습니다. 다음 영상으로 이동...")
+                        return False
+                    self.tracer.sleep(self.cancel_token, FAILURE_RETRY_DELAY, "상태 확인 재시도 대기")
                     continue
+                handle.record_success(state)
                 
-                current_progress = status['progress']
-                current_time = status['current_time']
-                current_duration = status['duration']
+                event_types = {event.get('type') for event in events}
+                if event_types & {'waiting', 'stalled'}:
+                    self.log("⏳ 영상 버퍼링 감지 (waiting/stalled 이벤트)")
+                    self.scheduler.record_stall()
+                
+                current_progress = state.progress
+                current_time = state.current_time
+                current_duration = state.duration
                 
                 # 영상 길이가 처음 로드되면 표시
                 if current_duration and not duration:
@@ -208,52 +417,41 @@ class VideoPlayer:
                     self.log(f"📏 영상 길이 확인: {duration:.1f}초")
                 
                 # 영상 종료 확인 (100% + 10초 버퍼)
-                if status['ended']:
+                if state.ended or 'ended' in event_types:
                     self.log("✅ 영상 재생 완료! (ended 이벤트)")
                     return True
                 elif current_progress >= 100 and current_progress > 0:
                     # 100% 도달 후 10초 버퍼 대기
-                    if not hasattr(self, '_buffer_start_time'):
-                        self._buffer_start_time = time.time()
+                    if not buffer_start_time:
+                        buffer_start_time = time.time()
                         self.log(f"🎯 영상 100% 도달! 10초 버퍼 대기 중...")
                     
-                    buffer_elapsed = time.time() - self._buffer_start_time
+                    buffer_elapsed = time.time() - buffer_start_time
                     if buffer_elapsed >= 10:
                         self.log("✅ 영상 재생 완료! (100% + 10초 버퍼)")
-                        self._buffer_start_time = None  # 리셋
                         return True
                 else:
                     # 100% 미만이면 버퍼 타이머 리셋
-                    if hasattr(self, '_buffer_start_time'):
-                        self._buffer_start_time = None
+                    buffer_start_time = None
+                
+                # 벽시계 기준 재생 속도로 정지 여부 판단 후 상황별 복구 (100% 도달 후 버퍼 대기 중 제외)
+                verdict = self.stall_detector.update(state)
+                if not verdict.healthy and not buffer_start_time:
+                    self.scheduler.record_stall()
+                    if not self._recover_playback(handle.element, state, verdict):
+                        return False
                 
-                # 영상이 멈춰있는지 확인
-                if status['paused'] and current_time > 1:  # 1초 이후에만 체크
-                    self.log("⏸️ 영상이 일시정지됨. 재생 재시작...")
-                    self.start_video_if_paused(video_element)
+                # GUI 진행률 바 업데이트 (한 주기에 여러 번 와도 마지막 값만 표시됨)
+                if current_progress > 0:
+                    self.emit(ProgressEvent(current_progress, current_time, current_duration))
                 
-                # 진행률 업데이트 (길이가 있을 때만)
+                # 진행률 로그 (1% 이상 변했을 때만)
                 if current_progress - last_progress > 1 and current_progress > 0:
                     if duration:
                         self.log(f"📈 재생 진행률: {current_progress:.1f}% ({current_time:.1f}/{duration:.1f}초)")
                     else:
                         self.log(f"📈 재생 중: {current_time:.1f}초 (총 길이 로딩 중...)")
                     last_progress = current_progress
-                    stuck_count = 0
-                    
-                    # GUI 진행률 바 업데이트를 위한 신호 전송
-                    if log_queue:
-                        try:
-                            log_queue.put(f"PROGRESS_UPDATE:{current_progress:.1f}")
-                        except:
-                            pass
-                else:
-                    stuck_count += 1
-                
-                # 영상이 너무 오랫동안 멈춰있으면 강제 진행
-                if stuck_count > 15:  # 15번 (45초) 체크 후 포기
-                    self.log("⚠️ 영상이 멈춰있거나 로드되지 않습니다. 다음 영상으로 이동...")
-                    return False
                 
                 # 최대 대기 시간 초과 확인 (30분)
                 elapsed = time.time() - start_time
@@ -262,61 +460,66 @@ class VideoPlayer:
                     self.log(f"⏰ 최대 대기 시간({max_wait/60:.1f}분) 초과. 다음 영상으로 이동...")
                     return False
                 
-                time.sleep(3)  # 3초마다 확인
+                # 남은 시간/버퍼링 기록/재생 속도로 다음 확인 시점 결정
+                next_wait = self.scheduler.next_interval(state)
+                if not event_driven:
+                    self.tracer.sleep(self.cancel_token, next_wait, "모니터링 폴링 대기")
                 
+            except StaleElementReferenceException:
+                self.cancel_token.raise_if_cancelled()
+                # video 노드가 교체됨 -> 다시 찾고 재생 위치와 이벤트 기록기 복원
+                if handle.refresh():
+                    self._restore_position(handle)
+                    event_driven = self.event_recorder.install(handle.element)
+                    continue
+                if handle.exhausted:
+                    self.log("❌ 영상 요소를 다시 찾을 수 없습니다. 다음 영상으로 이동...")
+                    return False
+                self.tracer.sleep(self.cancel_token, FAILURE_RETRY_DELAY, "영상 요소 재탐색 대기")
             except Exception as e:
-                self.log(f"⚠️ 대기 중 오류: {str(e)}")
-                time.sleep(5)
+                # 중지 요청으로 브라우저가 닫혀 생긴 오류면 바로 중단
+                self.cancel_token.raise_if_cancelled()
+                if not handle.record_failure(str(e)):
+                    self.log("❌ 오류가 계속되어 모니터링을 중단합니다. 다음 영상으로 이동...")
+                    return False
+                self.tracer.sleep(self.cancel_token, FAILURE_RETRY_DELAY, "오류 후 재시도 대기")
                 continue
     
+    def _recover_playback(self, video_element, state, verdict):
+        """정지 판정에 맞는 복구 실행 (포기해야 하면 False)"""
+        if verdict.action == ACTION_SKIP:
+            reasons = {
+                PAUSED: "일시정지 상태가 계속됩니다",
+                BUFFERING: "버퍼링이 끝나지 않습니다",
+                FROZEN: "영상이 멈춰있습니다",
+            }
+            reason = reasons.get(verdict.condition, "영상이 진행되지 않습니다")
+            self.log(f"⚠️ {reason} ({verdict.stalled_for:.0f}초). 다음 영상으로 이동...")
+            return False
+        
+        labels = {PAUSED: "일시정지", BUFFERING: "버퍼링", FROZEN: "재생 멈춤"}
+        self.emit(StatusEvent(f"{labels.get(verdict.condition, '확인')} 중... ({verdict.stalled_for:.0f}초)"))
+        
+        if verdict.action == ACTION_RESUME:
+            self.log("⏸️ 영상이 일시정지됨. 재생 재시작...")
+            self.start_video_if_paused(video_element, state)
+        elif verdict.action == ACTION_NUDGE:
+            label = "버퍼링" if verdict.condition == BUFFERING else "디코더 멈춤"
+            self.log(f"🔧 {label} {verdict.stalled_for:.0f}초째. 현재 위치로 다시 탐색합니다...")
+            try:
+                self.driver.execute_script(NUDGE_SCRIPT, video_element)
+            except Exception as e:
+                self.log(f"⚠️ 재탐색 실패: {str(e)}")
+        elif verdict.condition == FROZEN:
+            self.log(f"⏳ 영상 진행이 멈춤 ({verdict.stalled_for:.0f}초째), 지켜보는 중...")
+        return True
+    
     def click_next_video(self):
-        """다음 영상 버튼 클릭"""
+        """다음 영상 버튼 클릭 후 새 강의가 로드되었는지 확인"""
         self.log("⏭️ 다음 영상으로 이동 중...")
         
         try:
-            # 다음 영상 버튼 찾기
-            selectors = [
-                ".btn-next-page",  # 클래스 기반
-                "//a[contains(text(), '다음영상')]",  # 텍스트 기반
-                "//a[contains(@class, 'btn-next-page')]"  # XPath 기반
-            ]
-            
-            next_button = None
-            for selector in selectors:
-                try:
-                    if selector.startswith('//'):
-                        next_button = self.driver.find_element(By.XPATH, selector)
-                    else:
-                        next_button = self.driver.find_element(By.CSS_SELECTOR, selector)
-                    
-                    if next_button and next_button.is_displayed():
-                        break
-                        
-                except NoSuchElementException:
-                    continue
-            
-            if not next_button:
-                self.log("❌ 다음 영상 버튼을 찾을 수 없습니다.")
-                return False
-            
-            # 버튼 정보 확인
-            button_text = next_button.text.strip()
-            onclick = next_button.get_attribute('onclick')
-            
-            self.log(f"🎯 다음 버튼 발견: '{button_text}' (onclick: {onclick})")
-            
-            # 스크롤해서 버튼이 보이도록 함
-            self.driver.execute_script("arguments[0].scrollIntoView(true);", next_button)
-            time.sleep(1)
-            
-            # 버튼 클릭
-            next_button.click()
-            self.log("✅ 다음 영상 버튼 클릭 성공!")
-            
-            # 페이지 로딩 대기
-            time.sleep(5)
-            return True
-            
+            return bool(self.transition.go_next())
         except Exception as e:
             self.log(f"❌ 다음 영상 이동 실패: {str(e)}")
             return False
@@ -328,7 +531,7 @@ class VideoPlayer:
             alert_text = alert.text
             self.log(f"🚨 알림창 감지: '{alert_text}'")
             alert.accept()
-            time.sleep(2)
-            return True
-        except:
+        except Exception:
             return False
+        self.tracer.sleep(self.cancel_token, 2, "알림창 처리 후 대기")
+        return True